@@ -0,0 +1,23 @@
+"""
+Rows per second of each Precipitation parser over a synthetic report grid
+
+    python -m benchmarks.parse_grid [rows]
+"""
+import sys
+from time import perf_counter
+
+from sites.cocorahs.data import Precipitation
+from sites.cocorahs.enum import GridParser
+from tests.grids import synthetic_grid
+
+def main(rows: int = 5000):
+    html = synthetic_grid(rows)
+    for parser in GridParser:
+        started = perf_counter()
+        count = sum(1 for _ in Precipitation(html, parser))
+        elapsed = perf_counter() - started
+        print(f'{parser.name:>14}: {count} rows in {elapsed:.3f}s, {count / elapsed:,.0f} rows/sec')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,36 @@
+"""
+Wall time of parsing inline versus through the ParsePipeline, with a simulated fetch latency per page
+
+    python -m benchmarks.pipeline [pages] [rows] [latency]
+"""
+import sys
+import time
+from time import perf_counter
+
+from sites.cocorahs import ParsePipeline
+from sites.cocorahs.data import Precipitation
+from sites.cocorahs.enum import GridParser
+from tests.grids import synthetic_grid
+
+
+def fetched(pages: int, html: str, latency: float):
+    for _ in range(pages):
+        time.sleep(latency)
+        yield html
+
+
+def main(pages: int = 40, rows: int = 500, latency: float = 0.1):
+    html = synthetic_grid(rows)
+
+    started = perf_counter()
+    count = sum(1 for page in fetched(pages, html, latency) for _ in Precipitation(page, GridParser.Lxml))
+    print(f'{"inline":>10}: {count} rows in {perf_counter() - started:.3f}s')
+
+    with ParsePipeline() as pipeline:
+        started = perf_counter()
+        count = sum(1 for _ in pipeline.records(fetched(pages, html, latency)))
+        print(f'{"pipeline":>10}: {count} rows in {perf_counter() - started:.3f}s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:3]), *map(float, sys.argv[3:4]))
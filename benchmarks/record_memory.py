@@ -0,0 +1,45 @@
+"""
+Memory held by a synthetic set of observations in each record representation
+
+    python -m benchmarks.record_memory [rows]
+"""
+import sys
+import tracemalloc
+from datetime import datetime
+from datetime import timedelta
+
+from sites.cocorahs.data import CompactPrecipitationRecord
+from sites.cocorahs.data import FrozenPrecipitationRecord
+from sites.cocorahs.data import PrecipitationRecord
+
+STATIONS = 2000
+
+
+def synthetic_records(rows: int, record: type) -> list:
+    start = datetime(2020, 1, 1, 7)
+    build = record.from_record if record is not PrecipitationRecord else lambda r: r
+    records = list()
+    for i in range(rows):
+        station = i % STATIONS
+        # Fresh strings per row, as the parser produces them
+        records.append(build(PrecipitationRecord(
+            f'County {station % 60}', (i % 50) / 100, i % 13 == 0, start + timedelta(days=i // STATIONS),
+            40 + station / 1000, -105 - station / 1000, None, None, None, None, None, None,
+            f'S{station % 50}', f'Station {station}', f'XX-YY-{station}')))
+
+    return records
+
+
+def main(rows: int = 1_000_000):
+    for record in (PrecipitationRecord, CompactPrecipitationRecord, FrozenPrecipitationRecord):
+        tracemalloc.start()
+        records = synthetic_records(rows, record)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{record.__name__:>28}: {len(records):,} rows hold {current / 2 ** 20:,.1f} MiB '
+              f'({current / len(records):,.0f} bytes/row), peak {peak / 2 ** 20:,.1f} MiB')
+        del records
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
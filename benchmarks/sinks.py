@@ -0,0 +1,34 @@
+"""
+Rows per second written by each sink, from synthetic observations
+
+    python -m benchmarks.sinks [rows] [directory]
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from sites.cocorahs import CsvSink
+from sites.cocorahs import ParquetSink
+from sites.cocorahs import SqliteSink
+from sites.cocorahs.data import PrecipitationBatch
+from sites.cocorahs.data import PrecipitationRecord
+
+from .record_memory import synthetic_records
+
+
+def main(rows: int = 1_000_000, directory: str = None):
+    batch = PrecipitationBatch.from_records(synthetic_records(rows, PrecipitationRecord))
+    with tempfile.TemporaryDirectory(dir=directory) as temporary:
+        for sink in (CsvSink(Path(temporary, 'records.csv')), SqliteSink(Path(temporary, 'records.db')),
+                     ParquetSink(Path(temporary, 'records.parquet'))):
+            try:
+                with sink:
+                    sink.write(batch)
+            except ImportError as error:
+                print(f'{type(sink).__name__}: skipped, {error}')
+                continue
+            print(sink.report())
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]), *sys.argv[2:3])
@@ -0,0 +1,43 @@
+"""
+Radius and nearest-neighbour queries through the SpatialIndex versus a linear scan over every station
+
+    python -m benchmarks.spatial_index [stations] [queries]
+"""
+import random
+import sys
+from time import perf_counter
+
+from sites.cocorahs.data import SpatialIndex
+from sites.cocorahs.data.spatial_index import chord
+from sites.cocorahs.data.spatial_index import unit_vector
+
+
+def main(stations: int = 25_000, queries: int = 200, km: float = 25):
+    # Roughly the extent of the contiguous United States
+    points = [(f'XX-YY-{i}', random.uniform(25, 49), random.uniform(-124, -67)) for i in range(stations)]
+    targets = [(random.uniform(25, 49), random.uniform(-124, -67)) for _ in range(queries)]
+
+    started = perf_counter()
+    index = SpatialIndex(points)
+    print(f'{"build":>8}: {len(index):,} stations in {perf_counter() - started:.3f}s')
+
+    started = perf_counter()
+    limit = chord(km) ** 2
+    vectors = [(point_id, unit_vector(latitude, longitude)) for point_id, latitude, longitude in points]
+    scanned = [[point_id for point_id, vector in vectors if SpatialIndex.squared(target, vector) <= limit]
+               for target in map(lambda target: unit_vector(*target), targets)]
+    print(f'{"scan":>8}: {queries} radius queries in {perf_counter() - started:.3f}s')
+
+    started = perf_counter()
+    found = [index.radius(*target, km) for target in targets]
+    print(f'{"radius":>8}: {queries} radius queries in {perf_counter() - started:.3f}s, '
+          f'{"same" if list(map(set, found)) == list(map(set, scanned)) else "different"} results')
+
+    started = perf_counter()
+    for target in targets:
+        index.nearest(*target, 10)
+    print(f'{"nearest":>8}: {queries} 10-nearest queries in {perf_counter() - started:.3f}s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:3]))
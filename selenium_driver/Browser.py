@@ -0,0 +1,7 @@
+from enum import auto
+from enum import Enum
+
+
+class Browser(Enum):
+    Chrome = auto()
+    Firefox = auto()
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Navigation and resource timing of the current document, in milliseconds and bytes
+TIMING_SCRIPT = '''
+const [navigation] = performance.getEntriesByType('navigation');
+const resources = performance.getEntriesByType('resource');
+return {
+    url: location.href,
+    dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd : 0,
+    load: navigation ? navigation.loadEventEnd : 0,
+    resources: resources.length,
+    transfer_bytes: resources.reduce((total, entry) => total + (entry.transferSize || 0),
+                                     navigation ? navigation.transferSize || 0 : 0),
+};
+'''
+
+
+@dataclass
+class LoadTiming(object):
+    url: str
+    dom_content_loaded: float
+    load: float
+    resources: int
+    transfer_bytes: int
+
+    @classmethod
+    def from_driver(cls, driver: WebDriver) -> 'LoadTiming':
+        return cls(**driver.execute_script(TIMING_SCRIPT))
+
+    def savings(self, baseline: 'LoadTiming') -> str:
+        """
+        Describes how much faster and lighter this load was than the baseline
+        :param baseline: Timing of the same page loaded without the scraping profile
+        :type baseline: LoadTiming
+        :return: A one-line summary
+        :rtype: str
+        """
+        return (f'{self.url}: DOMContentLoaded {baseline.dom_content_loaded - self.dom_content_loaded:,.0f} ms sooner, '
+                f'{baseline.resources - self.resources} fewer resources, '
+                f'{(baseline.transfer_bytes - self.transfer_bytes) / 1024:,.0f} KiB less transferred')
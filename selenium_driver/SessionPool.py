@@ -0,0 +1,222 @@
+from contextlib import contextmanager
+from threading import Condition
+from typing import Callable
+from typing import Iterator
+from typing import Self
+from typing import TypeVar
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selenium_pom import BasePage
+
+P = TypeVar('P', bound=BasePage)
+
+
+class SessionPool(object):
+    """
+    Leases warm browser sessions instead of starting one per job.
+    Sessions are health-checked before each lease, reset when returned and recycled after `max_uses` leases.
+    Browser commands run outside the lock, so a slow or hung session never holds back the other threads.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int = 4, max_uses: int = 50):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.condition = Condition()
+        self.closed = False
+        self.idle: list[WebDriver] = list()
+        # Sessions handed out and not yet released, keyed by session id
+        self.leased: dict[str, WebDriver] = dict()
+        # Sessions being started outside the lock, counted against the size
+        self.starting = 0
+        # Leases served by each live session, keyed by session id
+        self.uses: dict[str, int] = dict()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def acquire(self, timeout: float = None) -> WebDriver:
+        """
+        Leases a healthy session, starting one if the pool is not full
+        :param timeout: Seconds to wait for a session to be returned when the pool is full, forever if None
+        :type timeout: float
+        :raises RuntimeError: Thrown when the pool is closed
+        :raises TimeoutError: Thrown when no session is returned in time
+        :return: The leased driver, to be handed back with release
+        :rtype: WebDriver
+        """
+        while True:
+            with self.condition:
+                while True:
+                    self.check_open()
+                    if self.idle:
+                        driver = self.idle.pop()
+                        break
+                    if len(self.uses) + self.starting < self.size:
+                        self.starting += 1
+                        driver = None
+                        break
+                    if not self.condition.wait(timeout):
+                        raise TimeoutError(f'No browser session returned to the pool within {timeout}s')
+
+            if driver is None:
+                driver = self.start()
+            elif not self.healthy(driver):
+                self.discard(driver)
+                continue
+
+            with self.condition:
+                if not self.closed:
+                    self.leased[driver.session_id] = driver
+                    return driver
+            self.discard(driver)
+            self.check_open()
+
+    def check_open(self):
+        if self.closed:
+            raise RuntimeError('The session pool is closed')
+
+    def close(self):
+        """
+        Quits the idle sessions and refuses new leases, leased sessions are quit as they are released
+        """
+        with self.condition:
+            self.closed = True
+            idle, self.idle = self.idle, list()
+            self.uses.clear()
+            self.condition.notify_all()
+
+        for driver in idle:
+            self.quit(driver)
+
+    def discard(self, driver: WebDriver):
+        self.quit(driver)
+        with self.condition:
+            self.uses.pop(driver.session_id, None)
+            self.leased.pop(driver.session_id, None)
+            self.condition.notify()
+
+    @staticmethod
+    def healthy(driver: WebDriver) -> bool:
+        try:
+            return driver.execute_script('return document.readyState') is not None
+        except WebDriverException:
+            return False
+
+    @contextmanager
+    def lease(self, timeout: float = None) -> Iterator[WebDriver]:
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def page(self, page: Callable[[WebDriver], P], timeout: float = None) -> P:
+        """
+        Builds a page object over a leased session; leaving its with block returns the session to the pool
+        :param page: Page object class, or any callable taking the driver
+        :type page: Callable[[WebDriver], P]
+        :param timeout: Seconds to wait for a free session
+        :type timeout: float
+        :return: The page object
+        :rtype: P
+        """
+        driver = self.acquire(timeout)
+        instance = None
+        try:
+            instance = page(driver)
+            instance.pool = self
+            return instance
+        finally:
+            if instance is None:
+                self.release(driver)
+
+    @staticmethod
+    def quit(driver: WebDriver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def release(self, driver: WebDriver):
+        """
+        Returns a leased session, resetting its state or recycling it once it served max_uses leases.
+        Sessions released after the pool closed are quit.
+        :param driver: The leased driver
+        :type driver: WebDriver
+        :raises ValueError: Thrown when the session is not currently leased, e.g. released twice
+        """
+        with self.condition:
+            if self.leased.pop(driver.session_id, None) is None:
+                # Parking it again would lease the same session to two callers
+                raise ValueError(f'Session {driver.session_id} is not leased from this pool')
+            uses = self.uses.get(driver.session_id, 0) + 1
+            closed = self.closed
+
+        if closed or uses >= self.max_uses or not self.reset(driver):
+            self.discard(driver)
+            return
+
+        with self.condition:
+            if self.closed:
+                closed = True
+            else:
+                self.uses[driver.session_id] = uses
+                self.idle.append(driver)
+                self.condition.notify()
+        if closed:
+            self.discard(driver)
+
+    @staticmethod
+    def reset(driver: WebDriver) -> bool:
+        try:
+            driver.execute_script('try { localStorage.clear(); sessionStorage.clear(); } catch (error) {}')
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+            return True
+        except WebDriverException:
+            return False
+
+    def start(self) -> WebDriver:
+        # Starts a session in a slot reserved through self.starting
+        driver = None
+        try:
+            driver = self.factory()
+            return driver
+        finally:
+            with self.condition:
+                self.starting -= 1
+                if driver is not None:
+                    self.uses[driver.session_id] = 0
+                self.condition.notify()
+
+    def warm(self, count: int = None) -> Self:
+        """
+        Starts sessions ahead of the first leases, so they do not wait for the browsers to launch
+        :param count: Number of idle sessions to have ready, the pool size if None
+        :type count: int
+        :raises RuntimeError: Thrown when the pool is closed
+        :return: The pool
+        :rtype: Self
+        """
+        count = self.size if count is None else count
+        while True:
+            with self.condition:
+                self.check_open()
+                if len(self.idle) + self.starting >= count or len(self.uses) + self.starting >= self.size:
+                    return self
+                self.starting += 1
+
+            driver = self.start()
+            with self.condition:
+                if not self.closed:
+                    self.idle.append(driver)
+                    self.condition.notify()
+                    continue
+            self.discard(driver)
+            self.check_open()
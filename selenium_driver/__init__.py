@@ -0,0 +1,4 @@
+from .Browser import Browser
+from .DriverFactory import DriverFactory
+from .LoadTiming import LoadTiming
+from .SessionPool import SessionPool
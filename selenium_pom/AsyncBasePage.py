@@ -0,0 +1,151 @@
+from typing import Awaitable
+from typing import Callable
+from typing import Self
+from typing import TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from .AsyncDriver import AsyncDriver
+from .AsyncDriver import AsyncElement
+from .AsyncPageWait import AsyncPageWait
+from .BasePage import SNAPSHOT_SCRIPT
+from .ElementSnapshot import ElementSnapshot
+from .Locator import Locator
+
+T = TypeVar('T')
+
+
+class AsyncBasePage(object):
+    """Asyncio counterpart of BasePage, driving the browser through an AsyncDriver"""
+
+    def __init__(self, driver: AsyncDriver):
+        self.driver = driver
+        # Elements already located on the current page, cleared on navigation and postbacks
+        self.elements: dict[Locator, AsyncElement] = dict()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.driver.quit()
+
+    async def click_element(self, locator: Locator) -> Self:
+        """
+        Clicks the element as found on the page
+        :param locator: Element to be clicked
+        :type locator: Locator
+        :return: The current page
+        :rtype: self
+        """
+        await self.with_element(locator, lambda element: element.click())
+        return self
+
+    async def find_element(self, locator: Locator) -> AsyncElement:
+        """
+        Returns the element as found on the page, reusing the element located earlier if there is one
+        :param locator: Reference to element on page
+        :type locator: Locator
+        :return: The element if found
+        :rtype: AsyncElement
+        """
+        if locator not in self.elements:
+            self.elements[locator] = await self.driver.find_element(*locator)
+        return self.elements[locator]
+
+    async def find_elements(self, locator: Locator) -> list[AsyncElement]:
+        """
+        Returns the elements as found on the page
+        :param locator: Reference to elements on the page
+        :type locator: Locator
+        :return: One or more elements if found, otherwise an empty list
+        :rtype: list[AsyncElement]
+        """
+        return await self.driver.find_elements(*locator)
+
+    def forget(self) -> Self:
+        self.elements.clear()
+        return self
+
+    @property
+    async def html(self) -> str:
+        """
+        Returns the HTML source for the current page
+        :return: The HTML source text
+        :rtype: str
+        """
+        return await self.driver.page_source
+
+    async def select_option(self, dropdown: Locator, options: Locator,
+                            action: Callable[[ElementSnapshot], bool]) -> Self:
+        """
+        Interaction with dropdown menus, selecting the requested option
+        :param dropdown: Reference to the dropdown menu
+        :type dropdown: Locator
+        :param options: Reference to the options to be selected
+        :type options: Locator
+        :param action: Function to filter the options, read in a single snapshot
+        :type action: Callable[[ElementSnapshot, bool]
+        :return: The current page
+        :rtype: self
+        """
+        await self.click_element(dropdown)
+        for option in (await self.snapshot(options))[options]:
+            if action(option):
+                await option.element.click()
+
+        # Selecting an option may post the page back
+        return self.forget()
+
+    async def send_keys(self, locator: Locator, keys: str) -> Self:
+        """
+        Type the provided string at the specified element
+        :param locator: Target element to type into
+        :type locator: Locator
+        :param keys: Values to send to the element
+        :type keys: str
+        :return: The current page
+        :rtype: self
+        """
+        await self.with_element(locator, lambda element: element.send_keys(keys))
+        return self
+
+    async def snapshot(self, *locators: Locator) -> dict[Locator, list[ElementSnapshot]]:
+        """
+        Reads the text, attributes and outer HTML of every element matching the locators in a single round trip
+        :param locators: References to the elements to read
+        :type locators: Locator
+        :return: The snapshots of the matching elements, in document order, for each locator
+        :rtype: dict[Locator, list[ElementSnapshot]]
+        """
+        results = await self.driver.execute_script(SNAPSHOT_SCRIPT, [locator.tuple for locator in locators])
+        return {locator: [ElementSnapshot(**element) for element in elements]
+                for locator, elements in zip(locators, results)}
+
+    def wait(self, seconds: float, *, poll_frequency: float = 0.5, backoff: float = 1.0) -> AsyncPageWait:
+        """
+        :param seconds: How long to wait before aborting
+        :type seconds: float
+        :param poll_frequency: Seconds between the first checks of the condition
+        :type poll_frequency: float
+        :param backoff: Factor growing the interval after each failed check
+        :type backoff: float
+        :return: The AsyncPageWait helper class for building a wait
+        :rtype: AsyncPageWait
+        """
+        return AsyncPageWait(self.driver, seconds, poll_frequency, backoff)
+
+    async def with_element(self, locator: Locator, action: Callable[[AsyncElement], Awaitable[T]]) -> T:
+        """
+        Runs an action against the element, locating it again if the element located earlier went stale
+        :param locator: Reference to element on page
+        :type locator: Locator
+        :param action: Coroutine function to run against the element
+        :type action: Callable[[AsyncElement], Awaitable[T]]
+        :return: The result of the action
+        :rtype: T
+        """
+        try:
+            return await action(await self.find_element(locator))
+        except StaleElementReferenceException:
+            self.elements.pop(locator, None)
+            return await action(await self.find_element(locator))
@@ -0,0 +1,271 @@
+import asyncio
+import json
+from typing import Any
+from typing import Self
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.common.exceptions import ElementNotInteractableException
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# W3C web element identifier
+ELEMENT_KEY = 'element-6066-11e4-a52f-4a5cd2f6a67b'
+ERRORS = {
+    'element click intercepted': ElementClickInterceptedException,
+    'element not interactable': ElementNotInteractableException,
+    'invalid selector': InvalidSelectorException,
+    'javascript error': JavascriptException,
+    'no such element': NoSuchElementException,
+    'script timeout': TimeoutException,
+    'stale element reference': StaleElementReferenceException,
+    'timeout': TimeoutException,
+}
+# Commands that can be sent again without repeating their effect, should the connection drop mid-request
+IDEMPOTENT_METHODS = ('GET', 'DELETE')
+
+
+class AsyncElement(object):
+    def __init__(self, driver: 'AsyncDriver', element_id: str):
+        self.driver = driver
+        self.id = element_id
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AsyncElement) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    async def clear(self):
+        await self.command('POST', 'clear', {})
+
+    async def click(self):
+        await self.command('POST', 'click', {})
+
+    async def command(self, method: str, path: str, body: dict = None) -> Any:
+        return await self.driver.command(method, f'element/{self.id}/{path}', body)
+
+    async def find_element(self, by: str, value: str) -> 'AsyncElement':
+        return await self.command('POST', 'element', self.driver.selector(by, value))
+
+    async def find_elements(self, by: str, value: str) -> list['AsyncElement']:
+        return await self.command('POST', 'elements', self.driver.selector(by, value))
+
+    async def get_attribute(self, name: str) -> str | None:
+        return await self.command('GET', f'attribute/{name}')
+
+    async def get_property(self, name: str) -> Any:
+        return await self.command('GET', f'property/{name}')
+
+    async def is_displayed(self) -> bool:
+        return await self.command('GET', 'displayed')
+
+    async def is_enabled(self) -> bool:
+        return await self.command('GET', 'enabled')
+
+    async def is_selected(self) -> bool:
+        return await self.command('GET', 'selected')
+
+    async def send_keys(self, keys: str):
+        await self.command('POST', 'value', {'text': keys})
+
+    @property
+    async def text(self) -> str:
+        return await self.command('GET', 'text')
+
+
+class AsyncDriver(object):
+    """
+    Minimal asyncio client for the W3C WebDriver protocol, speaking HTTP/1.1 over a single keep-alive connection.
+    Each session costs one socket instead of one thread, so a single event loop can drive many browsers.
+    """
+
+    def __init__(self, url: str, session_id: str):
+        self.url = urlsplit(url.rstrip('/'))
+        self.session_id = session_id
+        self.lock = asyncio.Lock()
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.quit()
+
+    @classmethod
+    def attach(cls, driver: WebDriver) -> 'AsyncDriver':
+        """
+        Drives the session of an existing blocking WebDriver
+        :param driver: Driver whose session should be shared
+        :type driver: WebDriver
+        :return: An asynchronous driver for the same session
+        :rtype: AsyncDriver
+        """
+        return cls(driver.command_executor.client_config.remote_server_addr, driver.session_id)
+
+    @staticmethod
+    def check_response(status: int, value: Any):
+        # Error responses carry a dict value, but a proxy or crashed server may answer with anything
+        error = value if isinstance(value, dict) else dict()
+        if status >= 400 or 'error' in error:
+            message = error.get('message') or f'HTTP {status}: {value!r}'
+            raise ERRORS.get(error.get('error'), WebDriverException)(message)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+            self.reader = self.writer = None
+
+    async def command(self, method: str, path: str, body: dict = None) -> Any:
+        """
+        Sends a WebDriver command for the session
+        :param method: HTTP method
+        :type method: str
+        :param path: Endpoint relative to the session, e.g. 'url' or 'element/{id}/click'
+        :type path: str
+        :param body: JSON payload for POST commands
+        :type body: dict
+        :raises WebDriverException: Thrown when the remote end reports an error, as its Selenium subclass
+        :return: The unwrapped value of the response
+        :rtype: Any
+        """
+        status, payload = await self.request(method, f'/session/{self.session_id}/{path}'.rstrip('/'), body)
+        value = payload.get('value')
+        self.check_response(status, value)
+        return self.unwrap(value)
+
+    async def connect(self):
+        port = self.url.port or (443 if self.url.scheme == 'https' else 80)
+        self.reader, self.writer = await asyncio.open_connection(self.url.hostname, port,
+                                                                 ssl=self.url.scheme == 'https' or None)
+
+    @property
+    async def current_url(self) -> str:
+        return await self.command('GET', 'url')
+
+    async def delete_all_cookies(self):
+        await self.command('DELETE', 'cookie')
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        return await self.command('POST', 'execute/async', {'script': script, 'args': self.wrap(list(args))})
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.command('POST', 'execute/sync', {'script': script, 'args': self.wrap(list(args))})
+
+    async def find_element(self, by: str, value: str) -> AsyncElement:
+        return await self.command('POST', 'element', self.selector(by, value))
+
+    async def find_elements(self, by: str, value: str) -> list[AsyncElement]:
+        return await self.command('POST', 'elements', self.selector(by, value))
+
+    async def get(self, url: str):
+        await self.command('POST', 'url', {'url': url})
+
+    @property
+    async def page_source(self) -> str:
+        return await self.command('GET', 'source')
+
+    async def quit(self):
+        try:
+            await self.command('DELETE', '')
+        finally:
+            await self.close()
+
+    async def request(self, method: str, path: str, body: dict = None) -> tuple[int, dict]:
+        data = json.dumps(body).encode() if body is not None else b''
+        head = (f'{method} {self.url.path}{path} HTTP/1.1\r\nHost: {self.url.netloc}\r\n'
+                f'Content-Type: application/json; charset=utf-8\r\nContent-Length: {len(data)}\r\n'
+                f'Connection: keep-alive\r\n\r\n')
+        async with self.lock:
+            for attempt in range(2):
+                if self.writer is None:
+                    await self.connect()
+                try:
+                    self.writer.write(head.encode() + data)
+                    await self.writer.drain()
+                    return await self.response()
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # The remote end may have closed the idle connection, retry once on a fresh one.
+                    # Other commands may have run before the connection dropped, sending them again could repeat them.
+                    await self.close()
+                    if attempt or method not in IDEMPOTENT_METHODS:
+                        raise
+
+    async def response(self) -> tuple[int, dict]:
+        status = int((await self.reader.readuntil(b'\r\n')).split()[1])
+        headers = dict()
+        while (line := await self.reader.readuntil(b'\r\n')) != b'\r\n':
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = b''
+            while size := int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16):
+                body += await self.reader.readexactly(size + 2)
+                body = body[:-2]
+            await self.reader.readuntil(b'\r\n')
+        else:
+            body = await self.reader.readexactly(int(headers.get('content-length', 0)))
+
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, json.loads(body) if body else dict()
+
+    @staticmethod
+    def selector(by: str, value: str) -> dict[str, str]:
+        # W3C only knows css, link text and xpath strategies, the same conversion Selenium applies
+        if by == 'id':
+            return {'using': 'css selector', 'value': f'[id="{value}"]'}
+        if by == 'name':
+            return {'using': 'css selector', 'value': f'[name="{value}"]'}
+        if by == 'class name':
+            return {'using': 'css selector', 'value': f'.{value}'}
+        return {'using': by, 'value': value}
+
+    @classmethod
+    async def start(cls, url: str, capabilities: dict) -> 'AsyncDriver':
+        """
+        Starts a new session on a WebDriver server, such as chromedriver or a Selenium Grid
+        :param url: Address of the WebDriver server
+        :type url: str
+        :param capabilities: Capabilities to request, e.g. ChromeOptions().to_capabilities()
+        :type capabilities: dict
+        :return: The driver for the new session
+        :rtype: AsyncDriver
+        """
+        driver = cls(url, '')
+        status, payload = await driver.request('POST', '/session', {'capabilities': {'alwaysMatch': capabilities}})
+        value = payload.get('value', {})
+        driver.check_response(status, value)
+
+        driver.session_id = value['sessionId']
+        return driver
+
+    @property
+    async def title(self) -> str:
+        return await self.command('GET', 'title')
+
+    def unwrap(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.unwrap(item) for item in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncElement(self, value[ELEMENT_KEY])
+            return {key: self.unwrap(item) for key, item in value.items()}
+        return value
+
+    def wrap(self, value: Any) -> Any:
+        if isinstance(value, AsyncElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+        return value
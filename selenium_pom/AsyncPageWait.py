@@ -0,0 +1,208 @@
+import asyncio
+import time
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Self
+from typing import TypeVar
+
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+
+from .AsyncDriver import AsyncDriver
+from .AsyncDriver import AsyncElement
+from .IgnorableExceptions import IgnorableExceptions
+from .Locator import Locator
+from .PageWait import OBSERVE_SCRIPT
+
+T = TypeVar('T')
+
+
+class AsyncPageWait(object):
+    """Asyncio counterpart of PageWait, sleeping on the event loop between checks"""
+
+    def __init__(self, driver: AsyncDriver, seconds: float, poll_frequency: float = 0.5, backoff: float = 1.0,
+                 max_poll: float = 2.0):
+        self.driver = driver
+        self.seconds = seconds
+        self.ignored = list()
+        self.poll_frequency = poll_frequency
+        self.backoff = backoff
+        self.max_poll = max_poll
+
+    def disable(self, ignorable: IgnorableExceptions) -> Self:
+        self.ignored.append(ignorable.value)
+        return self
+
+    async def until(self, condition: Callable[[AsyncDriver], Awaitable[T]], message: str = '',
+                    seconds: float = None) -> T:
+        """
+        Awaits the condition until it returns a truthy value
+        :param condition: Coroutine function evaluated against the driver
+        :type condition: Callable[[AsyncDriver], Awaitable[T]]
+        :param message: Message for the TimeoutException
+        :type message: str
+        :param seconds: How long to wait, defaults to the seconds of the wait
+        :type seconds: float
+        :raises TimeoutException: Thrown when the condition is not met before the timeout
+        :return: The first truthy value returned by the condition
+        :rtype: T
+        """
+        ignored = (NoSuchElementException, *self.ignored)
+        interval = self.poll_frequency
+        deadline = time.monotonic() + (seconds if seconds is not None else self.seconds)
+        error = None
+        while True:
+            try:
+                value = await condition(self.driver)
+                if value:
+                    return value
+            except ignored as exception:
+                error = exception
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message) from error
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
+
+    async def element_clickable(self, locator: Locator) -> AsyncElement:
+        """
+        An expectation for checking an element is visible and enabled such that you can click it.
+        :param locator: used to find the element
+        :type locator: Locator
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: The element once it is clickable
+        :rtype: AsyncElement
+        """
+        async def clickable(driver: AsyncDriver) -> AsyncElement | None:
+            element = await driver.find_element(*locator)
+            return element if await element.is_displayed() and await element.is_enabled() else None
+
+        return await self.until(clickable)
+
+    async def presence_of_all_elements_located(self, locator: Locator) -> list[AsyncElement]:
+        """
+        An expectation for checking that there is at least one element present on a web page.
+        :param locator: used to find the element
+        :type locator: Locator
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: the list of elements once they are located
+        :rtype: list[AsyncElement]
+        """
+        return await self.until(lambda driver: driver.find_elements(*locator))
+
+    async def presence_of_element_located(self, locator: Locator) -> AsyncElement:
+        """
+        An expectation for checking that an element is present on the DOM of a page.
+        This does not necessarily mean that the element is visible.
+        :param locator: used to find the element
+        :type locator: Locator
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: the element once it is located
+        :rtype: AsyncElement
+        """
+        return await self.until(lambda driver: driver.find_element(*locator))
+
+    async def staleness_of(self, element: AsyncElement) -> bool:
+        """
+        Wait until an element is no longer attached to the DOM.
+        :param element: The element to inspect
+        :type element: AsyncElement
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: True once the element is detached
+        :rtype: bool
+        """
+        async def stale(_: AsyncDriver) -> bool:
+            try:
+                await element.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                return True
+
+        return await self.until(stale)
+
+    async def text_in_element(self, locator: Locator, text: str) -> bool:
+        """
+        An expectation for checking if the given text is present in the specified element.
+        :param locator: used to find the element
+        :type locator: Locator
+        :param text: the fragment of text expected
+        :type text: str
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: True when the element is located, and the text is present inside it
+        :rtype: bool
+        """
+        async def contains(driver: AsyncDriver) -> bool:
+            return text in await (await driver.find_element(*locator)).text
+
+        return await self.until(contains)
+
+    async def title_contains(self, title: str) -> bool:
+        """
+        An expectation for checking that the title contains a case-sensitive substring.
+        :param title: the fragment of title expected
+        :type title: str
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: True when the title matches
+        :rtype: bool
+        """
+        async def contains(driver: AsyncDriver) -> bool:
+            return title in await driver.title
+
+        return await self.until(contains)
+
+    async def until_script(self, condition: str, *args,
+                           on_stale: Callable[[AsyncDriver], Awaitable[Any]] = None) -> Any:
+        """
+        An expectation for a JavaScript condition, resolved by a MutationObserver the moment it holds.
+        Falls back to polling for the remaining time when the page navigates away while observing.
+        :param condition: Function body returning a truthy value once satisfied
+        :type condition: str
+        :param args: Arguments passed to the condition, elements included
+        :param on_stale: Checked instead of the condition once an element argument went stale while polling
+        :type on_stale: Callable[[AsyncDriver], Awaitable[Any]]
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: The truthy value returned by the condition
+        :rtype: Any
+        """
+        async def check(driver: AsyncDriver) -> Any:
+            try:
+                return await driver.execute_script(condition, *args)
+            except StaleElementReferenceException:
+                # The arguments belonged to the document the page navigated away from
+                if on_stale is None:
+                    raise
+                return await on_stale(driver)
+
+        started = time.monotonic()
+        previous = (await self.driver.command('GET', 'timeouts')).get('script')
+        await self.driver.command('POST', 'timeouts', {'script': int((self.seconds + 1) * 1000)})
+        try:
+            result = await self.driver.execute_async_script(OBSERVE_SCRIPT, condition, self.seconds * 1000, *args)
+        except (JavascriptException, TimeoutException):
+            remaining = max(0.0, self.seconds - (time.monotonic() - started))
+            return await self.until(check, f'Script condition not met after {self.seconds}s', remaining)
+        finally:
+            await self.driver.command('POST', 'timeouts', {'script': previous})
+
+        if not result:
+            raise TimeoutException(f'Script condition not met after {self.seconds}s')
+        return result
+
+    async def url_contains(self, url: str) -> bool:
+        """
+        An expectation for checking that the current url contains a case-sensitive substring.
+        :param url: the fragment of url expected
+        :type url: str
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: True when the url matches
+        :rtype: bool
+        """
+        async def contains(driver: AsyncDriver) -> bool:
+            return url in await driver.current_url
+
+        return await self.until(contains)
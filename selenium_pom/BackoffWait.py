@@ -0,0 +1,81 @@
+import time
+from typing import Callable
+from typing import Iterable
+from typing import TypeVar
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .Metrics import metrics
+from .WaitProfiler import wait_profiler
+
+T = TypeVar('T')
+
+
+class BackoffWait(object):
+    """
+    Drop-in for WebDriverWait that starts polling quickly and backs off,
+    growing the interval by `backoff` after each miss up to `max_poll`
+    """
+
+    def __init__(self, driver: WebDriver, timeout: float, poll_frequency: float = 0.5, backoff: float = 1.0,
+                 max_poll: float = 2.0, ignored_exceptions: Iterable[type[Exception]] = (), name: str = 'until',
+                 call_site: str = '', ignore_timeout: bool = False):
+        self.driver = driver
+        # Label of the waited condition and where it was waited on, for the metrics and the wait profiler
+        self.name = name
+        self.call_site = call_site
+        self.ignore_timeout = ignore_timeout
+        self.polls = 0
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.backoff = backoff
+        self.max_poll = max_poll
+        self.ignored_exceptions = (NoSuchElementException, *ignored_exceptions)
+
+    def until(self, method: Callable[[WebDriver], T], message: str = '') -> T:
+        """
+        Calls the method until it returns a truthy value
+        :param method: Condition to evaluate against the driver
+        :type method: Callable[[WebDriver], T]
+        :param message: Message for the TimeoutException
+        :type message: str
+        :raises TimeoutException: Thrown when the condition is not met before the timeout, unless ignored
+        :return: The first truthy value returned by the method, or False if the timeout is ignored
+        :rtype: T
+        """
+        started = time.perf_counter()
+        try:
+            with metrics.timer('wait', condition=self.name):
+                value = self.poll(method, message)
+        except TimeoutException:
+            wait_profiler.record(self.name, self.call_site, self.timeout, time.perf_counter() - started, self.polls,
+                                 timed_out=True)
+            if self.ignore_timeout:
+                return False
+            raise
+
+        wait_profiler.record(self.name, self.call_site, self.timeout, time.perf_counter() - started, self.polls,
+                             timed_out=False)
+        return value
+
+    def poll(self, method: Callable[[WebDriver], T], message: str = '') -> T:
+        interval = self.poll_frequency
+        deadline = time.monotonic() + self.timeout
+        error = None
+        while True:
+            self.polls += 1
+            try:
+                value = method(self.driver)
+                if value:
+                    return value
+            except self.ignored_exceptions as ignored:
+                error = ignored
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message) from error
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
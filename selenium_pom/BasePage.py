@@ -1,27 +1,146 @@
+import base64
+import gzip
+from typing import Any
 from typing import Callable
 from typing import Self
+from typing import TypeVar
 
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.wait import TimeoutException
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 
+from .ElementSnapshot import ElementSnapshot
 from .Locator import Locator
+from .Metrics import instrumented
 from .PageWait import PageWait
 
+T = TypeVar('T')
+
+
+# Element lookup by Selenium strategy, shared by the scripts below
+FIND_SCRIPT = '''
+const find = {
+    'class name': value => document.getElementsByClassName(value),
+    'css selector': value => document.querySelectorAll(value),
+    'id': value => document.querySelectorAll(`[id="${value}"]`),
+    'link text': value => Array.from(document.links).filter(a => a.innerText.trim() === value),
+    'name': value => document.getElementsByName(value),
+    'partial link text': value => Array.from(document.links).filter(a => a.innerText.includes(value)),
+    'tag name': value => document.getElementsByTagName(value),
+    'xpath': value => {
+        const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+    },
+};
+'''
+
+
+# Resolves every [by, value] pair and reads each element's text, attributes and outerHTML in one command
+SNAPSHOT_SCRIPT = FIND_SCRIPT + '''
+return arguments[0].map(([by, value]) => Array.from(find[by](value), element => {
+    const attributes = {};
+    for (const attribute of element.attributes) {
+        attributes[attribute.name] = attribute.value;
+    }
+    if ('value' in element) {
+        attributes.value = String(element.value);
+    }
+    return {element: element, text: element.innerText || '', html: element.outerHTML, attributes: attributes};
+}));
+'''
+
+
+# Reads the outerHTML of the first matching element, gzipped and base64 encoded when the browser supports it
+OUTER_HTML_SCRIPT = FIND_SCRIPT + '''
+const [[by, value], compress, done] = arguments;
+const element = Array.from(find[by](value))[0];
+if (!element) {
+    done(null);
+} else if (!compress || typeof CompressionStream === 'undefined') {
+    done([false, element.outerHTML]);
+} else {
+    const stream = new Blob([element.outerHTML]).stream().pipeThrough(new CompressionStream('gzip'));
+    new Response(stream).blob().then(blob => {
+        const reader = new FileReader();
+        reader.onload = () => done([true, reader.result.slice(reader.result.indexOf(',') + 1)]);
+        reader.readAsDataURL(blob);
+    });
+}
+'''
+
+
+# State that changes on any ASP.NET postback, full or partial
+POSTBACK_STATE_SCRIPT = '''
+const viewstate = document.getElementById('__VIEWSTATE');
+return [document.readyState, viewstate ? viewstate.value : null];
+'''
+
+# Holds once the replaced element is detached or the __VIEWSTATE changed, in a loaded document
+POSTBACK_COMPLETE_SCRIPT = '''
+const [replaced, previous] = arguments;
+const viewstate = document.getElementById('__VIEWSTATE');
+const changed = !replaced.isConnected || (viewstate ? viewstate.value : null) !== previous;
+return document.readyState === 'complete' && changed;
+'''
+
 
 class BasePage(object):
     def __init__(self, driver: WebDriver):
         self.driver = driver
+        # Elements already located on the current page, cleared on navigation and postbacks
+        self.elements: dict[Locator, WebElement] = dict()
         self.keys = Keys
+        # Set when the driver is leased from a pool, see selenium_driver.SessionPool
+        self.pool = None
 
     def __enter__(self) -> Self:
         return self
 
-    def __exit__(self):
-        self.driver.quit()
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.pool is not None:
+            self.pool.release(self.driver)
+        else:
+            self.driver.quit()
 
+    @instrumented
+    def await_postback(self, action: Callable[[], Any], replaced: Locator, seconds: float = 30) -> Self:
+        """
+        Runs an action that posts the page back, returning as soon as the new content is in place.
+        The postback is complete once the replaced element (or the whole document) went stale,
+        or the __VIEWSTATE changed for partial postbacks, and the document finished loading.
+        Partial postbacks resolve through PageWait.until_script, the moment the content changes.
+        :param action: Interaction triggering the postback
+        :type action: Callable[[], Any]
+        :param replaced: Reference to the element the postback replaces
+        :type replaced: Locator
+        :param seconds: How long to wait before aborting
+        :type seconds: float
+        :raises TimeoutException: Thrown when the postback does not complete in enough time.
+        :return: The current page
+        :rtype: self
+        """
+        old = self.driver.find_elements(*replaced) or self.driver.find_elements(*Locator.tag('html'))
+        _, viewstate = self.driver.execute_script(POSTBACK_STATE_SCRIPT)
+        action()
+
+        def loaded(driver: WebDriver) -> bool:
+            # The old document is gone, so the postback completes once the new one loaded
+            return driver.execute_script(POSTBACK_STATE_SCRIPT)[0] == 'complete'
+
+        wait = self.wait(seconds, poll_frequency=0.05, backoff=1.5)
+        try:
+            wait.until_script(POSTBACK_COMPLETE_SCRIPT, old[0], viewstate, on_stale=loaded)
+        except TimeoutException as error:
+            raise TimeoutException(f'Postback did not replace {replaced}') from error
+        finally:
+            # Elements located by the action or while waiting belong to the old document
+            self.forget()
+        return self
+
+    @instrumented
     def click_element(self, locator: Locator) -> Self:
         """
         Clicks the element as found on the page
@@ -30,19 +149,23 @@ class BasePage(object):
         :return: The current page
         :rtype: self
         """
-        self.find_element(locator).click()
+        self.with_element(locator, lambda element: element.click())
         return self
 
+    @instrumented
     def find_element(self, locator: Locator) -> WebElement:
         """
-        Returns the element as found on the page
+        Returns the element as found on the page, reusing the element located earlier if there is one
         :param locator: Reference to element on page
         :type locator: Locator
         :return: The WebElement if found
         :rtype: WebElement
         """
-        return self.driver.find_element(*locator)
+        if locator not in self.elements:
+            self.elements[locator] = self.driver.find_element(*locator)
+        return self.elements[locator]
 
+    @instrumented
     def find_elements(self, locator: Locator) -> list[WebElement]:
         """
         Returns the elements as found on the page
@@ -53,6 +176,15 @@ class BasePage(object):
         """
         return self.driver.find_elements(*locator)
 
+    def forget(self) -> Self:
+        """
+        Clears the located elements, to be called once the page navigates or posts back
+        :return: The current page
+        :rtype: self
+        """
+        self.elements.clear()
+        return self
+
     @property
     def html(self) -> str:
         """
@@ -62,25 +194,61 @@ class BasePage(object):
         """
         return self.driver.page_source
 
-    def select_option(self, dropdown: Locator, options: Locator, action: Callable[[WebElement], bool]) -> Self:
+    @instrumented
+    def outer_html(self, locator: Locator, *, compress: bool = False) -> bytes | None:
+        """
+        Reads the outer HTML of an element in a single round trip, as UTF-8 bytes ready for a parser
+        :param locator: Reference to element on page
+        :type locator: Locator
+        :param compress: Whether to gzip the HTML in the browser before it is sent, to save transfer time
+        :type compress: bool
+        :return: The outer HTML, or None if no element matches
+        :rtype: bytes | None
+        """
+        result = self.driver.execute_async_script(OUTER_HTML_SCRIPT, locator.tuple, compress)
+        if result is None:
+            return None
+
+        compressed, html = result
+        return gzip.decompress(base64.b64decode(html)) if compressed else html.encode()
+
+    def submit_and_await(self, submit: Locator, replaced: Locator, seconds: float = 30) -> Self:
+        """
+        Clicks a submit button and waits for the postback to complete, see await_postback
+        :param submit: Element to be clicked
+        :type submit: Locator
+        :param replaced: Reference to the element the postback replaces
+        :type replaced: Locator
+        :param seconds: How long to wait before aborting
+        :type seconds: float
+        :raises TimeoutException: Thrown when the postback does not complete in enough time.
+        :return: The current page
+        :rtype: self
+        """
+        return self.await_postback(lambda: self.click_element(submit), replaced, seconds)
+
+    @instrumented
+    def select_option(self, dropdown: Locator, options: Locator, action: Callable[[ElementSnapshot], bool]) -> Self:
         """
         Interaction with dropdown menus, selecting the requested option
         :param dropdown: Reference to the dropdown menu
         :type dropdown: Locator
         :param options: Reference to the options to be selected
         :type options: Locator
-        :param action: Function to filter the options elements
-        :type action: Callable[[WebElement, bool]
+        :param action: Function to filter the options, read in a single snapshot
+        :type action: Callable[[ElementSnapshot, bool]
         :return: The current page
         :rtype: self
         """
         self.click_element(dropdown)
-        for option in self.find_elements(options):
+        for option in self.snapshot(options)[options]:
             if action(option):
-                option.click()
+                option.element.click()
 
-        return self
+        # Selecting an option may post the page back
+        return self.forget()
 
+    @instrumented
     def send_keys(self, locator: Locator, keys: str) -> Self:
         """
         Type the provided string at the specified element
@@ -91,23 +259,51 @@ class BasePage(object):
         :return: The current page
         :rtype: self
         """
-        self.find_element(*locator).send_keys(keys)
+        self.with_element(locator, lambda element: element.send_keys(keys))
         return self
 
-    def wait(self, seconds: float, *, ignore_timeout: bool = False) -> PageWait:
+    @instrumented
+    def snapshot(self, *locators: Locator) -> dict[Locator, list[ElementSnapshot]]:
+        """
+        Reads the text, attributes and outer HTML of every element matching the locators in a single round trip
+        :param locators: References to the elements to read
+        :type locators: Locator
+        :return: The snapshots of the matching elements, in document order, for each locator
+        :rtype: dict[Locator, list[ElementSnapshot]]
+        """
+        results = self.driver.execute_script(SNAPSHOT_SCRIPT, [locator.tuple for locator in locators])
+        return {locator: [ElementSnapshot(**element) for element in elements]
+                for locator, elements in zip(locators, results)}
+
+    def wait(self, seconds: float, *, ignore_timeout: bool = False, poll_frequency: float = 0.5,
+             backoff: float = 1.0) -> PageWait:
         """
 
         :param seconds: How long to wait before aborting
         :type seconds: float
-        :param ignore_timeout: Whether to catch a TimeoutException
+        :param ignore_timeout: Whether the expectations return False on timeout instead of raising a TimeoutException
         :type ignore_timeout: bool
+        :param poll_frequency: Seconds between the first checks of the condition
+        :type poll_frequency: float
+        :param backoff: Factor growing the interval after each failed check
+        :type backoff: float
         :return: The PageWait helper class for building a Selenium wait
         :rtype: PageWait
         """
-        if ignore_timeout:
-            try:
-                return PageWait(self.driver, seconds)
-            except TimeoutException:
-                pass
-        else:
-            return PageWait(self.driver, seconds)
+        return PageWait(self.driver, seconds, poll_frequency, backoff, ignore_timeout=ignore_timeout)
+
+    def with_element(self, locator: Locator, action: Callable[[WebElement], T]) -> T:
+        """
+        Runs an action against the element, locating it again if the element located earlier went stale
+        :param locator: Reference to element on page
+        :type locator: Locator
+        :param action: Function to run against the element
+        :type action: Callable[[WebElement], T]
+        :return: The result of the action
+        :rtype: T
+        """
+        try:
+            return action(self.find_element(locator))
+        except StaleElementReferenceException:
+            self.elements.pop(locator, None)
+            return action(self.find_element(locator))
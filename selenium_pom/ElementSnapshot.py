@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from dataclasses import field
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from .AsyncDriver import AsyncElement
+
+
+@dataclass
+class ElementSnapshot(object):
+    """The state of an element as read in a single round trip, see BasePage.snapshot"""
+    element: WebElement | AsyncElement
+    text: str
+    html: str
+    attributes: dict[str, str] = field(default_factory=dict)
+
+    def get_attribute(self, name: str) -> str | None:
+        """
+        Mirrors WebElement.get_attribute for the attributes read with the snapshot
+        :param name: Name of the attribute
+        :type name: str
+        :return: The attribute value, or None if the element does not have it
+        :rtype: str | None
+        """
+        return self.attributes.get(name)
@@ -8,10 +8,19 @@ class Locator(object):
         self.by = by
         self.value = value
 
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Locator) and self.tuple == other.tuple
+
+    def __hash__(self) -> int:
+        return hash(self.tuple)
+
     def __iter__(self):
         yield str(self.by)
         yield self.value
 
+    def __repr__(self) -> str:
+        return f"<Locator {self.by.name}: '{self.value}'>"
+
     @classmethod
     def class_name(cls, value: str) -> 'Locator':
         return cls(By.ClassName, value)
@@ -0,0 +1,163 @@
+import json
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable
+from typing import Iterator
+from typing import Self
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .Locator import Locator
+
+# Upper bounds of the latency histogram buckets, in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class Histogram(object):
+    counts: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS) + 1))
+    count: int = 0
+    failures: int = 0
+    total: float = 0.0
+
+    def observe(self, seconds: float, failed: bool = False):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.failures += failed
+        self.total += seconds
+
+
+class Metrics(object):
+    """
+    Opt-in latency histograms for WebDriver commands, page actions, waits and parsing.
+    Disabled until enable() is called, at which point the instrumented code starts recording.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = Lock()
+        self.series: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = dict()
+
+    def disable(self) -> Self:
+        self.enabled = False
+        return self
+
+    def enable(self) -> Self:
+        self.enabled = True
+        return self
+
+    def instrument(self, driver: WebDriver) -> WebDriver:
+        """
+        Records every command sent by the driver, labelled with the WebDriver command name
+        :param driver: Driver to instrument, in place
+        :type driver: WebDriver
+        :return: The same driver
+        :rtype: WebDriver
+        """
+        execute = driver.execute
+        if getattr(execute, 'instrumented', False):
+            return driver
+
+        @wraps(execute)
+        def timed(driver_command: str, params: dict = None):
+            with self.timer('webdriver_command', command=driver_command):
+                return execute(driver_command, params)
+
+        timed.instrumented = True
+        driver.execute = timed
+        return driver
+
+    def observe(self, name: str, seconds: float, failed: bool = False, **labels: str):
+        if not self.enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.series.setdefault(key, Histogram()).observe(seconds, failed)
+
+    def reset(self):
+        with self.lock:
+            self.series.clear()
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        failed = False
+        started = perf_counter()
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.observe(name, perf_counter() - started, failed, **labels)
+
+    def to_dict(self) -> list[dict]:
+        with self.lock:
+            return [{'name': name, 'labels': dict(labels), 'count': histogram.count, 'failures': histogram.failures,
+                     'sum': histogram.total, 'buckets': dict(zip((*map(str, BUCKETS), '+Inf'), histogram.counts))}
+                    for (name, labels), histogram in sorted(self.series.items())]
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, prefix: str = 'scrape') -> str:
+        """
+        Renders the histograms in the Prometheus text exposition format
+        :param prefix: Prefix of every metric name
+        :type prefix: str
+        :return: One histogram and one failure counter per metric
+        :rtype: str
+        """
+        lines = list()
+        with self.lock:
+            series = sorted(self.series.items())
+
+        for name in dict.fromkeys(name for (name, _), _ in series):
+            metric = f'{prefix}_{name}_seconds'
+            lines.append(f'# TYPE {metric} histogram')
+            failures = [f'# TYPE {prefix}_{name}_failures_total counter']
+            for (_, labels), histogram in (item for item in series if item[0][0] == name):
+                text = ','.join(f'{key}="{self.escape(value)}"' for key, value in labels)
+                cumulative = 0
+                for bound, count in zip((*map(str, BUCKETS), '+Inf'), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{{text}{"," if text else ""}le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{{text}}} {histogram.total}')
+                lines.append(f'{metric}_count{{{text}}} {histogram.count}')
+                failures.append(f'{prefix}_{name}_failures_total{{{text}}} {histogram.failures}')
+            lines.extend(failures)
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def escape(value: str) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Shared registry used by the instrumented page objects
+metrics = Metrics()
+
+
+def instrumented(method: Callable) -> Callable:
+    """Records a page object method as a page action, labelled with the page class and the first Locator argument"""
+
+    @wraps(method)
+    def timed(self, *args, **kwargs):
+        if not metrics.enabled:
+            return method(self, *args, **kwargs)
+
+        locator = next((arg for arg in args if isinstance(arg, Locator)), None)
+        with metrics.timer('page_action', page=type(self).__name__, action=method.__name__,
+                           locator=repr(locator) if locator is not None else ''):
+            return method(self, *args, **kwargs)
+
+    return timed
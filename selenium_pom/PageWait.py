@@ -1,28 +1,145 @@
 from re import Pattern
+from time import perf_counter
+from typing import Any
+from typing import Callable
 from typing import Self
 
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as Until
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
+from .BackoffWait import BackoffWait
 from .IgnorableExceptions import IgnorableExceptions
 from .Locator import Locator
+from .WaitProfiler import wait_profiler
+
+# Resolves as soon as the condition holds, re-evaluating it on every DOM mutation instead of polling
+OBSERVE_SCRIPT = '''
+const done = arguments[arguments.length - 1];
+const [body, timeout, ...args] = Array.from(arguments).slice(0, -1);
+const condition = new Function(body);
+const check = () => {
+    try {
+        return condition.apply(null, args);
+    } catch (error) {
+        return false;
+    }
+};
+const result = check();
+if (result) {
+    done(result);
+} else {
+    const observer = new MutationObserver(() => {
+        const result = check();
+        if (result) {
+            clearTimeout(timer);
+            observer.disconnect();
+            done(result);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        done(null);
+    }, timeout);
+    observer.observe(document, {attributes: true, characterData: true, childList: true, subtree: true});
+}
+'''
 
 
 class PageWait(object):
-    def __init__(self, driver: WebDriver, seconds: float):
+    def __init__(self, driver: WebDriver, seconds: float, poll_frequency: float = 0.5, backoff: float = 1.0,
+                 max_poll: float = 2.0, ignore_timeout: bool = False):
         self.driver = driver
         self.seconds = seconds
+        # Return False instead of raising TimeoutException
+        self.ignore_timeout = ignore_timeout
         self.ignored = list()
+        self.poll_frequency = poll_frequency
+        self.backoff = backoff
+        self.max_poll = max_poll
 
     def disable(self, ignorable: IgnorableExceptions) -> Self:
         self.ignored.append(ignorable.value)
         return self
 
+    def named(self, name: str) -> BackoffWait:
+        """
+        A wait labelled with the condition it waits for, in the metrics and the wait profiler
+        :param name: Name of the condition, e.g. the expectation method
+        :type name: str
+        :return: The wait, located at the first caller outside selenium_pom, see WaitProfiler.call_site
+        :rtype: BackoffWait
+        """
+        return BackoffWait(self.driver, self.seconds, self.poll_frequency, self.backoff, self.max_poll, self.ignored,
+                           name=name, call_site=wait_profiler.call_site(), ignore_timeout=self.ignore_timeout)
+
     @property
-    def wait(self):
-        return WebDriverWait(self.driver, self.seconds)
+    def wait(self) -> BackoffWait:
+        return self.named('until')
+
+    def until_script(self, condition: str, *args, on_stale: Callable[[WebDriver], Any] = None,
+                     name: str = 'until_script') -> Any:
+        """
+        An expectation for a JavaScript condition, resolved by a MutationObserver the moment it holds.
+        Falls back to polling for the remaining time when the page navigates away while observing,
+        as a full postback does.
+        :param condition: Function body returning a truthy value once satisfied, e.g. 'return !arguments[0].isConnected'
+        :type condition: str
+        :param args: Arguments passed to the condition, WebElements included
+        :param on_stale: Checked instead of the condition once an element argument went stale while polling
+        :type on_stale: Callable[[WebDriver], Any]
+        :param name: Name of the condition in the metrics and the wait profiler
+        :type name: str
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: The truthy value returned by the condition, or False if the timeout is ignored
+        :rtype: Any
+        """
+        call_site = wait_profiler.call_site()
+
+        def check(driver: WebDriver) -> Any:
+            try:
+                return driver.execute_script(condition, *args)
+            except StaleElementReferenceException:
+                # The arguments belonged to the document the page navigated away from
+                if on_stale is None:
+                    raise
+                return on_stale(driver)
+
+        started = perf_counter()
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.seconds + 1)
+        try:
+            result = self.driver.execute_async_script(OBSERVE_SCRIPT, condition, self.seconds * 1000, *args)
+        except (JavascriptException, TimeoutException):
+            remaining = max(0.0, self.seconds - (perf_counter() - started))
+            return BackoffWait(self.driver, remaining, self.poll_frequency, self.backoff, self.max_poll,
+                               self.ignored, name=name, call_site=call_site, ignore_timeout=self.ignore_timeout
+                               ).until(check, f'Script condition not met after {self.seconds}s')
+        finally:
+            self.driver.set_script_timeout(previous)
+
+        wait_profiler.record(name, call_site, self.seconds, perf_counter() - started, 1, timed_out=not result)
+        if not result:
+            if self.ignore_timeout:
+                return False
+            raise TimeoutException(f'Script condition not met after {self.seconds}s')
+        return result
+
+    def replacement_of(self, element: WebElement) -> bool:
+        """
+        An expectation for an element to be removed from the DOM, such as a grid being replaced after a search.
+        Resolves through until_script, without polling while the page stays loaded.
+        :param element: The element to be replaced
+        :type element: WebElement
+        :raises TimeoutException: Thrown when a command does not complete in enough time.
+        :return: True once the element is detached
+        :rtype: bool
+        """
+        return self.until_script('return !arguments[0].isConnected', element, on_stale=lambda driver: True,
+                                 name='replacement_of')
 
     def alert_is_present(self) -> bool:
         """
@@ -31,7 +148,7 @@ class PageWait(object):
         :return: True when an alert is present, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.alert_is_present())
+        return self.named('alert_is_present').until(Until.alert_is_present())
 
     def element_attribute_includes(self, locator: Locator, attribute: str) -> bool:
         """
@@ -44,7 +161,7 @@ class PageWait(object):
         :return: True if the attribute meets expectations, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.element_attribute_to_include(locator, attribute))
+        return self.named('element_attribute_includes').until(Until.element_attribute_to_include(locator, attribute))
 
     def element_located_and_selected(self, locator: Locator) -> bool:
         """
@@ -55,9 +172,9 @@ class PageWait(object):
         :return: True if the element is found and selected, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.element_located_to_be_selected(locator))
+        return self.named('element_located_and_selected').until(Until.element_located_to_be_selected(locator))
 
-    def element_clickable(self, mark: Locator | WebElement) -> WebElement | False:
+    def element_clickable(self, mark: Locator | WebElement) -> WebElement | bool:
         """
         An expectation for checking an element is visible and enabled such that you can click it.
         :param mark: either a locator (text) or a WebElement
@@ -68,8 +185,8 @@ class PageWait(object):
         :rtype: WebElement | bool
         """
         if isinstance(mark, Locator):
-            return self.wait.until(Until.element_to_be_clickable(mark.tuple))
-        return self.wait.until(Until.element_to_be_clickable(mark))
+            return self.named('element_clickable').until(Until.element_to_be_clickable(mark.tuple))
+        return self.named('element_clickable').until(Until.element_to_be_clickable(mark))
 
     def element_located_selection_state(self, locator: Locator, selected: bool) -> bool:
         """
@@ -82,7 +199,8 @@ class PageWait(object):
         :return: True if the element matches the expected state, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.element_located_selection_state_to_be(locator, selected))
+        return self.named('element_located_selection_state').until(
+            Until.element_located_selection_state_to_be(locator, selected))
 
     def element_selected(self, element: WebElement) -> bool:
         """
@@ -93,7 +211,7 @@ class PageWait(object):
         :return: True if the element is selected, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.element_to_be_selected(element))
+        return self.named('element_selected').until(Until.element_to_be_selected(element))
 
     def frame_available(self, locator: Locator) -> bool:
         """
@@ -105,9 +223,9 @@ class PageWait(object):
         :return: True if the frame could be switched to, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.frame_to_be_available_and_switch_to_it(locator))
+        return self.named('frame_available').until(Until.frame_to_be_available_and_switch_to_it(locator))
 
-    def invisibility_of_element(self, element: WebElement) -> WebElement | True:
+    def invisibility_of_element(self, element: WebElement) -> WebElement | bool:
         """
         An expectation for checking that an element is either invisible or not present on the DOM.
         :param element: Element to inspect
@@ -116,9 +234,9 @@ class PageWait(object):
         :return: The element if it isn't visible, or True if the element is absent from the DOM
         :rtype: WebElement
         """
-        return self.wait.until(Until.invisibility_of_element(element))
+        return self.named('invisibility_of_element').until(Until.invisibility_of_element(element))
 
-    def invisibility_of_locator(self, locator: Locator) -> WebElement | True:
+    def invisibility_of_locator(self, locator: Locator) -> WebElement | bool:
         """
         An expectation for checking that an element is either invisible or not present on the DOM.
         :param locator: used to find the element
@@ -127,10 +245,10 @@ class PageWait(object):
         :return: The element if it isn't visible, or True if the element is absent from the DOM
         :rtype: WebElement
         """
-        return self.wait.until(Until.invisibility_of_element(locator))
+        return self.named('invisibility_of_locator').until(Until.invisibility_of_element(locator))
 
     def new_window(self, handles: list[str]) -> bool:
-        return self.wait.until(Until.new_window_is_opened(handles))
+        return self.named('new_window').until(Until.new_window_is_opened(handles))
 
     def number_of_windows_to_be(self, count: int) -> bool:
         """
@@ -141,7 +259,7 @@ class PageWait(object):
         :return: True if the count is as expected, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.number_of_windows_to_be(count))
+        return self.named('number_of_windows_to_be').until(Until.number_of_windows_to_be(count))
 
     def presence_of_all_elements_located(self, locator: Locator) -> list[WebElement]:
         """
@@ -152,7 +270,7 @@ class PageWait(object):
         :return: the list of WebElements once they are located
         :rtype: list
         """
-        return self.wait.until(Until.presence_of_all_elements_located(locator))
+        return self.named('presence_of_all_elements_located').until(Until.presence_of_all_elements_located(locator))
 
     def presence_of_element_located(self, locator: Locator) -> WebElement:
         """
@@ -164,7 +282,7 @@ class PageWait(object):
         :return: WebElement once it is located
         :rtype: WebElement
         """
-        return self.wait.until(Until.presence_of_element_located(locator))
+        return self.named('presence_of_element_located').until(Until.presence_of_element_located(locator))
 
     def staleness_of(self, element: WebElement) -> bool:
         """
@@ -174,7 +292,7 @@ class PageWait(object):
         :return: False if the element is still attached to the DOM, true otherwise.
         :rtype: bool
         """
-        return self.wait.until(Until.staleness_of(element))
+        return self.named('staleness_of').until(Until.staleness_of(element))
 
     def text_in_element(self, locator: Locator, text: str) -> bool:
         """
@@ -187,7 +305,7 @@ class PageWait(object):
         :return: True when the element is located, and the text is present inside it. False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.text_to_be_present_in_element(locator, text))
+        return self.named('text_in_element').until(Until.text_to_be_present_in_element(locator, text))
 
     def text_in_element_attribute(self, locator: Locator, attribute: str, text: str) -> bool:
         """
@@ -202,7 +320,8 @@ class PageWait(object):
         :return: True when the element is located, and the text is present inside it. False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.text_to_be_present_in_element_attribute(locator, attribute, text))
+        return self.named('text_in_element_attribute').until(
+            Until.text_to_be_present_in_element_attribute(locator, attribute, text))
 
     def text_in_element_value(self, locator: Locator, text: str) -> bool:
         """
@@ -215,7 +334,7 @@ class PageWait(object):
         :return: True when the element is located, and the text is present inside it. False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.text_to_be_present_in_element_value(locator, text))
+        return self.named('text_in_element_value').until(Until.text_to_be_present_in_element_value(locator, text))
 
     def title_contains(self, title: str) -> bool:
         """
@@ -227,7 +346,7 @@ class PageWait(object):
         :return: True when the title matches, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.title_contains(title))
+        return self.named('title_contains').until(Until.title_contains(title))
 
     def title_is(self, title: str) -> bool:
         """
@@ -238,7 +357,7 @@ class PageWait(object):
         :return: True if the title matches, false otherwise.
         :rtype: bool
         """
-        return self.wait.until(Until.title_is(title))
+        return self.named('title_is').until(Until.title_is(title))
 
     def url_changes(self, url: str) -> bool:
         """
@@ -249,7 +368,7 @@ class PageWait(object):
         :return: True if the url is different, false otherwise.
         :rtype: bool
         """
-        return self.wait.until(Until.url_changes(url))
+        return self.named('url_changes').until(Until.url_changes(url))
 
     def url_contains(self, url: str) -> str:
         """
@@ -260,7 +379,7 @@ class PageWait(object):
         :return: True when the url matches, False otherwise
         :rtype: bool
         """
-        return self.wait.until(Until.url_contains(url))
+        return self.named('url_contains').until(Until.url_contains(url))
 
     def url_is(self, url: str) -> bool:
         """
@@ -271,7 +390,7 @@ class PageWait(object):
         :return: True if the url matches, false otherwise.
         :rtype: bool
         """
-        return self.wait.until(Until.url_to_be(url))
+        return self.named('url_is').until(Until.url_to_be(url))
 
     def url_matches(self, pattern: Pattern) -> bool:
         """
@@ -282,7 +401,7 @@ class PageWait(object):
         :return: True if the url matches, false otherwise.
         :rtype: bool
         """
-        return self.wait.until(Until.url_matches(pattern))
+        return self.named('url_matches').until(Until.url_matches(pattern))
 
     def visibility_of(self, element: WebElement) -> WebElement:
         """
@@ -294,9 +413,9 @@ class PageWait(object):
         :return: the (same) WebElement once it is visible
         :rtype: WebElement
         """
-        return self.wait.until(Until.visibility_of(element))
+        return self.named('visibility_of').until(Until.visibility_of(element))
 
-    def visibility_of_all_elements_located(self, locator: Locator) -> False | list[WebElement]:
+    def visibility_of_all_elements_located(self, locator: Locator) -> list[WebElement] | bool:
         """
         An expectation for checking that all elements are present on the DOM of a page and visible.
         Visibility means that the elements are not only displayed but also has a height and width > 0.
@@ -305,7 +424,7 @@ class PageWait(object):
         :return: the list of WebElements once they are located and visible
         :rtype: list[WebElement]
         """
-        return self.wait.until(Until.visibility_of_all_elements_located(locator))
+        return self.named('visibility_of_all_elements_located').until(Until.visibility_of_all_elements_located(locator))
 
     def visibility_of_any_elements_located(self, locator: Locator) -> list[WebElement]:
         """
@@ -314,7 +433,7 @@ class PageWait(object):
         :return: the list of WebElements once they are located
         :rtype: list[WebElement]
         """
-        return self.wait.until(Until.visibility_of_any_elements_located(locator))
+        return self.named('visibility_of_any_elements_located').until(Until.visibility_of_any_elements_located(locator))
 
     def visibility_of_element_located(self, locator: Locator) -> WebElement:
         """
@@ -326,4 +445,4 @@ class PageWait(object):
         :return: the WebElement once it is located and visible
         :rtype: WebElement
         """
-        return self.wait.until(Until.visibility_of_element_located(locator))
\ No newline at end of file
+        return self.named('visibility_of_element_located').until(Until.visibility_of_element_located(locator))
\ No newline at end of file
@@ -0,0 +1,157 @@
+import logging
+import math
+import os
+import random
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from statistics import quantiles
+from threading import Lock
+from typing import ClassVar
+from typing import Self
+
+logger = logging.getLogger(__name__)
+
+# Frames in this package are helpers, the call site of a wait is the first frame outside it
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+@dataclass
+class WaitStats(object):
+    """
+    Running totals of a wait, with a bounded reservoir sample of the satisfied durations for the percentiles
+    """
+    condition: str
+    call_site: str
+    timeout: float
+    satisfied: int = 0
+    total: float = 0.0
+    fastest: float = math.inf
+    slowest: float = 0.0
+    samples: list[float] = field(default_factory=list)
+    polls: int = 0
+    timeouts: int = 0
+
+    # Durations kept for the percentiles, every satisfied wait having the same chance to be among them
+    reservoir_size: ClassVar[int] = 1024
+
+    def add(self, seconds: float):
+        self.satisfied += 1
+        self.total += seconds
+        self.fastest = min(self.fastest, seconds)
+        self.slowest = max(self.slowest, seconds)
+        if len(self.samples) < self.reservoir_size:
+            self.samples.append(seconds)
+        elif (index := random.randrange(self.satisfied)) < self.reservoir_size:
+            self.samples[index] = seconds
+
+    @property
+    def count(self) -> int:
+        return self.satisfied + self.timeouts
+
+    def percentile(self, percent: int) -> float:
+        if len(self.samples) < 2:
+            return max(self.samples, default=0.0)
+        return quantiles(self.samples, n=100, method='inclusive')[percent - 1]
+
+    def suggested_timeout(self, headroom: float = 2.0, min_samples: int = 20) -> float | None:
+        """
+        A tighter timeout covering the slowest satisfied waits with some headroom
+        :param headroom: Factor applied to the 99th percentile
+        :type headroom: float
+        :param min_samples: Satisfied waits needed before suggesting anything
+        :type min_samples: int
+        :return: The suggested timeout in seconds, rounded up to half a second, or None to keep the current one
+        :rtype: float | None
+        """
+        if self.satisfied < min_samples:
+            return None
+
+        suggested = max(0.5, math.ceil(self.percentile(99) * headroom * 2) / 2)
+        return suggested if suggested < self.timeout else None
+
+
+class WaitProfiler(object):
+    """
+    Records how long each wait took to be satisfied, how often it polled and timed out, per condition and call site.
+    Disabled until enable() is called.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = Lock()
+        self.stats: dict[tuple[str, str], WaitStats] = dict()
+
+    def call_site(self) -> str:
+        """
+        Where a wait was started, the first frame outside selenium_pom so waits are told apart by the page object
+        or script calling them rather than by the helpers and decorators in between
+        :return: 'file:line function' of the caller, or an empty string while disabled
+        :rtype: str
+        """
+        if not self.enabled:
+            return ''
+
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename.startswith(PACKAGE_DIR):
+            frame = frame.f_back
+        if frame is None:
+            return ''
+        return f'{frame.f_code.co_filename}:{frame.f_lineno} {frame.f_code.co_name}'
+
+    def disable(self) -> Self:
+        self.enabled = False
+        return self
+
+    def enable(self) -> Self:
+        self.enabled = True
+        return self
+
+    def record(self, condition: str, call_site: str, timeout: float, seconds: float, polls: int, timed_out: bool):
+        if not self.enabled:
+            return
+
+        with self.lock:
+            stats = self.stats.setdefault((condition, call_site), WaitStats(condition, call_site, timeout))
+            stats.timeout = max(stats.timeout, timeout)
+            stats.polls += polls
+            if timed_out:
+                stats.timeouts += 1
+            else:
+                stats.add(seconds)
+
+        logger.debug('%s at %s %s after %.3fs and %d polls', condition, call_site,
+                     'timed out' if timed_out else 'satisfied', seconds, polls)
+
+    def report(self) -> str:
+        """
+        Summarises every profiled wait, slowest call sites first, with a suggested timeout where one is tighter
+        :return: One line per condition and call site
+        :rtype: str
+        """
+        with self.lock:
+            stats = sorted(self.stats.values(), key=lambda item: item.total, reverse=True)
+
+        lines = list()
+        for item in stats:
+            suggested = item.suggested_timeout()
+            lines.append(f'{item.call_site} {item.condition}: {item.count} waits, p50 {item.percentile(50):.3f}s, '
+                         f'p95 {item.percentile(95):.3f}s, max {item.slowest:.3f}s, '
+                         f'{item.polls / max(item.count, 1):.1f} polls/wait, {item.timeouts} timeouts, '
+                         f'timeout {item.timeout:g}s' + (f' -> suggest {suggested:g}s' if suggested else ''))
+
+        return '\n'.join(lines)
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+
+    def suggestions(self) -> dict[tuple[str, str], float]:
+        with self.lock:
+            stats = list(self.stats.values())
+        return {(item.condition, item.call_site): suggested for item in stats
+                if (suggested := item.suggested_timeout()) is not None}
+
+
+# Shared profiler used by PageWait
+wait_profiler = WaitProfiler()
@@ -1,5 +1,16 @@
+from .AsyncBasePage import AsyncBasePage
+from .AsyncDriver import AsyncDriver
+from .AsyncDriver import AsyncElement
+from .AsyncPageWait import AsyncPageWait
+from .BackoffWait import BackoffWait
 from .BasePage import BasePage
 from .By import By
+from .ElementSnapshot import ElementSnapshot
 from .IgnorableExceptions import IgnorableExceptions
 from .Locator import Locator
+from .Metrics import Metrics
+from .Metrics import metrics
 from .PageWait import PageWait
+from .WaitProfiler import WaitProfiler
+from .WaitProfiler import WaitStats
+from .WaitProfiler import wait_profiler
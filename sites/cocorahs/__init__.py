@@ -3,12 +3,33 @@ from typing import Sequence
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from .daily_precip import DailyPrecipReports
+from .data import PrecipitationBatch
 from .data import PrecipitationRecord
+from .data import SpatialIndex
+from .data import StationRegistry
+from .grid_cache import GridCache
+from .high_water_mark import HighWaterMarks
 from .home import Home
+from .http_engine import HttpEngine
+from .list_stations import ListStations
+from .navbar import AsyncNavBar
 from .navbar import NavBar
+from .observation_store import ObservationStore
+from .pipeline import ParsePipeline
+from .range_planner import DateRange
+from .range_planner import RangePlanner
+from .report_list import ReportList
+from .scrape_pool import ScrapePool
+from .scrape_pool import Shard
+from .sinks import CsvSink
+from .sinks import ParquetSink
+from .sinks import RecordSink
+from .sinks import SqliteSink
 
 
-def get_data(driver: WebDriver) -> Sequence[PrecipitationRecord]:
+def get_data(driver: WebDriver, http: bool = False, cache: GridCache = None,
+             pipeline: ParsePipeline = None) -> Sequence[PrecipitationRecord]:
     driver.get(Home.url)
     Home(driver).navbar_link('Daily Precip')
-    return DailyPrecipReports(driver).all_data
+    engine = HttpEngine(DailyPrecipReports.url) if http else None
+    return DailyPrecipReports(driver, engine, cache, pipeline).all_data
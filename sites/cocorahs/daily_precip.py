@@ -1,6 +1,10 @@
+import asyncio
+import logging
 from datetime import date
 from datetime import timedelta
-from typing import Self
+from http.client import HTTPException
+from typing import AsyncIterator
+from typing import Iterator
 from typing import Sequence
 
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -8,63 +12,272 @@ from selenium.webdriver.remote.webelement import WebElement
 
 from selenium_pom import Locator
 from .data import Precipitation
+from .data import PrecipitationBatch
 from .data import PrecipitationRecord
+from .data import StationObservation
+from .data import StationRegistry
 from .enum import StationFilterType
-from .navbar import NavBar
+from .grid_cache import GridCache
+from .high_water_mark import HighWaterMarks
+from .http_engine import HttpEngine
+from .observation_store import ObservationStore
+from .pipeline import ParsePipeline
+from .range_planner import DateRange
+from .range_planner import RangePlanner
+from .report_list import ReportList
+
+logger = logging.getLogger(__name__)
 
 YESTERDAY = date.today() - timedelta(days=1)
 
 
-class DailyPrecipReports(NavBar):
+class DailyPrecipReports(ReportList):
     country_selection = Locator.css('select#frmPrecipReportSearch_ucStateCountyFilter_ddlCountry')
     country_selection_options = Locator.css('select#frmPrecipReportSearch_ucStateCountyFilter_ddlCountry option')
     county_selection = Locator.css('select#frmPrecipReportSearch_ucStateCountyFilter_ddlCounty')
     county_selection_options = Locator.css('select#frmPrecipReportSearch_ucStateCountyFilter_ddlCounty option')
+    date_range_start_input = Locator.css('input#frmPrecipReportSearch_ucDateRangeFilter_dcStartDate_t')
+    date_range_stop_input = Locator.css('input#frmPrecipReportSearch_ucDateRangeFilter_dcEndDate_t')
+    search_button = Locator.css('input#frmPrecipReportSearch_btnSearch')
     units_selection = Locator.css('select#obsSwitcher_ddlObsUnits')
     units_selection_options = Locator.css('select#obsSwitcher_ddlObsUnits option')
     url = "https://www.cocorahs.org/ViewData/ListDailyPrecipReports.aspx"
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver, engine: HttpEngine = None, cache: GridCache = None,
+                 pipeline: ParsePipeline = None):
         super().__init__(driver)
+        self.cache = cache
         self.data = list()
+        self.engine = engine
+        # Whether the last search was answered by the HTTP engine rather than the browser
+        self.engine_searched = False
+        # Parses the grids in other processes while the next page is fetched, instead of inline
+        self.pipeline = pipeline
+        # Filters applied besides the dates, part of the cache key
+        self.filters: dict[str, str] = dict()
 
     def __iter__(self):
         return iter(self.data)
 
     @property
     def all_data(self, stop_date: date = YESTERDAY) -> Sequence[PrecipitationRecord]:
-        num_of_days = (date.today() - stop_date).days
-        days = (date.today() - timedelta(days=i) for i in range(num_of_days))
-
-        for day in days:
-            self.filter_by_date(day).search()
-            pages = len(self.find_elements(Locator.css('select#ucReportList_wcDropDownListPager option')))
-            table = self.find_element(Locator.css('table#ucReportList_ReportGrid'))
-            self.data.extend(Precipitation(table.get_attribute('outerHtml')))
-
+        self.data.extend(self.iter_records(stop_date + timedelta(days=1), date.today()))
         return self.data
 
+    async def aiter_records(self, start_date: date, end_date: date) -> AsyncIterator[PrecipitationRecord]:
+        """
+        Asynchronous variant of iter_records, fetching and parsing each page in a worker thread
+        :param start_date: First day of the range
+        :type start_date: date
+        :param end_date: Last day of the range
+        :type end_date: date
+        :return: The records of each page as soon as it is parsed
+        :rtype: AsyncIterator[PrecipitationRecord]
+        """
+        pages = self.iter_range_pages(start_date, end_date)
+        while (records := await asyncio.to_thread(self.next_page_records, pages)) is not None:
+            for record in records:
+                yield record
+
     @property
     def county_dropdown(self) -> WebElement:
         return self.find_element(self.county_selection)
 
     @property
     def date_range_start(self) -> WebElement:
-        return self.find_element(Locator.css('input#frmPrecipReportSearch_ucDateRangeFilter_dcStartDate_t'))
+        return self.find_element(self.date_range_start_input)
 
     @property
     def date_range_stop(self) -> WebElement:
-        return self.find_element(Locator.css('input#frmPrecipReportSearch_ucDateRangeFilter_dcEndDate_t'))
+        return self.find_element(self.date_range_stop_input)
 
     def filter_by_date(self, start_date: date, end_date: date = None) -> 'DailyPrecipReports':
-        self.date_range_start.send_keys(f'{start_date:%m%d%Y}')
-        self.date_range_stop.send_keys(f'{end_date if end_date is not None else start_date:%m%d%Y}')
+        stop_date = end_date if end_date is not None else start_date
+        self.with_element(self.date_range_start_input, lambda element: element.clear())
+        self.send_keys(self.date_range_start_input, f'{start_date:%m%d%Y}')
+        self.with_element(self.date_range_stop_input, lambda element: element.clear())
+        self.send_keys(self.date_range_stop_input, f'{stop_date:%m%d%Y}')
         return self
 
     def filter_by_precipitation(self) -> 'DailyPrecipReports':
 
         return self
 
+    def iter_pages(self, start_date: date, end_date: date = None) -> Iterator[str | bytes]:
+        """
+        Searches the given dates and yields the report grid of every page, using the largest page size available
+        :param start_date: First day of the search
+        :type start_date: date
+        :param end_date: Last day of the search, defaults to the start date
+        :type end_date: date
+        :return: The outer HTML of the report grid for each page, as bytes when read from the browser
+        :rtype: Iterator[str | bytes]
+        """
+        # Pages already yielded by the HTTP engine, so the browser fallback resumes where it failed
+        done = 0
+        self.engine_searched = False
+        # The engine only replays the dates, searches narrowed by other filters go through the browser
+        if self.engine is not None and not self.filters:
+            try:
+                for html in self.engine.iter_pages(start_date, end_date):
+                    self.engine_searched = True
+                    yield html
+                    done += 1
+                return
+            except LookupError as error:
+                logger.warning('HTTP engine cannot replay the search form, using the browser from now on: %s', error)
+                self.engine = None
+            except (OSError, HTTPException) as error:
+                # HTTPException covers responses cut short, e.g. IncompleteRead
+                logger.warning('HTTP engine failed, falling back to the browser for this search: %s', error)
+
+        self.filter_by_date(start_date, end_date).search_at_largest_page_size()
+        yield from self.iter_grids(skip=done)
+
+    def iter_batches(self, start_date: date, end_date: date) -> Iterator[PrecipitationBatch]:
+        """
+        Streams a date range as one columnar batch per grid page
+        :param start_date: First day of the range
+        :type start_date: date
+        :param end_date: Last day of the range
+        :type end_date: date
+        :return: The batch of each page as soon as it is parsed
+        :rtype: Iterator[PrecipitationBatch]
+        """
+        if self.pipeline is not None:
+            yield from self.pipeline.batches(self.iter_range_pages(start_date, end_date))
+            return
+
+        for html in self.iter_range_pages(start_date, end_date):
+            yield Precipitation(html).batch()
+
+    def iter_records(self, start_date: date, end_date: date) -> Iterator[PrecipitationRecord]:
+        """
+        Streams the records of a date range without keeping them on the page object
+        :param start_date: First day of the range
+        :type start_date: date
+        :param end_date: Last day of the range
+        :type end_date: date
+        :return: The records of each page as soon as it is parsed
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        if self.pipeline is not None:
+            yield from self.pipeline.records(self.iter_range_pages(start_date, end_date))
+            return
+
+        for html in self.iter_range_pages(start_date, end_date):
+            yield from Precipitation(html)
+
+    def iter_new_records(self, marks: HighWaterMarks, end_date: date = None,
+                         first_date: date = YESTERDAY) -> Iterator[PrecipitationRecord]:
+        """
+        Scrapes only the days after the last run and its revision window, yielding new or revised records
+        :param marks: High-water marks of the previous runs, saved once the range is complete
+        :type marks: HighWaterMarks
+        :param end_date: Last day of the range, defaults to today
+        :type end_date: date
+        :param first_date: First day to scrape when there are no high-water marks yet
+        :type first_date: date
+        :return: The records that were not seen by a previous run, or changed since
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        end_date = end_date if end_date is not None else date.today()
+        for record in self.iter_records(marks.start_date(first_date), end_date):
+            if marks.update(record):
+                yield record
+
+        marks.save()
+
+    def iter_missing_records(self, store: ObservationStore, start_date: date, end_date: date = None,
+                             revision_days: int = 3) -> Iterator[PrecipitationRecord]:
+        """
+        Scrapes only the days of a range not yet searched with the current filters, plus the recent days being revised
+        :param store: Local observations, the yielded records are meant to be upserted into it
+        :type store: ObservationStore
+        :param start_date: First day of the range
+        :type start_date: date
+        :param end_date: Last day of the range, defaults to today
+        :type end_date: date
+        :param revision_days: Trailing days scraped again even when stored
+        :type revision_days: int
+        :return: The records of the missing days
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        end_date = end_date if end_date is not None else date.today()
+        revised = max(start_date, date.today() - timedelta(days=revision_days))
+        windows = store.missing(start_date, min(end_date, revised - timedelta(days=1)), self.filters)
+        if revised <= end_date:
+            windows.append(DateRange(revised, end_date))
+
+        for window in windows:
+            yield from self.iter_records(window.start, window.stop)
+            # Resumed once the consumer stored the whole window, days without any report included
+            store.mark_fetched(window.start, window.stop, self.filters)
+
+    def iter_observations(self, start_date: date, end_date: date,
+                          registry: StationRegistry) -> Iterator[StationObservation]:
+        """
+        Streams a date range as observations referencing their station, the station metadata kept by the registry
+        :param start_date: First day of the range
+        :type start_date: date
+        :param end_date: Last day of the range
+        :type end_date: date
+        :param registry: Stations seen so far, updated as the grids are parsed
+        :type registry: StationRegistry
+        :return: The observations of each page as soon as it is parsed
+        :rtype: Iterator[StationObservation]
+        """
+        for html in self.iter_range_pages(start_date, end_date):
+            yield from Precipitation(html, stations=registry)
+
+    def iter_range_pages(self, start_date: date, end_date: date,
+                         planner: RangePlanner = None) -> Iterator[str | bytes]:
+        """
+        Searches a date range in as few windows as possible, yielding the report grid of every page
+        :param start_date: First day of the range
+        :type start_date: date
+        :param end_date: Last day of the range
+        :type end_date: date
+        :param planner: Plans the search windows, defaults to the widest window the site serves
+        :type planner: RangePlanner
+        :return: The outer HTML of the report grid for each page
+        :rtype: Iterator[str | bytes]
+        """
+        planner = planner if planner is not None else RangePlanner(start_date, end_date)
+        for window in planner:
+            if self.cache is not None and (entry := self.cache.load(window, self.filters)) is not None:
+                if entry['too_large']:
+                    planner.split(window)
+                else:
+                    yield from entry['pages']
+                continue
+
+            pages = self.iter_pages(window.start, window.stop)
+            first = next(pages)
+            if planner.too_large(window, self.page_count):
+                pages.close()
+                if self.cache is not None:
+                    self.cache.mark_too_large(window, self.filters)
+                continue
+
+            fetched = [first]
+            yield first
+            for html in pages:
+                fetched.append(html)
+                yield html
+
+            if self.cache is not None:
+                self.cache.put(window, self.filters, fetched)
+
+    @staticmethod
+    def next_page_records(pages: Iterator[str | bytes]) -> list[PrecipitationRecord] | None:
+        html = next(pages, None)
+        return list(Precipitation(html)) if html is not None else None
+
+    @property
+    def page_count(self) -> int:
+        return len(self.engine.page_numbers) if self.engine_searched else self.pages
+
     def filter_by_station(self, station: str, filter_type: StationFilterType) -> 'DailyPrecipReports':
         if (self.station_number_check.get_property('value') == 'on') == (filter_type is StationFilterType.Name):
             self.station_number_check.click()
@@ -72,22 +285,23 @@ class DailyPrecipReports(NavBar):
             self.station_number_check.click()
 
         self.station_input.send_keys(station)
+        self.filters['station'] = f'{filter_type.name}:{station}'
         return self
 
-    def search(self) -> Self:
-        return self.click_element(Locator.css('input#frmPrecipReportSearch_btnSearch'))
-
     def select_country(self: 'DailyPrecipReports', country: str) -> 'DailyPrecipReports':
+        self.filters['country'] = country
         return self.select_option(self.country_selection, self.country_selection_options,
                                   lambda element: country in element.text)
 
     def select_county(self: 'DailyPrecipReports', county: str) -> 'DailyPrecipReports':
         if self.county_dropdown.is_enabled():
             self.select_option(self.county_selection, self.county_selection_options, lambda opt: county in opt.text)
+            self.filters['county'] = county
 
         return self
 
     def select_units(self: 'DailyPrecipReports', unit: str) -> 'DailyPrecipReports':
+        self.filters['units'] = unit
         return self.select_option(self.units_selection, self.units_selection_options,
                                   lambda element: unit in element.text or unit in element.get_attribute('value'))
 
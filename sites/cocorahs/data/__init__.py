@@ -1,2 +1,9 @@
+from .compact_record import CompactPrecipitationRecord
+from .compact_record import FrozenPrecipitationRecord
 from .precipitation import Precipitation
+from .precipitation_batch import PrecipitationBatch
 from .precipitation_record import PrecipitationRecord
+from .spatial_index import SpatialIndex
+from .station import Station
+from .station_observation import StationObservation
+from .station_registry import StationRegistry
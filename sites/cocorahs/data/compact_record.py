@@ -0,0 +1,41 @@
+from dataclasses import fields
+from dataclasses import make_dataclass
+from sys import intern
+from typing import Self
+
+from .precipitation_record import PrecipitationRecord
+
+
+class CompactRecord(object):
+    """
+    Behaviour shared by the slotted variants of PrecipitationRecord.
+    Repeated strings are interned and records hash on (station_num, observed).
+    """
+    __slots__ = ()
+    interned = ('county', 'state', 'station_name', 'station_num')
+
+    def __hash__(self) -> int:
+        return hash((self.station_num, self.observed))
+
+    @classmethod
+    def from_record(cls, record: PrecipitationRecord) -> Self:
+        values = {field.name: getattr(record, field.name) for field in fields(PrecipitationRecord)}
+        for name in cls.interned:
+            if values[name] is not None:
+                values[name] = intern(values[name])
+
+        return cls(**values)
+
+    @classmethod
+    def from_text(cls, *cells) -> Self:
+        return cls.from_record(PrecipitationRecord.from_text(*cells))
+
+
+def compact_record(name: str, frozen: bool) -> type:
+    return make_dataclass(name, [(field.name, field.type) for field in fields(PrecipitationRecord)],
+                          bases=(CompactRecord,), slots=True, frozen=frozen,
+                          namespace={'__hash__': CompactRecord.__hash__, '__module__': __name__})
+
+
+CompactPrecipitationRecord = compact_record('CompactPrecipitationRecord', frozen=False)
+FrozenPrecipitationRecord = compact_record('FrozenPrecipitationRecord', frozen=True)
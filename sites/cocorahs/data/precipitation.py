@@ -1,14 +1,98 @@
 import re
+from time import perf_counter
+from typing import Iterator
 
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
+from selenium_pom import metrics
+
+from ..enum import GridParser
+from .precipitation_batch import PrecipitationBatch
 from .precipitation_record import PrecipitationRecord
+from .station_registry import StationRegistry
+
+# Cell text of a grid row, in the argument order of PrecipitationRecord.from_text
+Cells = tuple[str, str, str, str, str, list[str], list[str], str, str, str]
 
 
 class Precipitation(object):
-    def __init__(self, html: str):
-        self.soup = BeautifulSoup(html, 'html.parser')
+    def __init__(self, html: str | bytes, parser: GridParser = GridParser.BeautifulSoup,
+                 record: type = PrecipitationRecord, stations: StationRegistry = None):
+        self.html = html
+        self.parser = parser
+        # PrecipitationRecord or one of its slotted variants
+        self.record = record
+        # Yields StationObservations instead of records when given, registering their stations
+        self.stations = stations
+        started = perf_counter()
+        self.soup = None
+        if parser is GridParser.BeautifulSoup:
+            # Bytes are read by BasePage.outer_html as UTF-8, left to guess the encoding they may come out as Latin-1
+            encoding = 'utf-8' if isinstance(html, bytes) else None
+            self.soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+        # Time spent building the soup, counted towards the first pass over the grid only
+        self.soup_elapsed = perf_counter() - started
+        # Parsing time of the latest pass, reported to the metrics once the grid is consumed
+        self.elapsed = 0.0
 
     def __iter__(self):
+        self.elapsed, self.soup_elapsed = self.soup_elapsed, 0.0
+        build = self.stations.observation if self.stations is not None else self.record.from_text
+        started = perf_counter()
+        for cells in self.iter_cells():
+            record = build(*cells)
+            self.elapsed += perf_counter() - started
+            yield record
+            started = perf_counter()
+
+        self.elapsed += perf_counter() - started
+        metrics.observe('parse', self.elapsed, parser=self.parser.name, output='records')
+
+    def batch(self, batch: PrecipitationBatch = None) -> PrecipitationBatch:
+        """
+        Fills a columnar batch straight from the grid, without building a record per row
+        :param batch: Batch to append to, defaults to a new one
+        :type batch: PrecipitationBatch
+        :return: The filled batch
+        :rtype: PrecipitationBatch
+        """
+        batch = batch if batch is not None else PrecipitationBatch()
+        self.elapsed, self.soup_elapsed = self.soup_elapsed, 0.0
+        started = perf_counter()
+        for cells in self.iter_cells():
+            batch.append_text(*cells)
+
+        self.elapsed += perf_counter() - started
+        metrics.observe('parse', self.elapsed, parser=self.parser.name, output='batch')
+        return batch
+
+    def iter_cells(self) -> Iterator[Cells]:
+        if self.parser is GridParser.Lxml:
+            yield from self.iter_lxml()
+            return
+
         for tr in self.soup.find_all('tr', class_=re.compile('item', re.IGNORECASE)):
-            yield PrecipitationRecord.from_tr(tr)
+            _date, _time, _num, _name, _gauge, _snowfall, _snowpack, state, county, _, _maps = tr.find_all('td')
+            yield (_date.text, _time.text, _num.text, _name.text, _gauge.text,
+                   [span.text for span in _snowfall.find_all('span')],
+                   [span.text for span in _snowpack.find_all('span')],
+                   state.text, county.text, _maps.a['href'])
+
+    def iter_lxml(self) -> Iterator[Cells]:
+        # One pass over the rows of the grid, reading the cells straight off the lxml tree
+        if not self.html or not self.html.strip():
+            return
+
+        # lxml reads bytes without a meta charset as Latin-1
+        parser = lxml_html.HTMLParser(encoding='utf-8') if isinstance(self.html, bytes) else None
+        for tr in lxml_html.fromstring(self.html, parser=parser).iter('tr'):
+            if 'item' not in tr.get('class', '').lower():
+                continue
+
+            _date, _time, _num, _name, _gauge, _snowfall, _snowpack, state, county, _, _maps = tr.findall('td')
+            yield (_date.text_content(), _time.text_content(), _num.text_content(), _name.text_content(),
+                   _gauge.text_content(),
+                   [span.text_content() for span in _snowfall.iter('span')],
+                   [span.text_content() for span in _snowpack.iter('span')],
+                   state.text_content(), county.text_content(), _maps.find('.//a').get('href'))
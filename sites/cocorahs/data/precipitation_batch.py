@@ -0,0 +1,174 @@
+from array import array
+from calendar import timegm
+from datetime import datetime
+from datetime import timedelta
+from math import isnan
+from math import nan
+from typing import Iterable
+from typing import Iterator
+from typing import Self
+from typing import Sequence
+
+from .precipitation_record import PrecipitationRecord
+
+
+class PrecipitationBatch(object):
+    """
+    Columnar store of precipitation observations, one typed array per field.
+    Missing (NA) values are NaN in the float columns and flagged in the matching mask,
+    observed times are seconds since the epoch of the station's local time.
+    """
+    float_columns = ('gauge_catch', 'latitude', 'longitude', 'snowfall_depth', 'snowfall_liquid', 'snowfall_ratio',
+                     'snowpack_density', 'snowpack_depth', 'snowpack_liquid')
+    text_columns = ('county', 'state', 'station_name', 'station_num')
+    # Order of the values in iter_rows
+    row_columns = ('observed', 'is_trace', *float_columns, *text_columns)
+    # Observed times as stored in SQLite: sorts and compares as text, and matches SQLite's own datetime functions
+    sqlite_observed_format = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self):
+        self.observed = array('q')
+        self.is_trace = array('b')
+        self.columns: dict[str, array] = {column: array('d') for column in self.float_columns}
+        self.missing: dict[str, array] = {column: array('b') for column in self.float_columns}
+        self.text: dict[str, list[str]] = {column: list() for column in self.text_columns}
+
+    def __getattr__(self, name: str) -> array | list[str]:
+        for columns in ('columns', 'text'):
+            if name in self.__dict__.get(columns, ()):
+                return self.__dict__[columns][name]
+        raise AttributeError(name)
+
+    def __getitem__(self, rows: slice) -> 'PrecipitationBatch':
+        """
+        A copy of a range of rows, e.g. batch[:50_000]
+        :param rows: The rows to copy
+        :type rows: slice
+        :raises TypeError: Thrown when rows is not a slice
+        :return: A new batch holding the rows
+        :rtype: PrecipitationBatch
+        """
+        if not isinstance(rows, slice):
+            raise TypeError(f'PrecipitationBatch indices must be slices, not {type(rows).__name__}')
+
+        batch = PrecipitationBatch()
+        batch.observed = self.observed[rows]
+        batch.is_trace = self.is_trace[rows]
+        batch.columns = {column: values[rows] for column, values in self.columns.items()}
+        batch.missing = {column: values[rows] for column, values in self.missing.items()}
+        batch.text = {column: values[rows] for column, values in self.text.items()}
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.observed)
+
+    def append(self, record: PrecipitationRecord) -> Self:
+        self.observed.append(timegm(record.observed.timetuple()))
+        self.is_trace.append(record.is_trace)
+        for column in self.float_columns:
+            self.append_float(column, getattr(record, column))
+        for column in self.text_columns:
+            self.text[column].append(getattr(record, column))
+
+        return self
+
+    def append_float(self, column: str, value: float | None):
+        is_missing = value is None or isnan(value)
+        self.columns[column].append(nan if is_missing else value)
+        self.missing[column].append(is_missing)
+
+    def append_text(self, _date: str, _time: str, _num: str, _name: str, _gauge: str, _snowfall: Sequence[str],
+                    _snowpack: Sequence[str], state: str, county: str, href: str) -> Self:
+        """
+        Appends a grid row from its cell text, the columnar counterpart of PrecipitationRecord.from_text
+        :return: The current batch
+        :rtype: self
+        """
+        is_trace, gauge = PrecipitationRecord.derive_gauge(_gauge)
+        latitude, longitude = PrecipitationRecord.url_to_location(href)
+        observed = PrecipitationRecord.derive_datetime(_date, _time)
+        snowfall = PrecipitationRecord.derive_snowfall(_snowfall)
+        snowpack_depth, snowpack_liquid, snowpack_density = PrecipitationRecord.derive_snowpack(_snowpack)
+
+        self.observed.append(timegm(observed.timetuple()))
+        self.is_trace.append(is_trace)
+        for column, value in zip(self.float_columns, (gauge, latitude, longitude, *snowfall, snowpack_density,
+                                                      snowpack_depth, snowpack_liquid)):
+            self.append_float(column, value)
+        for column, value in zip(self.text_columns, (county, state, _name, _num)):
+            self.text[column].append(value.strip())
+
+        return self
+
+    def extend(self, batch: 'PrecipitationBatch') -> Self:
+        self.observed.extend(batch.observed)
+        self.is_trace.extend(batch.is_trace)
+        for column in self.float_columns:
+            self.columns[column].extend(batch.columns[column])
+            self.missing[column].extend(batch.missing[column])
+        for column in self.text_columns:
+            self.text[column].extend(batch.text[column])
+
+        return self
+
+    @classmethod
+    def from_records(cls, records: Iterable[PrecipitationRecord]) -> 'PrecipitationBatch':
+        batch = cls()
+        for record in records:
+            batch.append(record)
+
+        return batch
+
+    def iter_rows(self, observed_format: str = None) -> Iterator[tuple]:
+        """
+        Yields the batch row by row in row_columns order, with None for the missing values
+        :param observed_format: strftime format of the observed time, defaults to a naive datetime
+        :type observed_format: str
+        :return: A tuple per observation
+        :rtype: Iterator[tuple]
+        """
+        # Most rows of a batch share a handful of observation times
+        times = {observed: datetime(1970, 1, 1) + timedelta(seconds=observed) for observed in set(self.observed)}
+        if observed_format is not None:
+            times = {observed: f'{value:{observed_format}}' for observed, value in times.items()}
+
+        floats = [[None if missing else value for value, missing in zip(self.columns[column], self.missing[column])]
+                  for column in self.float_columns]
+        for observed, is_trace, *values in zip(self.observed, self.is_trace, *floats,
+                                               *(self.text[column] for column in self.text_columns)):
+            yield times[observed], bool(is_trace), *values
+
+    def to_arrow(self):
+        """
+        Converts the batch to a pyarrow Table, with nulls for the missing values. Requires pyarrow.
+        :rtype: pyarrow.Table
+        """
+        import pyarrow
+
+        columns = {'observed': pyarrow.array(self.observed, pyarrow.timestamp('s')),
+                   'is_trace': pyarrow.array(self.is_trace, pyarrow.bool_())}
+        for column in self.float_columns:
+            columns[column] = pyarrow.array(self.columns[column], pyarrow.float64(),
+                                            mask=pyarrow.array(self.missing[column], pyarrow.bool_()))
+        for column in self.text_columns:
+            columns[column] = pyarrow.array(self.text[column], pyarrow.string())
+
+        return pyarrow.table(columns)
+
+    def to_numpy(self) -> dict:
+        """
+        Converts the batch to NumPy arrays without copying the numeric columns. Requires numpy.
+        Masks are returned under '<column>_missing'.
+        :rtype: dict[str, numpy.ndarray]
+        """
+        import numpy
+
+        columns = {'observed': numpy.frombuffer(self.observed, numpy.int64).view('datetime64[s]'),
+                   'is_trace': numpy.frombuffer(self.is_trace, numpy.int8).view(numpy.bool_)}
+        for column in self.float_columns:
+            columns[column] = numpy.frombuffer(self.columns[column], numpy.float64)
+            columns[f'{column}_missing'] = numpy.frombuffer(self.missing[column], numpy.int8).view(numpy.bool_)
+        for column in self.text_columns:
+            columns[column] = numpy.array(self.text[column], dtype=object)
+
+        return columns
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import Sequence
 from typing import Tuple
 from urllib.parse import parse_qs, urlparse
 
@@ -30,29 +32,36 @@ class PrecipitationRecord(object):
     @classmethod
     def from_tr(cls, tr: Tag) -> 'PrecipitationRecord':
         _date, _time, _num, _name, _gauge, _snowfall, _snowpack, state, county, _, _maps = tr.find_all('td')
-        _sp_depth, _sp_liquid, _sp_density = _snowpack.find_all('span')
+        return cls.from_text(_date.text, _time.text, _num.text, _name.text, _gauge.text,
+                             [span.text for span in _snowfall.find_all('span')],
+                             [span.text for span in _snowpack.find_all('span')],
+                             state.text, county.text, _maps.a['href'])
 
+    @classmethod
+    def from_text(cls, _date: str, _time: str, _num: str, _name: str, _gauge: str, _snowfall: Sequence[str],
+                  _snowpack: Sequence[str], state: str, county: str, href: str) -> 'PrecipitationRecord':
         is_trace, gauge = cls.derive_gauge(_gauge)
-        latitude, longitude = cls.url_to_location(_maps.a['href'])
+        latitude, longitude = cls.url_to_location(href)
         observed = cls.derive_datetime(_date, _time)
         snowfall_depth, snowfall_liquid, snowfall_ratio = cls.derive_snowfall(_snowfall)
         snowpack_depth, snowpack_liquid, snowpack_density = cls.derive_snowpack(_snowpack)
 
-        return cls(county, gauge, is_trace, observed, latitude, longitude, snowfall_depth, snowfall_liquid,
-                   snowfall_ratio, snowpack_density, snowpack_depth, snowpack_liquid, state, _name, _num)
+        return cls(county.strip(), gauge, is_trace, observed, latitude, longitude, snowfall_depth, snowfall_liquid,
+                   snowfall_ratio, snowpack_density, snowpack_depth, snowpack_liquid, state.strip(), _name.strip(),
+                   _num.strip())
 
     @staticmethod
-    def derive_datetime(_date: Tag, _time: Tag) -> datetime:
-        return datetime.strptime(f'{_date.text} {_time.text}', '%m/%d/%Y %I:%M %p')
+    def derive_datetime(_date: str, _time: str) -> datetime:
+        return datetime.strptime(f'{_date.strip()} {_time.strip()}', '%m/%d/%Y %I:%M %p')
 
     @staticmethod
-    def derive_gauge(_gauge: Tag) -> Tuple[bool, float]:
-        is_trace = _gauge.text.upper() == 'T'
-        return is_trace, 0.0 if is_trace else float(_gauge.text)
+    def derive_gauge(_gauge: str) -> Tuple[bool, float]:
+        is_trace = _gauge.strip().upper() == 'T'
+        return is_trace, 0.0 if is_trace else float(_gauge)
 
     @staticmethod
-    def derive_snowfall(snowfall: Tag) -> Tuple[float, float, float]:
-        sf_depth, sf_liquid, sf_ratio = map(lambda t: t.text.upper(), snowfall.find_all('span'))
+    def derive_snowfall(snowfall: Sequence[str]) -> Tuple[float, float, float]:
+        sf_depth, sf_liquid, sf_ratio = map(lambda t: t.strip().upper(), snowfall)
         depth = None if sf_depth == 'NA' else float(sf_depth)
         liquid = None if sf_liquid == 'NA' else float(sf_liquid)
         ratio = round(depth / liquid, 1) if depth and liquid else None
@@ -60,8 +69,8 @@ class PrecipitationRecord(object):
         return depth, liquid, ratio
 
     @staticmethod
-    def derive_snowpack(snowpack: Tag) -> Tuple[float, float, float]:
-        sp_depth, sp_liquid, sp_ratio = map(lambda t: t.text.upper(), snowpack.find_all('span'))
+    def derive_snowpack(snowpack: Sequence[str]) -> Tuple[float, float, float]:
+        sp_depth, sp_liquid, sp_ratio = map(lambda t: t.strip().upper(), snowpack)
         depth = None if sp_depth == 'NA' else float(sp_depth)
         liquid = None if sp_liquid == 'NA' else float(sp_liquid)
         density = round(liquid / depth, 2) if depth and liquid else None
@@ -69,6 +78,7 @@ class PrecipitationRecord(object):
         return depth, liquid, density
 
     @staticmethod
+    @lru_cache(maxsize=2 ** 16)
     def url_to_location(href: str) -> Tuple[float, float]:
         url = urlparse(href)
         query = parse_qs(url.query)
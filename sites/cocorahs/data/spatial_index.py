@@ -0,0 +1,230 @@
+import heapq
+from math import asin
+from math import cos
+from math import isnan
+from math import pi
+from math import radians
+from math import sin
+from math import sqrt
+from typing import Hashable
+from typing import Iterable
+from typing import Sequence
+
+from .precipitation_record import PrecipitationRecord
+from .station import Station
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Internal nodes are (axis, split, left, right), leaves are lists of point indices
+Node = tuple | list
+
+
+def unit_vector(latitude: float, longitude: float) -> tuple[float, float, float]:
+    phi, lam = radians(latitude), radians(longitude)
+    return cos(phi) * cos(lam), cos(phi) * sin(lam), sin(phi)
+
+
+def chord(km: float) -> float:
+    # Straight-line distance through the unit sphere matching a great-circle distance
+    return 2 * sin(min(km / EARTH_RADIUS_KM, pi) / 2)
+
+
+def chord_to_km(length: float) -> float:
+    return 2 * asin(min(1.0, length / 2)) * EARTH_RADIUS_KM
+
+
+class SpatialIndex(object):
+    """
+    KD-tree over station locations, as points on the unit sphere so distances hold across the whole globe.
+    Answers radius, nearest-neighbour, bounding-box and polygon queries with the ids of the matching points,
+    visiting only the branches that can contain a match.
+    """
+    leaf_size = 16
+
+    def __init__(self, points: Iterable[tuple[Hashable, float, float]]):
+        """
+        :param points: (id, latitude, longitude) of each point, points without a location are left out
+        :type points: Iterable[tuple[Hashable, float, float]]
+        """
+        self.ids: list[Hashable] = list()
+        self.latitudes: list[float] = list()
+        self.longitudes: list[float] = list()
+        self.vectors: list[tuple[float, float, float]] = list()
+        for point_id, latitude, longitude in points:
+            if latitude is None or longitude is None or isnan(latitude) or isnan(longitude):
+                continue
+            self.ids.append(point_id)
+            self.latitudes.append(latitude)
+            self.longitudes.append(longitude)
+            self.vectors.append(unit_vector(latitude, longitude))
+
+        self.root = self.build(list(range(len(self.ids))))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def build(self, indices: list[int]) -> Node:
+        if len(indices) <= self.leaf_size:
+            return indices
+
+        # Split on the axis the points spread the most along
+        axis = max(range(3), key=lambda dimension: max(self.vectors[index][dimension] for index in indices) -
+                   min(self.vectors[index][dimension] for index in indices))
+        indices.sort(key=lambda index: self.vectors[index][axis])
+        middle = len(indices) // 2
+        return axis, self.vectors[indices[middle]][axis], self.build(indices[:middle]), self.build(indices[middle:])
+
+    def bbox(self, south: float, west: float, north: float, east: float) -> list[Hashable]:
+        """
+        Points inside a latitude/longitude box, west greater than east for a box across the antimeridian
+        :param south: Lowest latitude
+        :type south: float
+        :param west: Western longitude
+        :type west: float
+        :param north: Highest latitude
+        :type north: float
+        :param east: Eastern longitude
+        :type east: float
+        :return: The ids of the points inside the box
+        :rtype: list[Hashable]
+        """
+        return [self.ids[index] for index in self.bbox_indices(south, west, north, east)]
+
+    def bbox_indices(self, south: float, west: float, north: float, east: float) -> list[int]:
+        width = east - west if 0 <= east - west <= 360 else (east - west) % 360
+        if width > 180:
+            # The cap around a box this wide would cover most of the globe anyway
+            candidates = range(len(self.ids))
+        else:
+            center = unit_vector((south + north) / 2, west + width / 2)
+            corners = [unit_vector(latitude, longitude) for latitude in (south, north) for longitude in (west, east)]
+            candidates = self.within_chord(center, max(sqrt(self.squared(center, corner)) for corner in corners))
+
+        return [index for index in candidates if south <= self.latitudes[index] <= north
+                and (self.longitudes[index] - west) % 360 <= width]
+
+    @classmethod
+    def from_records(cls, records: Iterable[PrecipitationRecord], by_station: bool = True) -> 'SpatialIndex':
+        """
+        Indexes the locations of parsed records
+        :param records: The records to index
+        :type records: Iterable[PrecipitationRecord]
+        :param by_station: Index each station once by its number, otherwise each record by its position
+        :type by_station: bool
+        :return: The index
+        :rtype: SpatialIndex
+        """
+        if by_station:
+            stations = {record.station_num: (record.latitude, record.longitude) for record in records}
+            return cls((station_num, *location) for station_num, location in stations.items())
+
+        return cls((index, record.latitude, record.longitude) for index, record in enumerate(records))
+
+    @classmethod
+    def from_stations(cls, stations: Iterable[Station]) -> 'SpatialIndex':
+        return cls((station.station_num, station.latitude, station.longitude) for station in stations)
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> list[Hashable]:
+        """
+        The k points closest to a location
+        :param latitude: Latitude of the location
+        :type latitude: float
+        :param longitude: Longitude of the location
+        :type longitude: float
+        :param k: Number of points to return
+        :type k: int
+        :return: The ids of the closest points, nearest first
+        :rtype: list[Hashable]
+        """
+        return [self.ids[index] for _, index in self.nearest_indices(latitude, longitude, k)]
+
+    def nearest_indices(self, latitude: float, longitude: float, k: int) -> list[tuple[float, int]]:
+        target = unit_vector(latitude, longitude)
+        # Max-heap of the best candidates so far, by negated squared chord
+        best: list[tuple[float, int]] = list()
+
+        def visit(node: Node):
+            if isinstance(node, list):
+                for index in node:
+                    distance = self.squared(target, self.vectors[index])
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, index))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, index))
+                return
+
+            axis, split, left, right = node
+            offset = target[axis] - split
+            near, far = (left, right) if offset < 0 else (right, left)
+            visit(near)
+            if len(best) < k or offset * offset < -best[0][0]:
+                visit(far)
+
+        if k > 0:
+            visit(self.root)
+        return sorted((chord_to_km(sqrt(-distance)), index) for distance, index in best)
+
+    def polygon(self, vertices: Sequence[tuple[float, float]]) -> list[Hashable]:
+        """
+        Points inside a polygon, tested in the latitude/longitude plane
+        :param vertices: (latitude, longitude) of each vertex, the polygon closes on its own
+        :type vertices: Sequence[tuple[float, float]]
+        :return: The ids of the points inside the polygon
+        :rtype: list[Hashable]
+        """
+        latitudes = [latitude for latitude, _ in vertices]
+        longitudes = [longitude for _, longitude in vertices]
+        candidates = self.bbox_indices(min(latitudes), min(longitudes), max(latitudes), max(longitudes))
+        return [self.ids[index] for index in candidates
+                if self.contains(vertices, self.latitudes[index], self.longitudes[index])]
+
+    @staticmethod
+    def contains(vertices: Sequence[tuple[float, float]], latitude: float, longitude: float) -> bool:
+        # Even-odd rule, casting a ray towards increasing longitude
+        inside = False
+        previous_latitude, previous_longitude = vertices[-1]
+        for vertex_latitude, vertex_longitude in vertices:
+            if (vertex_latitude > latitude) != (previous_latitude > latitude):
+                crossing = vertex_longitude + (latitude - vertex_latitude) * (previous_longitude - vertex_longitude) \
+                           / (previous_latitude - vertex_latitude)
+                if longitude < crossing:
+                    inside = not inside
+            previous_latitude, previous_longitude = vertex_latitude, vertex_longitude
+
+        return inside
+
+    def radius(self, latitude: float, longitude: float, km: float) -> list[Hashable]:
+        """
+        Points within a great-circle distance of a location
+        :param latitude: Latitude of the location
+        :type latitude: float
+        :param longitude: Longitude of the location
+        :type longitude: float
+        :param km: Distance in kilometres
+        :type km: float
+        :return: The ids of the points within the distance
+        :rtype: list[Hashable]
+        """
+        return [self.ids[index] for index in self.within_chord(unit_vector(latitude, longitude), chord(km))]
+
+    @staticmethod
+    def squared(a: tuple[float, float, float], b: tuple[float, float, float]) -> float:
+        return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+    def within_chord(self, target: tuple[float, float, float], length: float) -> list[int]:
+        limit = length * length
+        found = list()
+        pending = [self.root]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, list):
+                found.extend(index for index in node if self.squared(target, self.vectors[index]) <= limit)
+                continue
+
+            axis, split, left, right = node
+            if target[axis] - length <= split:
+                pending.append(left)
+            if target[axis] + length >= split:
+                pending.append(right)
+
+        return found
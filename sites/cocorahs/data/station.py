@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Station(object):
+    station_num: str
+    station_name: str
+    state: str
+    county: str
+    latitude: float
+    longitude: float
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Sequence
+from typing import Self
+
+from .precipitation_record import PrecipitationRecord
+from .station import Station
+
+
+@dataclass(slots=True)
+class StationObservation(object):
+    """A PrecipitationRecord without the station metadata, which is kept once per station by a StationRegistry"""
+    station_num: str
+    observed: datetime
+    gauge_catch: float
+    is_trace: bool
+    snowfall_depth: float
+    snowfall_liquid: float
+    snowfall_ratio: float
+    snowpack_density: float
+    snowpack_depth: float
+    snowpack_liquid: float
+
+    @classmethod
+    def from_text(cls, station_num: str, _date: str, _time: str, _gauge: str, _snowfall: Sequence[str],
+                  _snowpack: Sequence[str]) -> Self:
+        is_trace, gauge = PrecipitationRecord.derive_gauge(_gauge)
+        snowfall_depth, snowfall_liquid, snowfall_ratio = PrecipitationRecord.derive_snowfall(_snowfall)
+        snowpack_depth, snowpack_liquid, snowpack_density = PrecipitationRecord.derive_snowpack(_snowpack)
+
+        return cls(station_num, PrecipitationRecord.derive_datetime(_date, _time), gauge, is_trace, snowfall_depth,
+                   snowfall_liquid, snowfall_ratio, snowpack_density, snowpack_depth, snowpack_liquid)
+
+    def to_record(self, station: Station) -> PrecipitationRecord:
+        return PrecipitationRecord(station.county, self.gauge_catch, self.is_trace, self.observed, station.latitude,
+                                   station.longitude, self.snowfall_depth, self.snowfall_liquid, self.snowfall_ratio,
+                                   self.snowpack_density, self.snowpack_depth, self.snowpack_liquid, station.state,
+                                   station.station_name, self.station_num)
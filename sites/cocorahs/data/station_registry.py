@@ -0,0 +1,166 @@
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from sys import intern
+from typing import Iterable
+from typing import Iterator
+from typing import Self
+from typing import Sequence
+
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
+
+from .precipitation_record import PrecipitationRecord
+from .station import Station
+from .station_observation import StationObservation
+
+# Header keywords of the List Stations grid, matched case-insensitively in column order
+HEADERS = {
+    'station_num': ('number', 'station #'),
+    'station_name': ('name',),
+    'state': ('state',),
+    'county': ('county',),
+    'latitude': ('lat',),
+    'longitude': ('lon',),
+}
+
+
+class StationRegistry(object):
+    """
+    Station metadata keyed by station number, seeded from the List Stations report and kept up to date as grids
+    are parsed. Grid rows of a known station only cost a few string comparisons, their maps link is not parsed again.
+    """
+
+    def __init__(self, path: str | os.PathLike = None):
+        self.path = Path(path) if path is not None else None
+        self.stations: dict[str, Station] = dict()
+        # Maps link each station was last seen with, a changed link means the station moved
+        self.hrefs: dict[str, str] = dict()
+        if self.path is not None:
+            self.load()
+
+    def __contains__(self, station_num: str) -> bool:
+        return station_num in self.stations
+
+    def __getitem__(self, station_num: str) -> Station:
+        return self.stations[station_num]
+
+    def __iter__(self):
+        return iter(self.stations.values())
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def add(self, station: Station) -> Station:
+        station = Station(*(intern(value) if isinstance(value, str) else value for value in
+                            (station.station_num, station.station_name, station.state, station.county,
+                             station.latitude, station.longitude)))
+        self.stations[station.station_num] = station
+        return station
+
+    def load(self) -> Self:
+        try:
+            state = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return self
+
+        for values in state['stations']:
+            self.add(Station(**values))
+        self.hrefs = state['hrefs']
+        return self
+
+    def observation(self, _date: str, _time: str, _num: str, _name: str, _gauge: str, _snowfall: Sequence[str],
+                    _snowpack: Sequence[str], state: str, county: str, href: str) -> StationObservation:
+        """
+        Builds the observation of a grid row from its cell text, registering its station,
+        e.g. for Precipitation(html, stations=registry)
+        :return: The observation, referencing its station by number
+        :rtype: StationObservation
+        """
+        station = self.station(_num, _name, state, county, href)
+        return StationObservation.from_text(station.station_num, _date, _time, _gauge, _snowfall, _snowpack)
+
+    def record(self, observation: StationObservation) -> PrecipitationRecord:
+        return observation.to_record(self.stations[observation.station_num])
+
+    def records(self, observations: Iterable[StationObservation]) -> Iterator[PrecipitationRecord]:
+        for observation in observations:
+            yield self.record(observation)
+
+    def save(self):
+        state = {'stations': [asdict(station) for station in self.stations.values()], 'hrefs': self.hrefs}
+        partial = self.path.with_suffix('.tmp')
+        partial.write_text(json.dumps(state), encoding='utf-8')
+        partial.replace(self.path)
+
+    def seed(self, html: str | bytes) -> int:
+        """
+        Registers the stations of a List Stations report grid, locating the columns by their header
+        :param html: Outer HTML of the report grid
+        :type html: str | bytes
+        :raises LookupError: Thrown when the station number column is missing
+        :return: Number of stations read
+        :rtype: int
+        """
+        if not html or not html.strip():
+            return 0
+
+        # lxml reads bytes without a meta charset as Latin-1, the grid is fetched as UTF-8
+        parser = lxml_html.HTMLParser(encoding='utf-8') if isinstance(html, bytes) else None
+        rows = iter(lxml_html.fromstring(html, parser=parser).iter('tr'))
+        header = [cell.text_content().strip().lower() for cell in next(rows, ()) if cell.tag in ('td', 'th')]
+        columns = dict()
+        for name, keywords in HEADERS.items():
+            columns[name] = next((index for index, text in enumerate(header) if index not in columns.values()
+                                  and any(keyword in text for keyword in keywords)), None)
+        if columns['station_num'] is None:
+            raise LookupError(f'Unable to find the station number column in {header}')
+
+        count = 0
+        for tr in rows:
+            cells = [cell.text_content().strip() for cell in tr.findall('td')]
+            if len(cells) < len(header):
+                continue
+
+            values = {name: cells[index] if index is not None else '' for name, index in columns.items()}
+            latitude, longitude = self.location(tr, values['latitude'], values['longitude'])
+            self.add(Station(values['station_num'], values['station_name'], values['state'], values['county'],
+                             latitude, longitude))
+            count += 1
+
+        return count
+
+    @staticmethod
+    def location(tr: HtmlElement, latitude: str, longitude: str) -> tuple[float | None, float | None]:
+        try:
+            return float(latitude), float(longitude)
+        except ValueError:
+            pass
+
+        # Without coordinate columns, fall back on the maps link of the row
+        for link in tr.iter('a'):
+            if 'center=' in link.get('href', ''):
+                return PrecipitationRecord.url_to_location(link.get('href'))
+        return None, None
+
+    def station(self, _num: str, _name: str, state: str, county: str, href: str) -> Station:
+        """
+        The station of a grid row, parsing the row only when it is new or changed
+        :return: The registered station
+        :rtype: Station
+        """
+        station_num = _num.strip()
+        known = self.stations.get(station_num)
+        if known is not None and self.hrefs.get(station_num) == href and known.station_name == _name.strip() \
+                and known.state == state.strip() and known.county == county.strip():
+            return known
+
+        if known is not None and self.hrefs.get(station_num) in (href, None) and known.latitude is not None:
+            # Seeded from the List Stations report, the link holds nothing new
+            latitude, longitude = known.latitude, known.longitude
+        else:
+            latitude, longitude = PrecipitationRecord.url_to_location(href)
+
+        self.hrefs[station_num] = href
+        return self.add(Station(station_num, _name.strip(), state.strip(), county.strip(), latitude, longitude))
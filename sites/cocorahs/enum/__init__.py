@@ -1 +1,2 @@
+from .grid_parser import GridParser
 from .station_filter_type import StationFilterType
@@ -0,0 +1,7 @@
+from enum import auto
+from enum import Enum
+
+
+class GridParser(Enum):
+    BeautifulSoup = auto()
+    Lxml = auto()
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from datetime import date
+from datetime import timedelta
+from pathlib import Path
+from time import time
+
+from .range_planner import DateRange
+
+
+class GridCache(object):
+    """
+    On-disk cache of report grid pages, keyed by search window and filters.
+    Windows ending in the last few days can still be revised and expire after a TTL,
+    older windows are kept until the cache outgrows its size cap and evicts the least recently used.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 512 * 2 ** 20, recent_days: int = 7,
+                 ttl: timedelta = timedelta(hours=6)):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.recent_days = recent_days
+        self.ttl = ttl
+        # Size of every entry, least recently used first, read from the directory once and kept up to date after
+        self.sizes: OrderedDict[Path, int] = OrderedDict()
+        for path, stat in sorted(((path, path.stat()) for path in self.directory.glob('*.json')),
+                                 key=lambda item: item[1].st_mtime):
+            self.sizes[path] = stat.st_size
+        self.size = sum(self.sizes.values())
+
+    def discard(self, path: Path):
+        self.size -= self.sizes.pop(path, 0)
+        path.unlink(missing_ok=True)
+
+    def evict(self):
+        while self.sizes and self.size > self.max_bytes:
+            self.discard(next(iter(self.sizes)))
+
+    def get(self, window: DateRange, filters: dict[str, str]) -> list[str] | None:
+        """
+        Returns the cached grid pages of a search
+        :param window: The searched dates
+        :type window: DateRange
+        :param filters: Search filters besides the dates
+        :type filters: dict[str, str]
+        :return: The outer HTML of every page, or None if the search is not cached
+        :rtype: list[str] | None
+        """
+        entry = self.load(window, filters)
+        return entry['pages'] if entry is not None and not entry['too_large'] else None
+
+    def key(self, window: DateRange, filters: dict[str, str]) -> str:
+        query = {'start': window.start.isoformat(), 'stop': window.stop.isoformat(), 'filters': filters}
+        return hashlib.sha256(json.dumps(query, sort_keys=True).encode()).hexdigest()
+
+    def load(self, window: DateRange, filters: dict[str, str]) -> dict | None:
+        """
+        Reads the cache entry of a search once, to check both whether it was too large and its pages
+        :param window: The searched dates
+        :type window: DateRange
+        :param filters: Search filters besides the dates
+        :type filters: dict[str, str]
+        :return: The entry with its 'pages' and 'too_large' flag, or None if the search is not cached
+        :rtype: dict | None
+        """
+        path = self.path(window, filters)
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+        if entry['expires'] is not None and entry['expires'] < time():
+            self.discard(path)
+            return None
+
+        # The modification time doubles as the last access time for LRU eviction across runs
+        os.utime(path)
+        if path in self.sizes:
+            self.sizes.move_to_end(path)
+        return entry
+
+    def mark_too_large(self, window: DateRange, filters: dict[str, str]):
+        self.save(window, filters, list(), too_large=True)
+
+    def path(self, window: DateRange, filters: dict[str, str]) -> Path:
+        return self.directory / f'{self.key(window, filters)}.json'
+
+    def put(self, window: DateRange, filters: dict[str, str], pages: list[str | bytes]):
+        self.save(window, filters, [page.decode() if isinstance(page, bytes) else page for page in pages],
+                  too_large=False)
+
+    def save(self, window: DateRange, filters: dict[str, str], pages: list[str], too_large: bool):
+        revisable = window.stop >= date.today() - timedelta(days=self.recent_days)
+        entry = {'expires': time() + self.ttl.total_seconds() if revisable else None,
+                 'pages': pages,
+                 'too_large': too_large}
+
+        path = self.path(window, filters)
+        partial = path.with_suffix('.tmp')
+        size = partial.write_bytes(json.dumps(entry).encode('utf-8'))
+        partial.replace(path)
+        self.size += size - self.sizes.get(path, 0)
+        self.sizes[path] = size
+        self.sizes.move_to_end(path)
+        self.evict()
+
+    def too_large(self, window: DateRange, filters: dict[str, str]) -> bool:
+        entry = self.load(window, filters)
+        return entry is not None and entry['too_large']
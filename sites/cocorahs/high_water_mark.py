@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+from dataclasses import astuple
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable
+from typing import Self
+
+from .data import PrecipitationRecord
+
+
+class HighWaterMarks(object):
+    """
+    Last observed time per station, persisted between runs for incremental scraping.
+    Runs query again from a few days before the latest mark, and the records inside that revision
+    window are fingerprinted so revisions and late reports are detected.
+    """
+
+    def __init__(self, path: str | os.PathLike, revision_days: int = 3, max_lookback: int = 7):
+        self.path = Path(path)
+        self.revision_days = revision_days
+        # Furthest back a station behind the others is queried from, in days before the latest mark
+        self.max_lookback = max_lookback
+        self.marks: dict[str, datetime] = dict()
+        # '<station_num> <observed>' to a digest of the record, for records inside the revision window
+        self.fingerprints: dict[str, str] = dict()
+        self.load()
+
+    @staticmethod
+    def fingerprint(record: PrecipitationRecord) -> str:
+        return hashlib.sha1(repr(astuple(record)).encode()).hexdigest()
+
+    def load(self) -> Self:
+        try:
+            state = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return self
+
+        self.marks = {station: datetime.fromisoformat(observed) for station, observed in state['marks'].items()}
+        self.fingerprints = state['fingerprints']
+        return self
+
+    def revision_start(self, stations: Iterable[str] = None) -> datetime | None:
+        """
+        Start of the revision window, trailing the latest mark. Late reports of stations behind it are caught by
+        the fingerprints while they fall inside the window, rather than by widening it for every station.
+        :param stations: Stations to cover from their own marks instead, no further back than max_lookback days
+                         before the latest mark
+        :type stations: Iterable[str]
+        :return: Midnight of the first day to query again, or None if a station has no mark yet
+        :rtype: datetime | None
+        """
+        latest = max(self.marks.values(), default=None)
+        if latest is None:
+            return None
+
+        start = latest.date() - timedelta(days=self.revision_days)
+        if stations is not None:
+            marks = [self.marks.get(station) for station in stations]
+            if not marks or None in marks:
+                return None
+            start = max(min(marks).date() - timedelta(days=self.revision_days),
+                        latest.date() - timedelta(days=self.max_lookback))
+
+        return datetime.combine(start, datetime.min.time())
+
+    def save(self):
+        # Keep the fingerprints of everything a later run may query again, so unchanged records are recognised
+        latest = max(self.marks.values(), default=None)
+        cutoff = None
+        if latest is not None:
+            lookback = timedelta(days=max(self.revision_days, self.max_lookback))
+            cutoff = datetime.combine(latest.date() - lookback, datetime.min.time())
+        fingerprints = {key: digest for key, digest in self.fingerprints.items()
+                        if cutoff is None or datetime.fromisoformat(key.split(' ', 1)[1]) >= cutoff}
+        state = {'marks': {station: observed.isoformat() for station, observed in self.marks.items()},
+                 'fingerprints': fingerprints}
+
+        partial = self.path.with_suffix('.tmp')
+        partial.write_text(json.dumps(state), encoding='utf-8')
+        partial.replace(self.path)
+        self.fingerprints = fingerprints
+
+    def start_date(self, default: date, stations: Iterable[str] = None) -> date:
+        """
+        First day that needs to be queried again
+        :param default: First day to query when nothing has been scraped yet
+        :type default: date
+        :param stations: Stations to cover from their own marks, see revision_start
+        :type stations: Iterable[str]
+        :return: The start of the revision window, or the default if nothing or a requested station has no mark
+        :rtype: date
+        """
+        start = self.revision_start(stations)
+        return start.date() if start is not None else default
+
+    def update(self, record: PrecipitationRecord) -> bool:
+        """
+        Records an observation
+        :param record: The scraped record
+        :type record: PrecipitationRecord
+        :return: True if the record is new or was revised since it was last seen, False if nothing changed
+        :rtype: bool
+        """
+        key = f'{record.station_num} {record.observed.isoformat()}'
+        digest = self.fingerprint(record)
+        changed = self.fingerprints.get(key) != digest
+        if changed:
+            # Unknown records older than the mark were submitted late
+            self.fingerprints[key] = digest
+
+        mark = self.marks.get(record.station_num)
+        if mark is None or record.observed > mark:
+            self.marks[record.station_num] = record.observed
+        return changed
@@ -0,0 +1,161 @@
+from datetime import date
+from http.cookiejar import CookieJar
+from typing import Iterator
+from typing import Self
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor
+from urllib.request import build_opener
+
+from bs4 import BeautifulSoup
+from bs4 import Tag
+
+
+class HttpEngine(object):
+    """Replays the ASP.NET search form of the Daily Precip Reports page without a browser"""
+    date_format = '%m/%d/%Y'
+    grid_id = 'ucReportList_ReportGrid'
+    page_size_id = 'ucReportList_wcDropDownListPageSize'
+    pager_id = 'ucReportList_wcDropDownListPager'
+    search_button_id = 'frmPrecipReportSearch_btnSearch'
+    start_date_id = 'frmPrecipReportSearch_ucDateRangeFilter_dcStartDate_t'
+    stop_date_id = 'frmPrecipReportSearch_ucDateRangeFilter_dcEndDate_t'
+
+    def __init__(self, url: str, timeout: float = 30):
+        self.url = url
+        self.timeout = timeout
+        self.opener = build_opener(HTTPCookieProcessor(CookieJar()))
+        # Form state as the browser would submit it, including __VIEWSTATE and __EVENTVALIDATION
+        self.fields: dict[str, str] = dict()
+        # Element id to form field name, e.g. 'frmPrecipReportSearch_btnSearch' -> 'frmPrecipReportSearch$btnSearch'
+        self.names: dict[str, str] = dict()
+        # Option values of each dropdown, keyed by element id
+        self.options: dict[str, list[str]] = dict()
+
+    def iter_pages(self, start_date: date, end_date: date = None) -> Iterator[str]:
+        """
+        Runs a search for the given dates at the largest page size, yielding the report grid of every page
+        :param start_date: First day of the search
+        :type start_date: date
+        :param end_date: Last day of the search, defaults to the start date
+        :type end_date: date
+        :raises LookupError: Thrown when the search form is missing from the response
+        :return: The outer HTML of the report grid for each page
+        :rtype: Iterator[str]
+        """
+        yield self.search(start_date, end_date)
+        for page in self.page_numbers[1:]:
+            yield self.grid(self.post({'__EVENTTARGET': self.names[self.pager_id], self.pager_id: page}))
+
+    def load(self) -> Self:
+        """
+        Fetches the search page once to seed the form state
+        :return: The current engine
+        :rtype: self
+        """
+        with self.opener.open(self.url, timeout=self.timeout) as response:
+            self.update(response.read())
+
+        return self
+
+    def post(self, fields: dict[str, str]) -> BeautifulSoup:
+        """
+        Submits the form with the provided overrides, keeping the returned form state for the next postback
+        :param fields: Form fields to override, keyed by element id
+        :type fields: dict[str, str]
+        :return: The parsed response
+        :rtype: BeautifulSoup
+        """
+        if not self.fields:
+            self.load()
+
+        payload = dict(self.fields)
+        for element_id, value in fields.items():
+            payload[self.names.get(element_id, element_id)] = value
+
+        with self.opener.open(self.url, urlencode(payload).encode(), timeout=self.timeout) as response:
+            return self.update(response.read())
+
+    @property
+    def page_numbers(self) -> list[str]:
+        return self.options.get(self.pager_id) or ['1']
+
+    @property
+    def page_size(self) -> str | None:
+        sizes = [size for size in self.options.get(self.page_size_id, []) if size.isdigit()]
+        return max(sizes, key=int) if sizes else None
+
+    def search(self, start_date: date, end_date: date = None) -> str:
+        """
+        Runs a search for the given dates, returning the report grid
+        :param start_date: First day of the search
+        :type start_date: date
+        :param end_date: Last day of the search, defaults to the start date
+        :type end_date: date
+        :raises LookupError: Thrown when the search form is missing from the response
+        :return: The outer HTML of the report grid, or an empty string if no grid was returned
+        :rtype: str
+        """
+        if not self.fields:
+            self.load()
+        if self.search_button_id not in self.names:
+            raise LookupError(f'Unable to find "{self.search_button_id}" in {self.url}')
+
+        fields = {
+            self.start_date_id: f'{start_date:{self.date_format}}',
+            self.stop_date_id: f'{end_date if end_date is not None else start_date:{self.date_format}}',
+            self.search_button_id: 'Search',
+        }
+        if self.page_size is not None:
+            fields[self.page_size_id] = self.page_size
+
+        return self.grid(self.post(fields))
+
+    def grid(self, soup: BeautifulSoup) -> str:
+        table = soup.find('table', id=self.grid_id)
+        return str(table) if table is not None else ''
+
+    def update(self, html: bytes | str) -> BeautifulSoup:
+        soup = BeautifulSoup(html, 'html.parser')
+        form = soup.find('form') or soup
+        self.fields = dict()
+        self.names = dict()
+        self.options = dict()
+
+        for element in form.find_all(('input', 'select', 'textarea')):
+            name = element.get('name')
+            if not name:
+                continue
+            if element.get('id'):
+                self.names[element['id']] = name
+                if element.name == 'select':
+                    self.options[element['id']] = [option.get('value', option.text) for option in
+                                                   element.find_all('option')]
+
+            value = self.field_value(element)
+            if value is not None:
+                self.fields[name] = value
+
+        return soup
+
+    @staticmethod
+    def field_value(element: Tag) -> str | None:
+        """
+        The value a browser would submit for a form element, or None if it would be left out
+        :param element: The input, select or textarea element
+        :type element: Tag
+        :return: The submitted value
+        :rtype: str | None
+        """
+        if element.name == 'select':
+            options = element.find_all('option')
+            selected = [option for option in options if option.has_attr('selected')] or options[:1]
+            return selected[0].get('value', selected[0].text) if selected else None
+        if element.name == 'textarea':
+            return element.text
+
+        kind = element.get('type', 'text').lower()
+        if kind in ('submit', 'button', 'image', 'reset', 'file'):
+            return None
+        if kind in ('checkbox', 'radio') and not element.has_attr('checked'):
+            return None
+        return element.get('value', 'on' if kind in ('checkbox', 'radio') else '')
@@ -0,0 +1,25 @@
+from typing import Iterator
+
+from .data import StationRegistry
+from .report_list import ReportList
+
+
+class ListStations(ReportList):
+    url = 'https://www.cocorahs.org/ViewData/ListStations.aspx'
+
+    def iter_grids(self, skip: int = 0) -> Iterator[bytes]:
+        self.search_at_largest_page_size()
+        return super().iter_grids(skip)
+
+    def seed(self, registry: StationRegistry) -> StationRegistry:
+        """
+        Registers every station listed by the current filters
+        :param registry: Registry to fill
+        :type registry: StationRegistry
+        :return: The filled registry
+        :rtype: StationRegistry
+        """
+        for html in self.iter_grids():
+            registry.seed(html)
+
+        return registry
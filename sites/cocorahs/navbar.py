@@ -1,28 +1,65 @@
+import logging
+
 from selenium.webdriver.remote.webelement import WebElement
 
-from selenium_pom import BasePage, Locator
+from selenium_pom import AsyncBasePage, AsyncElement, BasePage, ElementSnapshot, Locator
 
+logger = logging.getLogger(__name__)
 
-class NavBar(BasePage):
+link_locators = (Locator.css('ul.MenuPanelList a'), Locator.css('td.header_menubar a'))
+
+
+def links_by_text(snapshots: dict[Locator, list[ElementSnapshot]]) -> dict[str, WebElement | AsyncElement]:
+    links = dict()
+    # for each link in the top-nav
+    for elements in snapshots.values():
+        for link in elements:
+            text = link.text.strip()
+            if text:
+                links[text] = link.element
+
+    return links
+
+
+class AsyncNavBar(AsyncBasePage):
     url = 'https://www.cocorahs.org'
 
     @property
-    def links(self) -> dict[str, WebElement]:
+    async def links(self) -> dict[str, AsyncElement]:
         # Must be re-computed everytime to avoid stale element references
-        links = dict()
-        # for each link in the top-nav
-        for locator in (Locator.css('ul.MenuPanelList a'), Locator.css('td.header_menubar a')):
-            for element in self.find_elements(locator):
-                text = element.text.strip()
-                if text:
-                    links[text] = element
+        return links_by_text(await self.snapshot(*link_locators))
 
-        return links
+    async def navbar_link(self, contains: str) -> bool:
+        """
+        Clicks the first navbar link containing the text
+        :param contains: Fragment of the link text
+        :type contains: str
+        :return: True if a link was clicked, False if none matched
+        :rtype: bool
+        """
+        for link, element in (await self.links).items():
+            if contains in link:
+                await element.click()
+                self.forget()
+                return True
+
+        logger.warning('Unable to click navbar link with text "%s"', contains)
+        return False
+
+
+class NavBar(BasePage):
+    url = 'https://www.cocorahs.org'
+
+    @property
+    def links(self) -> dict[str, WebElement]:
+        # Must be re-computed everytime to avoid stale element references, read together in one round trip
+        return links_by_text(self.snapshot(*link_locators))
 
     def navbar_link(self, contains: str):
         for link, element in self.links.items():
             if contains in link:
                 element.click()
+                self.forget()
             else:
                 print(f'Unable to click navbar link with text "{contains}"')
 
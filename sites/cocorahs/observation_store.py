@@ -0,0 +1,223 @@
+import json
+import os
+import sqlite3
+from dataclasses import fields
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from typing import Iterable
+from typing import Iterator
+from typing import Self
+
+from .data import PrecipitationBatch
+from .data import PrecipitationRecord
+from .range_planner import DateRange
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS observations (
+    station_num TEXT NOT NULL,
+    observed TEXT NOT NULL,
+    is_trace INTEGER NOT NULL,
+    gauge_catch REAL,
+    latitude REAL,
+    longitude REAL,
+    snowfall_depth REAL,
+    snowfall_liquid REAL,
+    snowfall_ratio REAL,
+    snowpack_density REAL,
+    snowpack_depth REAL,
+    snowpack_liquid REAL,
+    county TEXT,
+    state TEXT,
+    station_name TEXT,
+    PRIMARY KEY (station_num, observed)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS observations_observed ON observations (observed);
+CREATE INDEX IF NOT EXISTS observations_area ON observations (state, county, observed);
+CREATE TABLE IF NOT EXISTS fetched (
+    scope TEXT NOT NULL,
+    day TEXT NOT NULL,
+    PRIMARY KEY (scope, day)
+) WITHOUT ROWID;
+'''
+
+
+class ObservationStore(object):
+    """
+    Local SQLite store of observations, one row per station and observation time.
+    Re-scraped observations replace the stored ones, so revisions are applied without deduplicating afterwards.
+    The days already searched are recorded per scope, the search filters besides the dates, as days without any
+    observation are complete too.
+    """
+
+    def __init__(self, path: str | os.PathLike = ':memory:'):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+        self.columns = [field.name for field in fields(PrecipitationRecord)]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM observations').fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def days(self, start: date, stop: date, filters: dict[str, str] = None) -> set[date]:
+        """
+        Days of a range already searched with the filters, or without any filter
+        :param start: First day of the range
+        :type start: date
+        :param stop: Last day of the range
+        :type stop: date
+        :param filters: Search filters besides the dates, e.g. DailyPrecipReports.filters
+        :type filters: dict[str, str]
+        :return: The days already fetched
+        :rtype: set[date]
+        """
+        query = 'SELECT DISTINCT day FROM fetched WHERE scope IN (?, ?) AND day BETWEEN ? AND ?'
+        parameters = (self.scope(None), self.scope(filters), start.isoformat(), stop.isoformat())
+        return {date.fromisoformat(day) for day, in self.connection.execute(query, parameters)}
+
+    def has_day(self, day: date, filters: dict[str, str] = None) -> bool:
+        return day in self.days(day, day, filters)
+
+    def mark_fetched(self, start: date, stop: date, filters: dict[str, str] = None):
+        """
+        Records the days of a search as fetched, once its records are stored
+        :param start: First day of the search
+        :type start: date
+        :param stop: Last day of the search
+        :type stop: date
+        :param filters: Search filters besides the dates
+        :type filters: dict[str, str]
+        """
+        scope = self.scope(filters)
+        days = ((scope, (start + timedelta(days=offset)).isoformat()) for offset in range((stop - start).days + 1))
+        with self.connection:
+            self.connection.executemany('INSERT OR IGNORE INTO fetched (scope, day) VALUES (?, ?)', days)
+
+    def missing(self, start: date, stop: date, filters: dict[str, str] = None) -> list[DateRange]:
+        """
+        Consecutive days of a range not searched yet, the searches still needed to complete it
+        :param start: First day of the range
+        :type start: date
+        :param stop: Last day of the range
+        :type stop: date
+        :param filters: Search filters besides the dates, e.g. DailyPrecipReports.filters
+        :type filters: dict[str, str]
+        :return: The missing windows, in date order
+        :rtype: list[DateRange]
+        """
+        fetched = self.days(start, stop, filters)
+        windows = list()
+        day = start
+        while day <= stop:
+            if day not in fetched:
+                if windows and windows[-1].stop == day - timedelta(days=1):
+                    windows[-1] = DateRange(windows[-1].start, day)
+                else:
+                    windows.append(DateRange(day, day))
+            day += timedelta(days=1)
+
+        return windows
+
+    def query(self, start: date = None, stop: date = None, state: str = None, county: str = None,
+              station_num: str = None) -> Iterator[PrecipitationRecord]:
+        """
+        Stored observations matching every given filter, in observation order
+        :param start: First day, defaults to the earliest observation
+        :type start: date
+        :param stop: Last day, defaults to the latest observation
+        :type stop: date
+        :param state: State of the station
+        :type state: str
+        :param county: County of the station
+        :type county: str
+        :param station_num: Station number, e.g. 'CO-LR-1'
+        :type station_num: str
+        :return: The matching records
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        where, parameters = self.where(start, stop, state, county)
+        if station_num is not None:
+            where += ' AND station_num = ?'
+            parameters.append(station_num)
+
+        query = f'SELECT {", ".join(self.columns)} FROM observations WHERE {where} ORDER BY observed, station_num'
+        observed = self.columns.index('observed')
+        is_trace = self.columns.index('is_trace')
+        for row in self.connection.execute(query, parameters):
+            values = list(row)
+            values[observed] = datetime.strptime(values[observed], PrecipitationBatch.sqlite_observed_format)
+            values[is_trace] = bool(values[is_trace])
+            yield PrecipitationRecord(*values)
+
+    @staticmethod
+    def scope(filters: dict[str, str] | None) -> str:
+        # Same filters in any order are the same scope, an unfiltered search covers every scope
+        return json.dumps(filters or dict(), sort_keys=True)
+
+    def upsert(self, items: Iterable[PrecipitationRecord | PrecipitationBatch], batch_size: int = 50_000) -> int:
+        """
+        Inserts the observations, replacing the stored ones of the same station and observation time
+        :param items: Records, batches, or a mix of both, e.g. DailyPrecipReports.iter_records
+        :type items: Iterable[PrecipitationRecord | PrecipitationBatch]
+        :param batch_size: Observations written per transaction
+        :type batch_size: int
+        :return: Number of observations written
+        :rtype: int
+        """
+        written = 0
+        pending = PrecipitationBatch()
+        for item in items:
+            if isinstance(item, PrecipitationBatch):
+                pending.extend(item)
+            else:
+                pending.append(item)
+            if len(pending) >= batch_size:
+                written += self.write(pending)
+                pending = PrecipitationBatch()
+
+        return written + self.write(pending)
+
+    def where(self, start: date | None, stop: date | None, state: str | None,
+              county: str | None) -> tuple[str, list[str]]:
+        # Half-open ranges on the observed text, so the indexes on observed are used
+        clauses, parameters = ['1'], list()
+        if state is not None:
+            clauses.append('state = ?')
+            parameters.append(state)
+            if county is not None:
+                clauses.append('county = ?')
+                parameters.append(county)
+        elif county is not None:
+            raise ValueError('Filtering by county requires the state')
+        if start is not None:
+            clauses.append('observed >= ?')
+            parameters.append(start.isoformat())
+        if stop is not None:
+            clauses.append('observed < ?')
+            parameters.append((stop + timedelta(days=1)).isoformat())
+
+        return ' AND '.join(clauses), parameters
+
+    def write(self, batch: PrecipitationBatch) -> int:
+        if not batch:
+            return 0
+
+        columns = PrecipitationBatch.row_columns
+        updates = ', '.join(f'{column} = excluded.{column}' for column in columns
+                            if column not in ('station_num', 'observed'))
+        statement = (f'INSERT INTO observations ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))}) '
+                     f'ON CONFLICT (station_num, observed) DO UPDATE SET {updates}')
+        with self.connection:
+            self.connection.executemany(statement, batch.iter_rows(PrecipitationBatch.sqlite_observed_format))
+
+        return len(batch)
@@ -0,0 +1,141 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from queue import Empty
+from queue import Full
+from queue import Queue
+from threading import Event
+from threading import Thread
+from typing import Iterable
+from typing import Iterator
+from typing import Self
+
+from .data import Precipitation
+from .data import PrecipitationBatch
+from .data import PrecipitationRecord
+from .enum import GridParser
+
+# Marks the end of the fetched pages on the queue
+DONE = object()
+
+
+def parse_page(html: str | bytes, parser: GridParser, batch: bool) -> list[PrecipitationRecord] | PrecipitationBatch:
+    # Runs in the parser processes, so it has to be importable and its result picklable
+    grid = Precipitation(html, parser)
+    return grid.batch() if batch else list(grid)
+
+
+class ParsePipeline(object):
+    """
+    Overlaps fetching and parsing: a fetcher thread drives the browser or HTTP engine and puts the raw report grids
+    on a bounded queue, while a pool of processes parses them on every core.
+    The queue and the number of pages in flight bound the memory, a slow parser holds the fetcher back.
+    """
+
+    def __init__(self, workers: int = None, queue_size: int = 4, parser: GridParser = GridParser.Lxml):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.parser = parser
+        self.executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def batches(self, pages: Iterable[str | bytes]) -> Iterator[PrecipitationBatch]:
+        """
+        Parses the pages into one columnar batch each
+        :param pages: Report grids as fetched, e.g. DailyPrecipReports.iter_range_pages
+        :type pages: Iterable[str | bytes]
+        :return: The batch of each page, in page order
+        :rtype: Iterator[PrecipitationBatch]
+        """
+        return self.run(pages, batch=True)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def fetch(self, pages: Iterable[str | bytes], queue: Queue, stopped: Event):
+        # Pages are pulled from the iterator on this thread only, so the driver is never shared
+        try:
+            for html in pages:
+                while not stopped.is_set():
+                    try:
+                        queue.put(html, timeout=0.1)
+                        break
+                    except Full:
+                        continue
+                if stopped.is_set():
+                    break
+        except BaseException as error:
+            queue.put(error)
+            return
+        finally:
+            if stopped.is_set() and hasattr(pages, 'close'):
+                pages.close()
+
+        queue.put(DONE)
+
+    def records(self, pages: Iterable[str | bytes]) -> Iterator[PrecipitationRecord]:
+        """
+        Parses the pages into records
+        :param pages: Report grids as fetched, e.g. DailyPrecipReports.iter_range_pages
+        :type pages: Iterable[str | bytes]
+        :return: The records of each page, in page order
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        for records in self.run(pages, batch=False):
+            yield from records
+
+    def run(self, pages: Iterable[str | bytes],
+            batch: bool) -> Iterator[list[PrecipitationRecord] | PrecipitationBatch]:
+        if self.executor is None:
+            # The fetcher thread holds driver and urllib3 locks, forking while it runs could copy them held
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            self.executor = ProcessPoolExecutor(self.workers, mp_context=context)
+
+        queue = Queue(self.queue_size)
+        stopped = Event()
+        fetcher = Thread(target=self.fetch, args=(pages, queue, stopped), name='grid-fetcher', daemon=True)
+        fetcher.start()
+
+        # At most one parsed page waiting per worker, besides the queued raw pages
+        in_flight: deque[Future] = deque()
+        limit = self.workers or os.cpu_count() or 1
+        try:
+            while True:
+                # Hand out parsed pages as they complete, rather than once the fetcher delivers the next page
+                while in_flight and in_flight[0].done():
+                    yield in_flight.popleft().result()
+                try:
+                    item = queue.get(timeout=0.05 if in_flight else None)
+                except Empty:
+                    continue
+                if item is DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                in_flight.append(self.executor.submit(parse_page, item, self.parser, batch))
+                while len(in_flight) >= limit:
+                    yield in_flight.popleft().result()
+
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            stopped.set()
+            for future in in_flight:
+                future.cancel()
+            # Unblocks a fetcher waiting on a full queue
+            while fetcher.is_alive():
+                try:
+                    queue.get(timeout=0.1)
+                except Empty:
+                    pass
@@ -0,0 +1,68 @@
+from datetime import date
+from datetime import timedelta
+from typing import Iterator
+from typing import NamedTuple
+
+
+class DateRange(NamedTuple):
+    start: date
+    stop: date
+
+    @property
+    def days(self) -> int:
+        return (self.stop - self.start).days + 1
+
+    def split(self) -> tuple['DateRange', 'DateRange']:
+        middle = self.start + timedelta(days=self.days // 2 - 1)
+        return DateRange(self.start, middle), DateRange(middle + timedelta(days=1), self.stop)
+
+
+class RangePlanner(object):
+    """
+    Plans the search windows for a date range, starting as wide as the site allows and
+    narrowing the remaining windows whenever a result set turns out to be too large.
+    Windows are aligned to fixed blocks of max_days, so shifting the range reuses the cached windows in between.
+    """
+
+    def __init__(self, start: date, stop: date, max_days: int = 31, max_pages: int = 20):
+        self.cursor = start
+        self.max_days = max_days
+        self.max_pages = max_pages
+        self.pending: list[DateRange] = list()
+        self.stop = stop
+
+    def __iter__(self) -> Iterator[DateRange]:
+        while self.pending or self.cursor <= self.stop:
+            if self.pending:
+                yield self.pending.pop()
+                continue
+
+            window = DateRange(self.cursor, min(self.stop, self.block_stop(self.cursor)))
+            self.cursor = window.stop + timedelta(days=1)
+            yield window
+
+    def block_stop(self, day: date) -> date:
+        # Last day of the block of max_days holding the day, blocks counted from the first ordinal
+        return date.fromordinal(((day.toordinal() - 1) // self.max_days + 1) * self.max_days)
+
+    def too_large(self, window: DateRange, pages: int) -> bool:
+        """
+        Checks the page count of a search, splitting the window when it has too many pages
+        :param window: The searched window
+        :type window: DateRange
+        :param pages: Number of pages reported by the pager
+        :type pages: int
+        :return: True if the window was split and its results should be discarded, False otherwise
+        :rtype: bool
+        """
+        if pages <= self.max_pages or window.days == 1:
+            return False
+
+        self.split(window)
+        return True
+
+    def split(self, window: DateRange):
+        first, second = window.split()
+        # Later windows are planned at the narrower size, the stack keeps the halves in date order
+        self.max_days = max(1, first.days)
+        self.pending.extend((second, first))
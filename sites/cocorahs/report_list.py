@@ -0,0 +1,75 @@
+from typing import Iterator
+from typing import Self
+
+from selenium_pom import Locator
+from .navbar import NavBar
+
+
+class ReportList(NavBar):
+    """Paging over the report grid shared by the View Data reports"""
+    page_size_selection = Locator.css('select#ucReportList_wcDropDownListPageSize')
+    page_size_selection_options = Locator.css('select#ucReportList_wcDropDownListPageSize option')
+    pager_selection = Locator.css('select#ucReportList_wcDropDownListPager')
+    pager_selection_options = Locator.css('select#ucReportList_wcDropDownListPager option')
+    report_grid = Locator.css('table#ucReportList_ReportGrid')
+    search_button = Locator.css('input[id$="_btnSearch"]')
+    # Gzip the report grid in the browser before reading it, see BasePage.outer_html
+    compress_grid = True
+
+    def grid_snapshot(self) -> bytes:
+        return self.outer_html(self.report_grid, compress=self.compress_grid) or b''
+
+    def iter_grids(self, skip: int = 0) -> Iterator[bytes]:
+        """
+        Yields the report grid of every page of the current search
+        :param skip: Pages already read elsewhere, paged through without being read
+        :type skip: int
+        :return: The outer HTML of the report grid for each page
+        :rtype: Iterator[bytes]
+        """
+        for page in range(1, self.pages + 1):
+            if page > 1:
+                self.await_postback(lambda: self.select_page(page), self.report_grid)
+            if page > skip:
+                yield self.grid_snapshot()
+
+    @property
+    def pages(self) -> int:
+        return max(1, len(self.snapshot(self.pager_selection_options)[self.pager_selection_options]))
+
+    def search(self) -> Self:
+        return self.submit_and_await(self.search_button, self.report_grid)
+
+    def search_at_largest_page_size(self) -> Self:
+        """
+        Searches with the largest page size, applied before the search when the dropdown is already rendered,
+        otherwise once the first results brought it in
+        :return: The current page
+        :rtype: self
+        """
+        return self.select_largest_page_size().search().select_largest_page_size()
+
+    def select_largest_page_size(self) -> Self:
+        """
+        Selects the largest page size and waits for the postback it triggers, if the dropdown is on the page
+        and another size is selected
+        :return: The current page
+        :rtype: self
+        """
+        snapshots = self.snapshot(self.page_size_selection, self.page_size_selection_options)
+        sizes = [option.get_attribute('value') for option in snapshots[self.page_size_selection_options]]
+        sizes = [size for size in sizes if size and size.isdigit()]
+        if not sizes or not snapshots[self.page_size_selection]:
+            return self
+
+        largest = max(sizes, key=int)
+        if snapshots[self.page_size_selection][0].get_attribute('value') == largest:
+            return self
+
+        return self.await_postback(lambda: self.select_option(
+            self.page_size_selection, self.page_size_selection_options,
+            lambda element: element.get_attribute('value') == largest), self.report_grid)
+
+    def select_page(self, page: int) -> Self:
+        return self.select_option(self.pager_selection, self.pager_selection_options,
+                                  lambda element: element.get_attribute('value') == str(page))
@@ -0,0 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from datetime import timedelta
+from threading import Lock
+from threading import local
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Self
+from typing import Sequence
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .daily_precip import DailyPrecipReports
+from .data import PrecipitationRecord
+from .range_planner import DateRange
+
+
+class Shard(NamedTuple):
+    start: date
+    stop: date
+    country: str = None
+    county: str = None
+
+
+class ScrapePool(object):
+    """Spreads Daily Precip searches over a pool of browser sessions, one per worker thread"""
+
+    def __init__(self, driver_factory: Callable[[], WebDriver], workers: int = 4):
+        self.driver_factory = driver_factory
+        self.drivers: list[WebDriver] = list()
+        self.lock = Lock()
+        self.local = local()
+        self.workers = workers
+        # Shared by every scrape, so the worker threads and their browser sessions outlive a single call
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix='scrape')
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def by_counties(self, start: date, stop: date, country: str,
+                    counties: Sequence[str]) -> Iterator[PrecipitationRecord]:
+        """
+        Scrapes a date range with one shard per county
+        :param start: First day of the range
+        :type start: date
+        :param stop: Last day of the range
+        :type stop: date
+        :param country: Value to pick from the country dropdown
+        :type country: str
+        :param counties: Values to pick from the county dropdown, one shard each
+        :type counties: Sequence[str]
+        :return: The records of every shard, in the order of the counties
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        return self.scrape(Shard(start, stop, country, county) for county in counties)
+
+    def by_dates(self, start: date, stop: date, days: int = None) -> Iterator[PrecipitationRecord]:
+        """
+        Scrapes a date range split into consecutive shards
+        :param start: First day of the range
+        :type start: date
+        :param stop: Last day of the range
+        :type stop: date
+        :param days: Days per shard, defaults to an even split across the workers
+        :type days: int
+        :raises ValueError: Thrown when days is less than one
+        :return: The records of every shard, in date order
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        days = days if days is not None else max(1, -(-DateRange(start, stop).days // self.workers))
+        if days < 1:
+            raise ValueError(f'Shards need at least one day, got {days}')
+        shards = list()
+        while start <= stop:
+            shards.append(Shard(start, min(stop, start + timedelta(days=days - 1))))
+            start = shards[-1].stop + timedelta(days=1)
+
+        return self.scrape(shards)
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+        with self.lock:
+            for driver in self.drivers:
+                driver.quit()
+            self.drivers.clear()
+
+    @property
+    def driver(self) -> WebDriver:
+        # Each worker thread keeps its own browser session for the lifetime of the pool
+        if getattr(self.local, 'driver', None) is None:
+            self.local.driver = self.driver_factory()
+            with self.lock:
+                self.drivers.append(self.local.driver)
+
+        return self.local.driver
+
+    def run(self, shard: Shard) -> list[PrecipitationRecord]:
+        self.driver.get(DailyPrecipReports.url)
+        page = DailyPrecipReports(self.driver)
+        if shard.country is not None:
+            self.select_country(page, shard.country)
+        if shard.county is not None:
+            page.select_county(shard.county)
+
+        return list(page.iter_records(shard.start, shard.stop))
+
+    @staticmethod
+    def select_country(page: DailyPrecipReports, country: str):
+        # Picking another country reloads the county dropdown in a postback, which has to land before the county
+        # is picked from it
+        snapshots = page.snapshot(page.country_selection, page.country_selection_options)
+        selected = [select.get_attribute('value') for select in snapshots[page.country_selection]]
+        if any(country in option.text and option.get_attribute('value') in selected
+               for option in snapshots[page.country_selection_options]):
+            page.filters['country'] = country
+            return
+
+        page.await_postback(lambda: page.select_country(country), page.county_selection)
+
+    def scrape(self, shards: Iterable[Shard]) -> Iterator[PrecipitationRecord]:
+        """
+        Runs the shards across the workers, merging the results into one stream
+        :param shards: Searches to run
+        :type shards: Iterable[Shard]
+        :return: The records of every shard, in the order the shards were given
+        :rtype: Iterator[PrecipitationRecord]
+        """
+        for records in self.executor.map(self.run, shards):
+            yield from records
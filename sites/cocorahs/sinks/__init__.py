@@ -0,0 +1,4 @@
+from .csv_sink import CsvSink
+from .parquet_sink import ParquetSink
+from .record_sink import RecordSink
+from .sqlite_sink import SqliteSink
@@ -0,0 +1,32 @@
+import csv
+import os
+from pathlib import Path
+
+from ..data import PrecipitationBatch
+from .record_sink import RecordSink
+
+
+class CsvSink(RecordSink):
+    """Writes the records to a CSV file with a header row, missing values left empty"""
+
+    def __init__(self, path: str | os.PathLike, batch_size: int = 50_000, append: bool = False):
+        super().__init__(batch_size)
+        self.path = Path(path)
+        self.append = append
+        self.file = None
+        self.writer = None
+
+    def close_output(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def open(self, batch: PrecipitationBatch):
+        header = not self.append or not self.path.exists() or self.path.stat().st_size == 0
+        self.file = self.path.open('a' if self.append else 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        if header:
+            self.writer.writerow(PrecipitationBatch.row_columns)
+
+    def write_batch(self, batch: PrecipitationBatch):
+        self.writer.writerows(batch.iter_rows())
@@ -0,0 +1,29 @@
+import os
+from pathlib import Path
+
+from ..data import PrecipitationBatch
+from .record_sink import RecordSink
+
+
+class ParquetSink(RecordSink):
+    """Writes the records to a Parquet file, one row group per batch. Requires pyarrow."""
+
+    def __init__(self, path: str | os.PathLike, batch_size: int = 250_000, compression: str = 'zstd'):
+        super().__init__(batch_size)
+        self.path = Path(path)
+        self.compression = compression
+        self.writer = None
+
+    def close_output(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def write_batch(self, batch: PrecipitationBatch):
+        table = batch.to_arrow()
+        if self.writer is None:
+            # Created from the first table, so it is only converted once
+            import pyarrow.parquet
+
+            self.writer = pyarrow.parquet.ParquetWriter(self.path, table.schema, compression=self.compression)
+        self.writer.write_table(table, row_group_size=len(batch))
@@ -0,0 +1,105 @@
+from abc import ABC
+from abc import abstractmethod
+from time import perf_counter
+from typing import Iterable
+from typing import Self
+
+from selenium_pom import metrics
+
+from ..data import PrecipitationBatch
+from ..data import PrecipitationRecord
+
+
+class RecordSink(ABC):
+    """
+    Buffers a stream of records or batches and writes it in batches of at most batch_size rows, timing every write.
+    Subclasses implement write_batch, and open and close_output when they hold an output.
+    """
+
+    def __init__(self, batch_size: int = 50_000):
+        self.batch_size = batch_size
+        self.pending = PrecipitationBatch()
+        self.is_open = False
+        # Rows written and the seconds spent writing them
+        self.rows = 0
+        self.elapsed = 0.0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if not self.is_open and not self.pending:
+            return
+
+        self.flush()
+        self.close_output()
+        self.is_open = False
+
+    def close_output(self):
+        pass
+
+    def consume(self, items: Iterable[PrecipitationRecord | PrecipitationBatch]) -> Self:
+        """
+        Writes a whole stream, e.g. DailyPrecipReports.iter_records or iter_batches
+        :param items: Records, batches, or a mix of both
+        :type items: Iterable[PrecipitationRecord | PrecipitationBatch]
+        :return: The current sink
+        :rtype: self
+        """
+        for item in items:
+            self.write(item)
+
+        return self
+
+    def flush(self) -> Self:
+        if not self.pending:
+            return self
+
+        batch, self.pending = self.pending, PrecipitationBatch()
+        if len(batch) <= self.batch_size:
+            self.write_timed(batch)
+            return self
+
+        # A large batch written in at once is split, so each write stays within batch_size
+        for start in range(0, len(batch), self.batch_size):
+            self.write_timed(batch[start:start + self.batch_size])
+        return self
+
+    def open(self, batch: PrecipitationBatch):
+        pass
+
+    def report(self) -> str:
+        return f'{type(self).__name__}: {self.rows:,} rows in {self.elapsed:.3f}s, {self.throughput:,.0f} rows/sec'
+
+    @property
+    def throughput(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def write(self, item: PrecipitationRecord | PrecipitationBatch) -> Self:
+        if isinstance(item, PrecipitationBatch):
+            self.pending.extend(item)
+        else:
+            self.pending.append(item)
+
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        return self
+
+    @abstractmethod
+    def write_batch(self, batch: PrecipitationBatch):
+        pass
+
+    def write_timed(self, batch: PrecipitationBatch):
+        started = perf_counter()
+        if not self.is_open:
+            self.open(batch)
+            self.is_open = True
+        self.write_batch(batch)
+        elapsed = perf_counter() - started
+        metrics.observe('sink', elapsed, sink=type(self).__name__)
+
+        self.rows += len(batch)
+        self.elapsed += elapsed
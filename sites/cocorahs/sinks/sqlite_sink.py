@@ -0,0 +1,40 @@
+import os
+import sqlite3
+
+from ..data import PrecipitationBatch
+from .record_sink import RecordSink
+
+
+class SqliteSink(RecordSink):
+    """
+    Appends the records to a SQLite table, one transaction and executemany per batch.
+    The database is switched to WAL so readers are not blocked while a backfill is written.
+    """
+    types = {'observed': 'TEXT NOT NULL', 'is_trace': 'INTEGER NOT NULL', 'county': 'TEXT', 'state': 'TEXT',
+             'station_name': 'TEXT', 'station_num': 'TEXT NOT NULL'}
+
+    def __init__(self, path: str | os.PathLike, table: str = 'precipitation', batch_size: int = 50_000):
+        super().__init__(batch_size)
+        self.path = path
+        self.table = table
+        self.connection: sqlite3.Connection | None = None
+
+    def close_output(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def open(self, batch: PrecipitationBatch):
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        # WAL keeps the database consistent without syncing on every commit
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        columns = ', '.join(f'{column} {self.types.get(column, "REAL")}' for column in PrecipitationBatch.row_columns)
+        with self.connection:
+            self.connection.execute(f'CREATE TABLE IF NOT EXISTS {self.table} ({columns})')
+
+    def write_batch(self, batch: PrecipitationBatch):
+        placeholders = ', '.join('?' * len(PrecipitationBatch.row_columns))
+        with self.connection:
+            self.connection.executemany(f'INSERT INTO {self.table} VALUES ({placeholders})',
+                                        batch.iter_rows(PrecipitationBatch.sqlite_observed_format))
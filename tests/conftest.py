@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Callable
+
+import pytest
+
+from sites.cocorahs import PrecipitationRecord
+
+
+@pytest.fixture
+def record() -> Callable[..., PrecipitationRecord]:
+    """A factory of Larimer County, CO records observed at 7am on a day of May 2024"""
+    def record(station_num: str, day: int, gauge: float = 0.1) -> PrecipitationRecord:
+        return PrecipitationRecord('Larimer', gauge, False, datetime(2024, 5, day, 7), 40.5, -105.1, None, None, None,
+                                   None, None, None, 'CO', 'Fort Collins', station_num)
+
+    return record
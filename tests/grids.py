@@ -0,0 +1,24 @@
+"""Synthetic Daily Precip report grids, shared by the tests and the benchmarks"""
+
+ROW = ('<tr class="{css}"><td>10/17/2026</td><td>7:00 AM</td><td>CO-LR-{i}</td><td>{name}</td>'
+       '<td>{gauge}</td><td><span>{snowfall}</span><span>0.1</span><span>NA</span></td>'
+       '<td><span>1.5</span><span>0.3</span><span>NA</span></td><td>CO</td><td>Larimer</td><td></td>'
+       '<td><a href="https://maps.google.com/maps?z=12&amp;center=40.{i},-105.{i}">Map</a></td></tr>')
+
+
+def grid(*names: str) -> str:
+    """
+    A report grid with one row per station name, alternating trace and measured gauges and missing snowfall
+    :param names: Station names, the station numbers and locations follow their position
+    :type names: str
+    :return: The outer HTML of the grid
+    :rtype: str
+    """
+    rows = ''.join(ROW.format(css='GridItem' if i % 2 else 'GridAltItem', i=i, name=name,
+                              gauge='T' if i % 3 == 0 else '0.12', snowfall='NA' if i % 2 else '1.0')
+                   for i, name in enumerate(names))
+    return f'<table id="ucReportList_ReportGrid"><tr class="GridHeader"><td>Date</td></tr>{rows}</table>'
+
+
+def synthetic_grid(rows: int) -> str:
+    return grid(*(f'Fort Collins {i}' for i in range(rows)))
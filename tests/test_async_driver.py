@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import WebDriverException
+
+from selenium_pom import AsyncDriver
+from selenium_pom import AsyncElement
+from selenium_pom.AsyncDriver import ELEMENT_KEY
+
+
+class StandIn(object):
+    """
+    Local WebDriver server answering each path with a canned response, either with a Content-Length
+    or chunked, and able to drop a keep-alive connection after answering
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.requests: list[tuple[str, str, dict | None]] = list()
+        self.drop_after_response = False
+        self.server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> 'StandIn':
+        self.server = await asyncio.start_server(self.serve, '127.0.0.1', 0)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/wd/hub'
+
+    def answer(self, method: str, path: str) -> tuple[int, dict, bool]:
+        if path.endswith('/title'):
+            return 200, {'value': 'Daily Precip Reports'}, False
+        if path.endswith('/source'):
+            return 200, {'value': '<html>' + 'x' * 5000 + '</html>'}, True
+        if path.endswith('/element'):
+            return 404, {'value': {'error': 'no such element', 'message': 'Unable to locate #missing'}}, False
+        if path.endswith('/elements'):
+            return 200, {'value': [{ELEMENT_KEY: 'e1'}, {ELEMENT_KEY: 'e2'}]}, True
+        if path.endswith('/url'):
+            return 200, {'value': None}, False
+        return 500, {'value': 'upstream proxy error'}, False
+
+    async def serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                method, path, _ = (await reader.readuntil(b'\r\n')).decode().split()
+                headers = dict()
+                while (line := await reader.readuntil(b'\r\n')) != b'\r\n':
+                    name, _, value = line.decode().partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                self.requests.append((method, path, json.loads(body) if body else None))
+
+                status, payload, chunked = self.answer(method, path)
+                data = json.dumps(payload).encode()
+                if chunked:
+                    # Uneven chunks, so a chunk boundary falls inside a JSON token
+                    parts = [data[i:i + 777] for i in range(0, len(data), 777)]
+                    content = b''.join(b'%x\r\n%s\r\n' % (len(part), part) for part in parts) + b'0\r\n\r\n'
+                    head = f'HTTP/1.1 {status} X\r\nTransfer-Encoding: chunked\r\n\r\n'
+                else:
+                    content = data
+                    head = f'HTTP/1.1 {status} X\r\nContent-Length: {len(data)}\r\n\r\n'
+                writer.write(head.encode() + content)
+                await writer.drain()
+                if self.drop_after_response:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def run(test):
+    async def main():
+        async with StandIn() as server:
+            await test(server, AsyncDriver(server.url, 'session-1'))
+
+    asyncio.run(main())
+
+
+def test_content_length_and_chunked_bodies_share_one_connection():
+    async def test(server: StandIn, driver: AsyncDriver):
+        assert await driver.title == 'Daily Precip Reports'
+        assert await driver.page_source == '<html>' + 'x' * 5000 + '</html>'
+        assert await driver.find_elements('css selector', 'td') == [AsyncElement(driver, 'e1'),
+                                                                     AsyncElement(driver, 'e2')]
+        assert await driver.title == 'Daily Precip Reports'
+
+        assert server.connections == 1
+        assert [path for _, path, _ in server.requests][:2] == ['/wd/hub/session/session-1/title',
+                                                                '/wd/hub/session/session-1/source']
+        await driver.close()
+
+    run(test)
+
+
+def test_dropped_keep_alive_connection_is_retried_for_get_only():
+    async def test(server: StandIn, driver: AsyncDriver):
+        server.drop_after_response = True
+        assert await driver.title == 'Daily Precip Reports'
+        await asyncio.sleep(0.05)
+        assert await driver.title == 'Daily Precip Reports'
+        assert server.connections == 2
+
+        await asyncio.sleep(0.05)
+        # The navigation may have reached the remote end, so it is not sent twice
+        with pytest.raises((ConnectionError, asyncio.IncompleteReadError)):
+            await driver.get('https://www.cocorahs.org')
+        assert [method for method, _, _ in server.requests] == ['GET', 'GET']
+        await driver.close()
+
+    run(test)
+
+
+def test_w3c_errors_raise_their_selenium_exception():
+    async def test(server: StandIn, driver: AsyncDriver):
+        with pytest.raises(NoSuchElementException, match='Unable to locate #missing'):
+            await driver.find_element('id', 'missing')
+        assert server.requests[-1][2] == {'using': 'css selector', 'value': '[id="missing"]'}
+
+        with pytest.raises(WebDriverException, match='HTTP 500'):
+            await driver.command('GET', 'window')
+        await driver.close()
+
+    run(test)
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+
+from selenium_pom import AsyncPageWait
+from selenium_pom import IgnorableExceptions
+
+
+class NavigatingDriver(object):
+    """Cuts the observer short like a full postback, then reports the script arguments as stale"""
+
+    def __init__(self, observe_seconds: float = 0.0):
+        self.observe_seconds = observe_seconds
+        self.script_timeout = 30_000
+        self.timeouts: list[int] = list()
+
+    async def command(self, method: str, path: str, body: dict = None):
+        if method == 'GET':
+            return {'implicit': 0, 'pageLoad': 300_000, 'script': self.script_timeout}
+        self.script_timeout = body['script']
+        self.timeouts.append(body['script'])
+
+    async def execute_async_script(self, script: str, *args):
+        await asyncio.sleep(self.observe_seconds)
+        raise JavascriptException('document unloaded while waiting for result')
+
+    async def execute_script(self, script: str, *args):
+        raise StaleElementReferenceException('stale element reference')
+
+
+def test_until_script_restores_the_script_timeout():
+    driver = NavigatingDriver()
+
+    async def replaced(_) -> bool:
+        return True
+
+    assert asyncio.run(AsyncPageWait(driver, 2).until_script('return false', on_stale=replaced))
+    assert driver.timeouts == [3000, 30_000]
+    assert driver.script_timeout == 30_000
+
+
+def test_until_script_polls_only_for_the_remaining_time():
+    driver = NavigatingDriver(observe_seconds=0.3)
+    started = time.monotonic()
+    wait = AsyncPageWait(driver, 0.5, poll_frequency=0.05).disable(IgnorableExceptions.StaleElementReferenceException)
+    with pytest.raises(TimeoutException):
+        asyncio.run(wait.until_script('return false'))
+
+    # 0.3s observing and the 0.2s left polling, not another 0.5s
+    assert time.monotonic() - started < 0.7
+    assert driver.script_timeout == 30_000
@@ -0,0 +1,70 @@
+from datetime import date
+from datetime import timedelta
+
+from sites.cocorahs import DateRange
+from sites.cocorahs import GridCache
+from sites.cocorahs import RangePlanner
+
+
+def test_key_ignores_filter_order(tmp_path):
+    cache = GridCache(tmp_path)
+    window = DateRange(date(2024, 1, 1), date(2024, 1, 31))
+
+    assert cache.key(window, {'country': 'USA', 'county': 'Larimer'}) == \
+           cache.key(window, {'county': 'Larimer', 'country': 'USA'})
+    assert cache.key(window, {}) != cache.key(window, {'county': 'Larimer'})
+    assert cache.key(window, {}) != cache.key(DateRange(window.start, window.stop - timedelta(days=1)), {})
+
+
+def test_shifted_range_reuses_the_windows_in_between():
+    start, stop = date(2024, 1, 10), date(2024, 6, 30)
+    before = list(RangePlanner(start, stop))
+    after = list(RangePlanner(start + timedelta(days=1), stop + timedelta(days=1)))
+
+    assert before[0].start == start and before[-1].stop == stop
+    assert all(window.days <= 31 for window in before)
+    # Only the partial windows at either end change
+    assert before[1:-1] == after[1:-1]
+
+
+def test_shifted_range_hits_the_cache(tmp_path):
+    cache = GridCache(tmp_path)
+    for window in RangePlanner(date(2024, 1, 10), date(2024, 6, 30)):
+        cache.put(window, {}, [f'<table>{window.start}</table>'.encode()])
+
+    windows = list(RangePlanner(date(2024, 1, 11), date(2024, 7, 1)))
+    hits = [window for window in windows if cache.get(window, {}) is not None]
+    assert len(hits) == len(windows) - 2
+    assert cache.get(windows[1], {}) == [f'<table>{windows[1].start}</table>']
+
+
+def test_split_windows_stay_aligned():
+    planner = RangePlanner(date(2024, 1, 1), date(2024, 3, 31))
+    first = next(iter(planner))
+    assert planner.too_large(first, pages=50)
+
+    halves = [next(iter(planner)), next(iter(planner))]
+    assert halves[0].start == first.start and halves[1].stop == first.stop
+    assert halves[0].stop + timedelta(days=1) == halves[1].start
+
+
+def test_eviction_keeps_the_cache_under_its_cap(tmp_path):
+    cache = GridCache(tmp_path, max_bytes=2000)
+    windows = [DateRange(date(2020, 1, day), date(2020, 1, day)) for day in range(1, 21)]
+    for window in windows:
+        cache.put(window, {}, ['x' * 300])
+
+    assert cache.size == sum(path.stat().st_size for path in tmp_path.glob('*.json')) <= 2000
+    assert cache.get(windows[-1], {}) is not None
+    assert cache.get(windows[0], {}) is None
+    assert GridCache(tmp_path).size == cache.size
+
+
+def test_too_large_entries(tmp_path):
+    cache = GridCache(tmp_path)
+    window = DateRange(date(2024, 1, 1), date(2024, 1, 31))
+    cache.mark_too_large(window, {})
+
+    assert cache.too_large(window, {})
+    assert cache.get(window, {}) is None
+    assert cache.load(window, {})['too_large']
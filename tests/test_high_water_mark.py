@@ -0,0 +1,48 @@
+from dataclasses import replace
+from datetime import date
+
+from sites.cocorahs import HighWaterMarks
+
+
+def test_revision_window_trails_the_latest_mark(tmp_path, record):
+    marks = HighWaterMarks(tmp_path / 'marks.json', revision_days=2)
+    for station in range(100):
+        marks.update(record(f'CO-LR-{station}', 30))
+    marks.update(record('CO-LR-late', 2))
+
+    assert marks.start_date(date(2024, 1, 1)) == date(2024, 5, 28)
+
+
+def test_requested_stations_start_from_their_own_marks_within_the_lookback(tmp_path, record):
+    marks = HighWaterMarks(tmp_path / 'marks.json', revision_days=2, max_lookback=7)
+    marks.update(record('CO-LR-1', 20))
+    marks.update(record('CO-LR-2', 17))
+    marks.update(record('CO-LR-3', 2))
+
+    assert marks.start_date(date(2024, 1, 1), ['CO-LR-1', 'CO-LR-2']) == date(2024, 5, 15)
+    assert marks.start_date(date(2024, 1, 1), ['CO-LR-3']) == date(2024, 5, 13)
+    assert marks.start_date(date(2024, 1, 1), ['CO-LR-1', 'CO-LR-4']) == date(2024, 1, 1)
+
+
+def test_late_reports_inside_the_window_are_caught(tmp_path, record):
+    marks = HighWaterMarks(tmp_path / 'marks.json', revision_days=2)
+    marks.update(record('CO-LR-1', 20))
+    marks.update(record('CO-LR-2', 10))
+    marks.save()
+
+    marks = HighWaterMarks(tmp_path / 'marks.json', revision_days=2)
+    assert marks.update(record('CO-LR-2', 19))
+    assert not marks.update(record('CO-LR-1', 20))
+
+
+def test_update_reports_only_changes_across_runs(tmp_path, record):
+    marks = HighWaterMarks(tmp_path / 'marks.json', revision_days=2)
+    assert marks.update(record('CO-LR-1', 20))
+    assert marks.update(record('CO-LR-2', 18))
+    marks.save()
+
+    marks = HighWaterMarks(tmp_path / 'marks.json', revision_days=2)
+    assert not marks.update(record('CO-LR-1', 20))
+    assert not marks.update(record('CO-LR-2', 18))
+    assert marks.update(replace(record('CO-LR-2', 18), gauge_catch=0.5))
+    assert marks.update(record('CO-LR-2', 17))
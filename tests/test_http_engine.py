@@ -0,0 +1,102 @@
+from datetime import date
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs
+
+import pytest
+
+from sites.cocorahs import HttpEngine
+
+PAGES = 3
+
+
+def form(viewstate: str, grid: str = '', pager: bool = False) -> str:
+    pages = ''.join(f'<option value="{page}">{page}</option>' for page in range(1, PAGES + 1)) if pager else ''
+    return (f'<html><body><form method="post">'
+            f'<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}">'
+            f'<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="">'
+            f'<input type="text" name="frmPrecipReportSearch$ucDateRangeFilter$dcStartDate$t" '
+            f'id="{HttpEngine.start_date_id}" value="">'
+            f'<input type="text" name="frmPrecipReportSearch$ucDateRangeFilter$dcEndDate$t" '
+            f'id="{HttpEngine.stop_date_id}" value="">'
+            f'<input type="submit" name="frmPrecipReportSearch$btnSearch" id="{HttpEngine.search_button_id}" '
+            f'value="Search">'
+            f'<select name="ucReportList$wcDropDownListPageSize" id="{HttpEngine.page_size_id}">'
+            f'<option value="25" selected>25</option><option value="100">100</option>'
+            f'<option value="500">500</option></select>'
+            f'<select name="ucReportList$wcDropDownListPager" id="{HttpEngine.pager_id}">{pages}</select>'
+            f'{grid}</form></body></html>')
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Answers like the Daily Precip Reports form, keeping every posted form for the assertions"""
+    posts: list[dict[str, str]] = list()
+
+    def do_GET(self):
+        self.reply(form('initial'))
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode()
+        fields = {name: values[0] for name, values in parse_qs(body, keep_blank_values=True).items()}
+        self.posts.append(fields)
+        page = fields.get('ucReportList$wcDropDownListPager') or '1'
+        grid = f'<table id="{HttpEngine.grid_id}"><tr><td>page {page}</td></tr></table>'
+
+        self.reply(form(f'after-{len(self.posts)}', grid, pager=True))
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, html: str):
+        body = html.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    StandIn.posts = list()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}/DailyPrecipReports.aspx'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_search_posts_the_dates_at_the_largest_page_size(server):
+    grid = HttpEngine(server).search(date(2024, 5, 1), date(2024, 5, 3))
+
+    search, = StandIn.posts
+    assert search['frmPrecipReportSearch$ucDateRangeFilter$dcStartDate$t'] == '05/01/2024'
+    assert search['frmPrecipReportSearch$ucDateRangeFilter$dcEndDate$t'] == '05/03/2024'
+    assert search['frmPrecipReportSearch$btnSearch'] == 'Search'
+    assert search['ucReportList$wcDropDownListPageSize'] == '500'
+    assert search['__VIEWSTATE'] == 'initial'
+    assert grid.startswith(f'<table id="{HttpEngine.grid_id}"') and 'page 1' in grid
+
+
+def test_iter_pages_pages_through_eventtarget_postbacks(server):
+    grids = list(HttpEngine(server).iter_pages(date(2024, 5, 1)))
+
+    assert [f'page {page}' in grid for page, grid in enumerate(grids, 1)] == [True] * PAGES
+    search, *paging = StandIn.posts
+    assert '__EVENTTARGET' not in search or not search['__EVENTTARGET']
+    for page, fields in enumerate(paging, 2):
+        assert fields['__EVENTTARGET'] == 'ucReportList$wcDropDownListPager'
+        assert fields['ucReportList$wcDropDownListPager'] == str(page)
+        # Each postback carries the form state returned by the previous one
+        assert fields['__VIEWSTATE'] == f'after-{page - 1}'
+
+
+def test_search_without_the_form_raises_lookup_error(server):
+    engine = HttpEngine(server)
+    engine.load()
+    engine.names.pop(HttpEngine.search_button_id)
+
+    with pytest.raises(LookupError):
+        engine.search(date(2024, 5, 1))
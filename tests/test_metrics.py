@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from selenium_pom import Metrics
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    metrics = Metrics().enable()
+    metrics.observe('parse', 0.003, parser='Lxml', output='batch')
+    metrics.observe('parse', 0.2, parser='Lxml', output='batch')
+    metrics.observe('parse', 60.0, failed=True, parser='Lxml', output='batch')
+    metrics.observe('wait', 0.05, condition='say "hi"')
+    return metrics
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics()
+    metrics.observe('parse', 0.1)
+    with metrics.timer('wait'):
+        pass
+
+    assert metrics.to_dict() == []
+
+
+def test_json_lists_each_series_with_its_buckets(metrics):
+    parse, wait = json.loads(metrics.to_json())
+
+    assert parse['name'] == 'parse'
+    assert parse['labels'] == {'output': 'batch', 'parser': 'Lxml'}
+    assert (parse['count'], parse['failures'], parse['sum']) == (3, 1, 60.203)
+    assert {bound: count for bound, count in parse['buckets'].items() if count} == {'0.005': 1, '0.25': 1, '+Inf': 1}
+    assert wait['labels'] == {'condition': 'say "hi"'} and wait['buckets']['0.05'] == 1
+
+
+def test_prometheus_renders_cumulative_buckets_and_failures(metrics):
+    lines = metrics.to_prometheus().splitlines()
+    labels = 'output="batch",parser="Lxml"'
+
+    assert lines[0] == '# TYPE scrape_parse_seconds histogram'
+    assert f'scrape_parse_seconds_bucket{{{labels},le="0.001"}} 0' in lines
+    assert f'scrape_parse_seconds_bucket{{{labels},le="0.005"}} 1' in lines
+    assert f'scrape_parse_seconds_bucket{{{labels},le="0.25"}} 2' in lines
+    assert f'scrape_parse_seconds_bucket{{{labels},le="30.0"}} 2' in lines
+    assert f'scrape_parse_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+    assert f'scrape_parse_seconds_sum{{{labels}}} 60.203' in lines
+    assert f'scrape_parse_seconds_count{{{labels}}} 3' in lines
+    assert '# TYPE scrape_parse_failures_total counter' in lines
+    assert f'scrape_parse_failures_total{{{labels}}} 1' in lines
+    assert 'scrape_wait_seconds_count{condition="say \\"hi\\""} 1' in lines
+
+
+def test_timer_counts_failures():
+    metrics = Metrics().enable()
+    with pytest.raises(ValueError):
+        with metrics.timer('sink', sink='CsvSink'):
+            raise ValueError
+
+    series, = metrics.to_dict()
+    assert (series['count'], series['failures']) == (1, 1)
@@ -0,0 +1,38 @@
+from dataclasses import replace
+from datetime import date
+
+from sites.cocorahs import ObservationStore
+from sites.cocorahs.data import PrecipitationBatch
+from sites.cocorahs.range_planner import DateRange
+
+
+def test_upsert_replaces_revised_observations(record):
+    with ObservationStore() as store:
+        assert store.upsert([record('CO-LR-1', 1), record('CO-LR-2', 1)]) == 2
+        assert store.upsert([PrecipitationBatch.from_records([record('CO-LR-1', 1, gauge=0.5)])]) == 1
+
+        assert len(store) == 2
+        assert list(store.query(station_num='CO-LR-1')) == [record('CO-LR-1', 1, gauge=0.5)]
+        assert list(store.query(date(2024, 5, 1), date(2024, 5, 1), state='CO')) == \
+               [record('CO-LR-1', 1, gauge=0.5), record('CO-LR-2', 1)]
+
+
+def test_query_keeps_missing_values_and_types(record):
+    original = replace(record('CO-LR-1', 2), is_trace=True, snowfall_depth=1.5)
+    with ObservationStore() as store:
+        store.upsert([original])
+        assert list(store.query()) == [original]
+
+
+def test_missing_follows_the_fetched_days_per_scope():
+    with ObservationStore() as store:
+        store.mark_fetched(date(2024, 5, 3), date(2024, 5, 4), {'county': 'Larimer'})
+        store.mark_fetched(date(2024, 5, 6), date(2024, 5, 6))
+
+        assert store.missing(date(2024, 5, 1), date(2024, 5, 7), {'county': 'Larimer'}) == \
+               [DateRange(date(2024, 5, 1), date(2024, 5, 2)), DateRange(date(2024, 5, 5), date(2024, 5, 5)),
+                DateRange(date(2024, 5, 7), date(2024, 5, 7))]
+        assert store.missing(date(2024, 5, 1), date(2024, 5, 7)) == \
+               [DateRange(date(2024, 5, 1), date(2024, 5, 5)), DateRange(date(2024, 5, 7), date(2024, 5, 7))]
+        assert store.has_day(date(2024, 5, 6), {'county': 'Boulder'})
+        assert not store.has_day(date(2024, 5, 3), {'county': 'Boulder'})
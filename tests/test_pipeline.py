@@ -0,0 +1,47 @@
+import pytest
+
+from sites.cocorahs import ParsePipeline
+from sites.cocorahs.data import Precipitation
+from sites.cocorahs.enum import GridParser
+
+from .grids import grid
+
+PAGES = [grid(*(f'Page {page} station {row}' for row in range(rows))) for page, rows in enumerate((3, 0, 5, 1))]
+
+
+def fetched(pages: list[str], error: Exception = None):
+    # Stands in for DailyPrecipReports.iter_range_pages
+    yield from pages
+    if error is not None:
+        raise error
+
+
+@pytest.fixture(scope='module')
+def pipeline():
+    with ParsePipeline(workers=2, queue_size=1) as pipeline:
+        yield pipeline
+
+
+def test_records_match_inline_parsing_in_page_order(pipeline):
+    expected = [record for html in PAGES for record in Precipitation(html, GridParser.Lxml)]
+    assert list(pipeline.records(fetched(PAGES))) == expected
+
+
+def test_batches_are_one_per_page(pipeline):
+    batches = list(pipeline.batches(fetched(PAGES)))
+    assert [len(batch) for batch in batches] == [3, 0, 5, 1]
+
+
+def test_fetch_errors_reach_the_consumer(pipeline):
+    records = pipeline.records(fetched(PAGES[:1], LookupError('search form missing')))
+    with pytest.raises(LookupError, match='search form missing'):
+        list(records)
+
+
+def test_closing_early_stops_the_fetcher(pipeline):
+    pages = fetched(PAGES * 10)
+    records = pipeline.records(pages)
+    next(records)
+    records.close()
+
+    assert pages.gi_frame is None
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from sites.cocorahs.data import Precipitation
+from sites.cocorahs.data import PrecipitationBatch
+from sites.cocorahs.enum import GridParser
+
+from .grids import grid
+
+
+def test_parsers_yield_the_same_records():
+    html = grid(*(f'Fort Collins {i}' for i in range(10)))
+    records = list(Precipitation(html, GridParser.BeautifulSoup))
+
+    assert len(records) == 10
+    assert list(Precipitation(html, GridParser.Lxml)) == records
+    assert list(Precipitation(html.encode(), GridParser.Lxml)) == records
+
+
+def test_parsers_derive_the_fields():
+    first, second = Precipitation(grid('Fort Collins 0', 'Fort Collins 1'), GridParser.Lxml)
+
+    assert first.is_trace and first.gauge_catch == 0.0
+    assert second.gauge_catch == 0.12 and not second.is_trace
+    assert second.snowfall_depth is None and second.snowfall_liquid == 0.1
+    assert first.snowfall_ratio == 10.0
+    assert second.observed == datetime(2026, 10, 17, 7)
+    assert (second.latitude, second.longitude) == (40.1, -105.1)
+    assert (second.station_num, second.state, second.county) == ('CO-LR-1', 'CO', 'Larimer')
+
+
+def test_batch_matches_the_records():
+    html = grid(*(f'Fort Collins {i}' for i in range(5)))
+    for parser in GridParser:
+        batch = Precipitation(html, parser).batch()
+        expected = PrecipitationBatch.from_records(Precipitation(html, parser))
+
+        assert list(batch.iter_rows()) == list(expected.iter_rows())
+
+
+def test_parsers_read_bytes_as_utf8():
+    names = ['Cañon City 0', 'Cañon City 1']
+    html = grid(*names)
+    for parser in GridParser:
+        for source in (html, html.encode()):
+            assert [record.station_name for record in Precipitation(source, parser)] == names
@@ -0,0 +1,109 @@
+import itertools
+from threading import Thread
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from selenium_driver import SessionPool
+
+
+class FakeDriver(object):
+    ids = itertools.count()
+
+    def __init__(self):
+        self.session_id = f'session-{next(self.ids)}'
+        self.broken = False
+        self.quit_count = 0
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_script(self, script: str):
+        if self.broken:
+            raise WebDriverException('session deleted')
+        return 'complete'
+
+    def get(self, url: str):
+        pass
+
+    def quit(self):
+        self.quit_count += 1
+
+
+def test_acquire_times_out_when_every_session_is_leased():
+    with SessionPool(FakeDriver, size=1) as pool:
+        pool.acquire()
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+
+def test_released_sessions_are_reused():
+    with SessionPool(FakeDriver, size=2) as pool:
+        first = pool.acquire()
+        pool.release(first)
+
+        assert pool.acquire() is first
+        assert len(pool.uses) == 1
+
+
+def test_a_waiting_acquire_gets_the_released_session():
+    with SessionPool(FakeDriver, size=1) as pool:
+        first = pool.acquire()
+        leased = list()
+        waiter = Thread(target=lambda: leased.append(pool.acquire(timeout=5)))
+        waiter.start()
+        pool.release(first)
+        waiter.join()
+
+        assert leased == [first]
+
+
+def test_sessions_are_recycled_after_max_uses():
+    with SessionPool(FakeDriver, size=1, max_uses=2) as pool:
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        pool.release(first)
+
+        assert first.quit_count == 1
+        assert pool.acquire() is not first
+
+
+def test_unhealthy_sessions_are_replaced():
+    with SessionPool(FakeDriver, size=1) as pool:
+        first = pool.acquire()
+        pool.release(first)
+        first.broken = True
+
+        assert pool.acquire() is not first
+        assert first.quit_count == 1
+
+
+def test_close_quits_idle_sessions_and_those_released_later():
+    pool = SessionPool(FakeDriver, size=2).warm(1)
+    idle, = pool.idle
+    leased = pool.acquire()
+    assert leased is idle
+    spare = pool.acquire()
+    pool.release(spare)
+
+    pool.close()
+    assert spare.quit_count == 1 and leased.quit_count == 0
+    assert not pool.uses
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+    pool.release(leased)
+    assert leased.quit_count == 1
+    assert not pool.idle
+
+
+def test_double_release_is_rejected():
+    with SessionPool(FakeDriver, size=2) as pool:
+        driver = pool.acquire()
+        pool.release(driver)
+        with pytest.raises(ValueError):
+            pool.release(driver)
+
+        assert pool.acquire() is driver
+        assert pool.acquire() is not driver
@@ -0,0 +1,97 @@
+import csv
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from sites.cocorahs import PrecipitationRecord
+from sites.cocorahs.data import PrecipitationBatch
+from sites.cocorahs.sinks import CsvSink
+from sites.cocorahs.sinks import SqliteSink
+
+RECORDS = [PrecipitationRecord('Larimer', None if day == 3 else day / 10, day == 5, datetime(2024, 5, day, 7, 30),
+                               40.5, -105.1, 1.5 if day % 2 else None, None, None, None, None, None, 'CO',
+                               'Fort Collins', f'CO-LR-{day}') for day in range(1, 11)]
+
+
+class Batches(object):
+    """Records the size of every batch the sink writes"""
+
+    def __init__(self, sink):
+        self.sizes = list()
+        write_batch = sink.write_batch
+
+        def record(batch: PrecipitationBatch):
+            self.sizes.append(len(batch))
+            write_batch(batch)
+
+        sink.write_batch = record
+
+
+def read_csv(path) -> list[list[str]]:
+    with path.open(newline='', encoding='utf-8') as file:
+        return list(csv.reader(file))
+
+
+@pytest.mark.parametrize('whole', [False, True], ids=['records', 'batch'])
+def test_csv_round_trip_in_batch_size_slices(tmp_path, whole):
+    path = tmp_path / 'precipitation.csv'
+    with CsvSink(path, batch_size=4) as sink:
+        batches = Batches(sink)
+        sink.consume([PrecipitationBatch.from_records(RECORDS)] if whole else RECORDS)
+
+    assert batches.sizes == [4, 4, 2]
+    assert sink.rows == 10
+    rows = [['' if value is None else str(value) for value in row]
+            for row in PrecipitationBatch.from_records(RECORDS).iter_rows()]
+    assert read_csv(path) == [list(PrecipitationBatch.row_columns), *rows]
+    assert rows[2][2] == '' and rows[4][1] == 'True' and rows[0][0] == '2024-05-01 07:30:00'
+
+
+def test_csv_append_writes_the_header_once(tmp_path):
+    path = tmp_path / 'precipitation.csv'
+    with CsvSink(path, batch_size=4, append=True) as sink:
+        sink.consume(RECORDS[:5])
+    with CsvSink(path, batch_size=4, append=True) as sink:
+        sink.consume(RECORDS[5:])
+
+    rows = read_csv(path)
+    assert rows[0] == list(PrecipitationBatch.row_columns)
+    assert [row[-1] for row in rows[1:]] == [record.station_num for record in RECORDS]
+
+
+@pytest.mark.parametrize('whole', [False, True], ids=['records', 'batch'])
+def test_sqlite_round_trip_in_batch_size_slices(tmp_path, whole):
+    path = tmp_path / 'precipitation.db'
+    with SqliteSink(path, table='reports', batch_size=4) as sink:
+        batches = Batches(sink)
+        sink.consume([PrecipitationBatch.from_records(RECORDS)] if whole else RECORDS)
+
+    assert batches.sizes == [4, 4, 2]
+    assert sink.rows == 10
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute('SELECT * FROM reports ORDER BY rowid').fetchall()
+    connection.close()
+    expected = list(PrecipitationBatch.from_records(RECORDS).iter_rows(PrecipitationBatch.sqlite_observed_format))
+    assert rows == expected
+    assert rows[0][:3] == ('2024-05-01 07:30:00', 0, 0.1) and rows[2][2] is None and rows[4][1] == 1
+
+
+def test_sqlite_appends_across_sinks(tmp_path):
+    path = tmp_path / 'precipitation.db'
+    for records in (RECORDS[:3], RECORDS[3:]):
+        with SqliteSink(path, batch_size=4) as sink:
+            sink.consume(records)
+
+    with sqlite3.connect(path) as connection:
+        stations = [row[0] for row in connection.execute('SELECT station_num FROM precipitation ORDER BY rowid')]
+    connection.close()
+    assert stations == [record.station_num for record in RECORDS]
+
+
+def test_empty_sink_writes_nothing(tmp_path):
+    with CsvSink(tmp_path / 'precipitation.csv', batch_size=4) as sink:
+        sink.consume([])
+
+    assert sink.rows == 0
+    assert not (tmp_path / 'precipitation.csv').exists()
@@ -0,0 +1,85 @@
+import random
+from math import asin
+from math import cos
+from math import radians
+from math import sin
+from math import sqrt
+
+import pytest
+
+from sites.cocorahs import SpatialIndex
+from sites.cocorahs.data.spatial_index import EARTH_RADIUS_KM
+
+POINTS = [(index, random.Random(index).uniform(-90, 90), random.Random(-index).uniform(-180, 180))
+          for index in range(2000)]
+
+
+def haversine(latitude: float, longitude: float, other_latitude: float, other_longitude: float) -> float:
+    phi, other_phi = radians(latitude), radians(other_latitude)
+    a = sin((other_phi - phi) / 2) ** 2 + cos(phi) * cos(other_phi) * sin(radians(other_longitude - longitude) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+@pytest.fixture(scope='module')
+def index() -> SpatialIndex:
+    return SpatialIndex(POINTS + [('unknown', None, None), ('nan', float('nan'), 10.0)])
+
+
+def test_points_without_a_location_are_left_out(index):
+    assert len(index) == len(POINTS)
+
+
+@pytest.mark.parametrize('latitude, longitude, km', [(40.5, -105.1, 500), (0, 179.5, 1500), (89, 0, 2000),
+                                                     (-45, -120, 0), (10, 10, 30000)])
+def test_radius_matches_brute_force(index, latitude, longitude, km):
+    expected = {point_id for point_id, lat, lon in POINTS if haversine(latitude, longitude, lat, lon) <= km}
+    assert set(index.radius(latitude, longitude, km)) == expected
+
+
+@pytest.mark.parametrize('latitude, longitude', [(40.5, -105.1), (0, -179.9), (-89.5, 45)])
+def test_nearest_matches_brute_force(index, latitude, longitude):
+    expected = sorted(POINTS, key=lambda point: haversine(latitude, longitude, point[1], point[2]))
+    assert index.nearest(latitude, longitude, k=5) == [point_id for point_id, _, _ in expected[:5]]
+    assert index.nearest(latitude, longitude, k=0) == []
+
+
+@pytest.mark.parametrize('south, west, north, east', [(30, -110, 45, -95), (-20, 170, 20, -170), (-90, -180, 90, 180),
+                                                      (60, -180, 90, 0), (-10, 100, 10, 100)])
+def test_bbox_matches_brute_force(index, south, west, north, east):
+    def inside(latitude: float, longitude: float) -> bool:
+        in_longitude = west <= longitude <= east if west <= east else longitude >= west or longitude <= east
+        return south <= latitude <= north and in_longitude
+
+    expected = {point_id for point_id, lat, lon in POINTS if inside(lat, lon)}
+    assert set(index.bbox(south, west, north, east)) == expected
+
+
+def test_triangle_matches_the_edge_sides(index):
+    triangle = [(10, -30), (60, 20), (-20, 40)]
+
+    def cross(a: tuple[float, float], b: tuple[float, float], latitude: float, longitude: float) -> float:
+        return (b[0] - a[0]) * (longitude - a[1]) - (b[1] - a[1]) * (latitude - a[0])
+
+    # Inside a triangle when the point is on the same side of all three edges
+    expected = {point_id for point_id, lat, lon in POINTS
+                if len({cross(a, b, lat, lon) > 0 for a, b in zip(triangle, triangle[1:] + triangle[:1])}) == 1}
+
+    assert expected
+    assert set(index.polygon(triangle)) == expected
+
+
+def test_concave_polygon_matches_its_rectangles(index):
+    # An L with its corner at the origin, the union of two rectangles
+    shape = [(0, 0), (0, 40), (20, 40), (20, 20), (50, 20), (50, 0)]
+    expected = {point_id for point_id, lat, lon in POINTS
+                if (0 < lat < 20 and 0 < lon < 40) or (0 < lat < 50 and 0 < lon < 20)}
+
+    assert expected
+    assert set(index.polygon(shape)) == expected
+
+
+def test_polygon_with_hand_placed_points():
+    points = [('inside', 10, 10), ('notch', 30, 30), ('leg', 40, 5), ('outside', -5, 10), ('east', 10, 45)]
+    shape = [(0, 0), (0, 40), (20, 40), (20, 20), (50, 20), (50, 0)]
+
+    assert sorted(SpatialIndex(points).polygon(shape)) == ['inside', 'leg']
@@ -0,0 +1,42 @@
+from selenium_pom import PageWait
+from selenium_pom import WaitProfiler
+from selenium_pom import WaitStats
+from selenium_pom import wait_profiler
+
+
+def test_report_and_suggestions_for_known_waits():
+    profiler = WaitProfiler().enable()
+    for index in range(40):
+        profiler.record('presence_of_element_located', 'pages.py:10 search', 30, 0.1 + index / 100, 2,
+                        timed_out=False)
+    profiler.record('title_is', 'pages.py:20 open', 5, 5.0, 10, timed_out=True)
+
+    fast, slow = profiler.report().splitlines()
+    assert fast == ('pages.py:10 search presence_of_element_located: 40 waits, p50 0.295s, p95 0.470s, max 0.490s, '
+                    '2.0 polls/wait, 0 timeouts, timeout 30s -> suggest 1s')
+    assert slow == ('pages.py:20 open title_is: 1 waits, p50 0.000s, p95 0.000s, max 0.000s, '
+                    '10.0 polls/wait, 1 timeouts, timeout 5s')
+    assert profiler.suggestions() == {('presence_of_element_located', 'pages.py:10 search'): 1.0}
+
+
+def test_stats_stay_bounded():
+    stats = WaitStats('until', '', 10)
+    for index in range(10_000):
+        stats.add(index / 10_000)
+
+    assert len(stats.samples) == WaitStats.reservoir_size
+    assert (stats.count, stats.fastest, stats.slowest) == (10_000, 0.0, 0.9999)
+    assert abs(stats.percentile(50) - 0.5) < 0.1
+
+
+def test_call_site_is_the_caller_outside_selenium_pom():
+    wait = PageWait(None, 0.1)
+    wait_profiler.enable()
+    try:
+        site = wait.named('until').call_site
+    finally:
+        wait_profiler.disable()
+
+    assert site.endswith('test_call_site_is_the_caller_outside_selenium_pom')
+    assert 'test_wait_profiler.py' in site
+    assert wait.named('until').call_site == ''